@@ -0,0 +1,66 @@
+import argparse
+import time
+from typing import *
+
+from mousse import Config, ConfigView
+
+
+def make_data(depth: int, width: int) -> Dict[str, Any]:
+    if depth == 0:
+        return {f"leaf{idx}": idx for idx in range(width)}
+
+    return {f"node{idx}": make_data(depth - 1, width) for idx in range(width)}
+
+
+def timeit(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main():
+    args = argparse.ArgumentParser()
+    args.add_argument("--depth", type=int, default=2)
+    args.add_argument("--width", type=int, default=8)
+    args.add_argument("--reads", type=int, default=100000)
+    args.add_argument("--repeat", type=int, default=3)
+    args = args.parse_args()
+
+    config = Config(**make_data(args.depth, args.width))
+    view = ConfigView(config)
+
+    keys = ["node0"] * args.depth + ["leaf0"]
+    path = ".".join(keys)
+    reads = range(args.reads)
+
+    def read_config():
+        for _ in reads:
+            node = config
+            for key in keys:
+                node = getattr(node, key)
+
+    def read_attrs():
+        for _ in reads:
+            node = view
+            for key in keys:
+                node = getattr(node, key)
+
+    def read_path():
+        for _ in reads:
+            view[path]
+
+    build = timeit(lambda: ConfigView(config), args.repeat)
+
+    print(f"{'path':<12}{'seconds':>10}")
+    print(f"{'config':<12}{timeit(read_config, args.repeat):>10.4f}")
+    print(f"{'view.attr':<12}{timeit(read_attrs, args.repeat):>10.4f}")
+    print(f"{'view[path]':<12}{timeit(read_path, args.repeat):>10.4f}")
+    print(f"{'build':<12}{build:>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
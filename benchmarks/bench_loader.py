@@ -0,0 +1,70 @@
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import *
+
+import yaml
+
+from mousse.types.backend import backends, dump, load, set_backend
+
+
+def make_data(size: int) -> Dict[str, Any]:
+    return {
+        f"service_{idx}": {
+            "host": f"10.0.{idx // 256}.{idx % 256}",
+            "port": 8000 + idx,
+            "weight": idx / size,
+            "enabled": idx % 2 == 0,
+            "tags": ["alpha", "beta", f"group-{idx % 7}"],
+            "limits": {"cpu": 0.5, "memory": "512Mi", "replicas": idx % 5 + 1},
+        }
+        for idx in range(size)
+    }
+
+
+def timeit(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main():
+    args = argparse.ArgumentParser()
+    args.add_argument("--size", type=int, default=5000)
+    args.add_argument("--repeat", type=int, default=3)
+    args = args.parse_args()
+
+    data = make_data(args.size)
+    with tempfile.TemporaryDirectory() as folder:
+        folder = Path(folder)
+        yaml_path = folder / "config.yaml"
+        json_path = folder / "config.json"
+        dump(data, yaml_path)
+        dump(data, json_path)
+
+        def load_pure_yaml():
+            with open(yaml_path, encoding="utf-8") as fin:
+                return yaml.load(fin, Loader=yaml.Loader)
+
+        print(f"{'format':<8}{'backend':<16}{'seconds':>10}")
+        print(
+            f"{'yaml':<8}{'yaml.Loader':<16}{timeit(load_pure_yaml, args.repeat):>10.4f}"
+        )
+
+        for format, path in (("yaml", yaml_path), ("json", json_path)):
+            for name in backends[format]:
+                set_backend(format, name)
+                assert load(path) == data
+                elapsed = timeit(lambda: load(path), args.repeat)
+                print(f"{format:<8}{name:<16}{elapsed:>10.4f}")
+
+            set_backend(format, next(iter(backends[format])))
+
+
+if __name__ == "__main__":
+    main()
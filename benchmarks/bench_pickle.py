@@ -0,0 +1,96 @@
+import argparse
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import *
+
+from mousse import Dataclass, Field
+
+
+class Item(Dataclass):
+    name: str = ""
+    price: float = 0.0
+    tags: List[str] = []
+
+
+class Order(Dataclass):
+    id: int = 0
+    customer: str = Field("", alias="customerName")
+    items: List[Item] = []
+    note: Optional[str] = None
+
+
+def make_orders(size: int) -> List[Order]:
+    return [
+        Order(
+            id=idx,
+            customer=f"customer-{idx}",
+            items=[
+                Item(name=f"item-{idx}-{k}", price=k * 1.5, tags=["a"])
+                for k in range(3)
+            ],
+        )
+        for idx in range(size)
+    ]
+
+
+def legacy_dumps(objs: List[Dataclass]) -> bytes:
+    return pickle.dumps([(type(obj), obj.__getstate__()) for obj in objs])
+
+
+def legacy_loads(data: bytes) -> List[Dataclass]:
+    objs = []
+    for cls, state in pickle.loads(data):
+        obj = cls.__new__(cls)
+        obj.__setstate__(state)
+        objs.append(obj)
+
+    return objs
+
+
+def identity(objs: List[Order]) -> List[Order]:
+    return objs
+
+
+def timeit(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main():
+    args = argparse.ArgumentParser()
+    args.add_argument("--size", type=int, default=10000)
+    args.add_argument("--repeat", type=int, default=3)
+    args.add_argument("--workers", type=int, default=2)
+    args = args.parse_args()
+
+    orders = make_orders(args.size)
+    legacy = legacy_dumps(orders)
+    current = pickle.dumps(orders)
+
+    print(f"{'path':<10}{'bytes':>12}{'dumps':>10}{'loads':>10}")
+    print(
+        f"{'legacy':<10}{len(legacy):>12}"
+        f"{timeit(lambda: legacy_dumps(orders), args.repeat):>10.4f}"
+        f"{timeit(lambda: legacy_loads(legacy), args.repeat):>10.4f}"
+    )
+    print(
+        f"{'reduce':<10}{len(current):>12}"
+        f"{timeit(lambda: pickle.dumps(orders), args.repeat):>10.4f}"
+        f"{timeit(lambda: pickle.loads(current), args.repeat):>10.4f}"
+    )
+
+    chunks = [orders[idx : idx + 1000] for idx in range(0, len(orders), 1000)]
+    with ProcessPoolExecutor(args.workers) as executor:
+        list(executor.map(identity, chunks[:1]))
+        elapsed = timeit(lambda: list(executor.map(identity, chunks)), args.repeat)
+    print(f"process pool round trip: {elapsed:.4f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import argparse
+import random
+import time
+from typing import *
+
+from mousse import Dataclass, asclass
+from mousse.types.parser import compile_union, compiler, get_class_plan
+
+
+class Circle(Dataclass):
+    kind: Literal["circle"] = "circle"
+    radius: float = 0.0
+
+
+class Rect(Dataclass):
+    kind: Literal["rect"] = "rect"
+    width: float = 0.0
+    height: float = 0.0
+
+
+class Polygon(Dataclass):
+    kind: Literal["polygon"] = "polygon"
+    points: List[Tuple[float, float]] = []
+
+
+class Group(Dataclass):
+    kind: Literal["group"] = "group"
+    name: str = ""
+    children: List[Union[Circle, Rect, Polygon]] = []
+
+
+class Layer(Dataclass):
+    kind: Literal["layer"] = "layer"
+    name: str = ""
+    children: List[Union[Circle, Rect, Polygon, Group]] = []
+
+
+class Scene(Dataclass):
+    shapes: List[Union[Circle, Rect, Polygon, Group, Layer]] = []
+
+
+def legacy_union(G: Any, **kwargs):
+    from mousse import parse
+
+    args = get_args(G)
+
+    def parse_union(obj: Any):
+        for arg in args:
+            try:
+                return parse(arg, obj, **kwargs)
+            except Exception:
+                continue
+
+        assert False, f"Unable to parse from {type(obj)} to {G}"
+
+    return parse_union
+
+
+def use_union(func: Callable):
+    compiler(Union, func=func)
+    get_class_plan.cache_clear()
+
+
+def make_shape(rng: random.Random, depth: int, fanout: int) -> Dict[str, Any]:
+    if depth == 0:
+        kind = rng.choice(["circle", "rect", "polygon"])
+        if kind == "circle":
+            return {"kind": kind, "radius": rng.random()}
+        if kind == "rect":
+            return {"kind": kind, "width": rng.random(), "height": rng.random()}
+        return {"kind": kind, "points": [[rng.random(), rng.random()]] * 4}
+
+    return {
+        "kind": "group" if depth == 1 else "layer",
+        "name": f"level-{depth}",
+        "children": [make_shape(rng, depth - 1, fanout) for _ in range(fanout)],
+    }
+
+
+def move_tag(shape: Dict[str, Any]) -> Dict[str, Any]:
+    data = {key: val for key, val in shape.items() if key != "kind"}
+    if "children" in data:
+        data["children"] = [move_tag(child) for child in data["children"]]
+
+    data["kind"] = shape["kind"]
+    return data
+
+
+def timeit(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main():
+    args = argparse.ArgumentParser()
+    args.add_argument("--size", type=int, default=200)
+    args.add_argument("--fanout", type=int, default=6)
+    args.add_argument("--repeat", type=int, default=3)
+    args.add_argument("--tag-last", action="store_true")
+    args = args.parse_args()
+
+    rng = random.Random(0)
+    shapes = [make_shape(rng, idx % 3, args.fanout) for idx in range(args.size)]
+    if args.tag_last:
+        shapes = [move_tag(shape) for shape in shapes]
+    payload = {"shapes": shapes}
+
+    use_union(legacy_union)
+    legacy = timeit(lambda: asclass(Scene, payload), args.repeat)
+
+    use_union(compile_union)
+    tagged = timeit(lambda: asclass(Scene, payload), args.repeat)
+
+    print(f"{'path':<10}{'seconds':>10}")
+    print(f"{'ordered':<10}{legacy:>10.4f}")
+    print(f"{'tagged':<10}{tagged:>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
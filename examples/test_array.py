@@ -0,0 +1,33 @@
+import numpy as np
+
+from typing import *
+from mousse import Array, Dataclass, Field, asclass, in_range, parse, validate
+
+
+class Sample(Dataclass):
+    features: Array[float, (None, 3)] = Field(...)
+    labels: List[int] = []
+
+
+Sample.features.validator(in_range(-1.0, 1.0))
+
+features = np.zeros((4, 3))
+sample = asclass(Sample, {"features": features, "labels": np.arange(4)})
+assert sample.features is features  # conforming arrays are not copied
+assert sample.labels == [0, 1, 2, 3]
+
+sample = asclass(Sample, {"features": [[0.5, 0.5, 0.5]]})
+assert sample.features.shape == (1, 3) and sample.features.dtype == np.float64
+
+assert validate(Array[int, 1], np.arange(3))
+assert not validate(Array[int, 1], np.zeros((2, 2), dtype=int))
+assert not validate(Array[float, (None, 3)], np.zeros((2, 4)))
+
+try:
+    Sample(features=np.full((2, 3), 2.0))
+    assert False
+except AssertionError as e:
+    print(e)
+    # Validation failed for [features]: in_range
+
+assert parse(List[float], np.array([1, 2])) == [1.0, 2.0]
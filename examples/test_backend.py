@@ -0,0 +1,37 @@
+import json
+
+from typing import *
+from mousse import Dataclass, asclass, register_backend, set_backend
+from mousse.types.backend import get_backend
+
+
+class Bar(Dataclass):
+    index: int
+
+
+calls = []
+
+
+def load(stream):
+    calls.append("load")
+    return json.load(stream)
+
+
+register_backend("json", "tracing", load, json.dump)
+assert get_backend("json").load is not load  # registering does not select
+
+set_backend("json", "tracing")
+try:
+    bar = asclass(Bar, path="examples/bar.json")
+    assert calls == ["load"]
+finally:
+    set_backend("json", "json")
+
+assert get_backend(".yaml") is get_backend("yaml")
+
+try:
+    set_backend("json", "missing")
+    assert False
+except AssertionError as e:
+    print(e)
+    # Unknown json backend: missing
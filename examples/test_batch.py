@@ -0,0 +1,38 @@
+import gc
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import *
+from mousse import Dataclass, asclass_many, asdict_many, BatchError
+from mousse.types.accessor import get_accessors_info
+
+
+class Item(Dataclass):
+    name: str
+    price: int = 0
+
+
+records = [{"name": f"item-{i}", "price": i} for i in range(1000)]
+
+items = list(asclass_many(Item, records))
+assert (items[42].name, items[42].price) == ("item-42", 42)
+assert list(asdict_many(items)) == records
+
+with ThreadPoolExecutor(2) as executor:
+    items = list(asclass_many(Item, records, chunksize=100, executor=executor))
+    assert list(asdict_many(items, chunksize=100, executor=executor)) == records
+
+    invalid = [{"name": "egg", "price": "free"}] * 3
+    try:
+        list(asclass_many(Item, invalid, executor=executor))
+        assert False
+    except BatchError as e:
+        print(e)
+        # 3 invalid item(s), first at [0]: ValueError: invalid literal for int() ...
+
+# per-instance values are released when an instance dies
+item = Item(name="egg")
+accessor = get_accessors_info(Item)["name"]
+key = id(item)
+del item
+gc.collect()
+assert key not in accessor.storage
@@ -0,0 +1,48 @@
+import io
+
+from typing import *
+from mousse import Dataclass, decode_binary, encode_binary
+from mousse import dump_binary, load_binary
+
+
+class Item(Dataclass):
+    name: str
+    price: int = 0
+
+
+class Order(Dataclass):
+    note: Optional[str]
+    items: List[Item] = []
+    total: int = 3
+
+
+order = Order(note="rush", items=[Item(name="egg", price=2)], total=2)
+data = encode_binary(order)
+print(len(data), data)
+copy = decode_binary(Order, data)
+assert copy.note == "rush" and copy.items[0].name == "egg" and copy.total == 2
+
+# None survives a round trip, even for required fields
+copy = decode_binary(Order, encode_binary(Order(note=None)))
+assert copy.note is None and copy.total == 3
+
+
+class Label(Dataclass):
+    text: str = ""
+
+
+@Label.text.getter
+def upper(val: str) -> str:
+    return val + "!"
+
+
+# raw values are encoded, so getters run once per read, not per round trip
+label = decode_binary(Label, encode_binary(Label(text="egg")))
+assert label.text == "egg!"
+assert decode_binary(Label, encode_binary(label)).text == "egg!"
+
+stream = io.BytesIO()
+dump_binary([order, Order(note=None)], stream)
+stream.seek(0)
+notes = [order.note for order in load_binary(Order, stream)]
+assert notes == ["rush", None]
@@ -0,0 +1,29 @@
+from typing import *
+from mousse import Dataclass, ValidationCache, validate
+
+
+class Country(Dataclass, frozen=True):
+    code: str = ""
+
+
+codes = tuple(f"c{i}" for i in range(1000))
+
+cache = ValidationCache(maxsize=16)
+assert validate(Tuple[str, ...], codes, cache=cache)
+assert validate(Tuple[str, ...], codes, cache=cache)
+info = cache.cache_info()
+print(info)
+assert (info.hits, info.misses) == (1, 1)
+
+# results depend on the annotation as well as the payload
+assert not validate(Tuple[int, ...], codes, cache=cache)
+
+vn = Country(code="vn")
+assert validate(Country, vn, cache=cache)
+assert cache.cache_info().currsize == 3
+del vn
+assert cache.cache_info().currsize == 2  # dropped with the instance
+
+# mutable payloads are never cached
+assert validate(List[str], list(codes), cache=cache)
+assert cache.cache_info().currsize == 2
@@ -0,0 +1,41 @@
+from typing import *
+from mousse import Dataclass, DataclassArray
+
+
+class Point(Dataclass):
+    x: float
+    y: float
+
+
+class Foo(Dataclass):
+    name: str
+    number: int = 0
+    point: Point = Point(x=0.0, y=0.0)
+
+
+foos = DataclassArray(Foo, [Foo(name=f"foo-{i}", number=i) for i in range(10)])
+foos.append({"name": "bar", "number": 42, "point": {"x": 1.0, "y": 2.0}})
+assert len(foos) == 11
+assert foos[-1].point.y == 2.0
+
+numbers = foos["number"]
+print(numbers)
+# [ 0  1  2  3  4  5  6  7  8  9 42]
+
+cheap = foos.filter(numbers < 5).sort("number", reverse=True)
+assert [foo.name for foo in cheap] == ["foo-4", "foo-3", "foo-2", "foo-1", "foo-0"]
+
+# exports stay valid after appends and rolled back appends
+foos.append(Foo(name="baz", number=7))
+try:
+    foos.append({"name": "bad", "number": "many"})
+    assert False
+except ValueError:
+    pass
+
+assert list(numbers) == [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 42]
+assert len(foos) == 12 and list(foos["number"])[-1] == 7
+
+columns = foos.export(copy=True)
+assert list(columns["name"])[:2] == ["foo-0", "foo-1"]
+assert list(columns["point.x"])[-2] == 1.0
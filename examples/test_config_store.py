@@ -0,0 +1,50 @@
+import threading
+
+from typing import *
+from mousse import ConfigStore
+
+store = ConfigStore({"db": {"host": "localhost", "port": 5432}, "cache": {"size": 64}})
+first = store.snapshot()
+cache = store.config.cache
+
+second = store.publish(
+    {"db": {"host": "localhost", "port": 6543}, "cache": {"size": 64}}
+)
+print(first.version, second.version)
+# 0 1
+
+# old snapshots stay consistent, unchanged subtrees are shared
+assert first.config.db.port == 5432 and store.config.db.port == 6543
+assert store.config.cache is cache
+
+# publishing the same data does not create a new version
+assert (
+    store.publish({"db": {"host": "localhost", "port": 6543}, "cache": {"size": 64}})
+    is second
+)
+
+# readers never see a half applied reload
+store = ConfigStore({"a": 0, "b": 0})
+stop = threading.Event()
+torn = []
+
+
+def read():
+    while not stop.is_set():
+        snapshot = store.snapshot()
+        if snapshot.config.a != snapshot.config.b:
+            torn.append(snapshot.version)
+
+
+readers = [threading.Thread(target=read) for _ in range(2)]
+for reader in readers:
+    reader.start()
+
+for i in range(1, 500):
+    store.publish({"a": i, "b": i})
+
+stop.set()
+for reader in readers:
+    reader.join()
+
+assert not torn and store.version == 499
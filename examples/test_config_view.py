@@ -0,0 +1,23 @@
+from typing import *
+from mousse import ConfigStore, ConfigView, ReadOnlyFieldException, load_config
+
+config = load_config("foo", path="examples/config.yaml")
+view = ConfigView(config)
+print(view["foo.items.0.price"])
+# 12
+assert view.foo["items.0.price"] == view.foo.items[0].price
+
+assert "foo.name" in view and "foo.missing" not in view
+assert view.get("foo.missing", 1) == 1
+
+try:
+    view.foo = None
+    assert False
+except ReadOnlyFieldException:
+    pass
+
+store = ConfigStore({"a": {"b": 1}})
+before = store.view
+store.publish({"a": {"b": 2}})
+assert before["a.b"] == 1 and store.view["a.b"] == 2
+assert store.snapshot().view.a.b == 2
@@ -0,0 +1,35 @@
+import json
+
+from typing import *
+from mousse import Dataclass, diff, patch
+
+
+class Pos(Dataclass, frozen=True):
+    x: int = 0
+    y: int = 0
+
+
+class State(Dataclass):
+    pos: Pos = Pos()
+    path: List[Pos] = []
+    tags: Set[str] = set()
+    scores: Dict[str, int] = {}
+
+
+old = State(path=[Pos(x=1)], tags={"a"}, scores={"alice": 1})
+new = State(
+    pos=Pos(y=5),
+    path=[Pos(x=1), Pos(x=2)],
+    tags={"a", "b"},
+    scores={"alice": 2},
+)
+
+delta = diff(old, new)
+print(json.dumps(delta))
+# {"pos": {"~": {"y": {"=": 5}}}, "path": ..., "tags": {"=": [...]}, ...}
+
+restored = patch(old, json.loads(json.dumps(delta)))
+assert restored.pos == new.pos and restored.path == new.path
+assert restored.tags == {"a", "b"} and isinstance(restored.tags, set)
+assert restored.scores == {"alice": 2}
+assert diff(new, restored) == {}
@@ -0,0 +1,35 @@
+import io
+import json
+
+from typing import *
+from mousse import Dataclass, Field, asdict, dump_stream, load_stream
+
+
+class Item(Dataclass):
+    name: str
+    price: int = Field(0, alias="cost")
+    tags: List[str] = []
+
+
+items = [Item(name=f"item-{i}", price=i, tags=["new"]) for i in range(3)]
+
+lines = io.StringIO()
+dump_stream(items, lines, format="jsonl")
+print(lines.getvalue())
+# {"name": "item-0", "cost": 0, "tags": ["new"]}
+# ...
+lines.seek(0)
+assert list(load_stream(lines, format="jsonl")) == [asdict(item) for item in items]
+
+document = io.StringIO()
+dump_stream(items, document, format="json", buffer_size=16)
+assert json.loads(document.getvalue()) == [asdict(item) for item in items]
+
+documents = io.StringIO()
+dump_stream(items, documents, format="yaml")
+documents.seek(0)
+assert [doc["cost"] for doc in load_stream(documents, format="yaml")] == [0, 1, 2]
+
+single = io.StringIO()
+dump_stream(items[0], single, format="json", by_alias=False)
+assert json.loads(single.getvalue())["price"] == 0
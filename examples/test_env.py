@@ -0,0 +1,43 @@
+import os
+
+from typing import *
+from mousse import Dataclass, asclass
+
+
+class Database(Dataclass):
+    host: str = "localhost"
+    port: int = 5432
+
+
+class Settings(Dataclass):
+    workers: int = 1
+    debug: bool = False
+    db: Database = Database()
+
+
+os.environ["APP_workers"] = "4"
+os.environ["APP__db__port"] = "6543"
+
+settings = asclass(Settings, env="APP")
+assert settings.workers == 4 and settings.db.port == 6543
+print(settings.db.host, settings.db.port)
+# localhost 6543
+
+# explicit values win over the environment
+assert asclass(Settings, {"workers": 2}, env="APP").workers == 2
+
+# replacing an unrelated variable keeps the size of the environment
+os.environ["OTHER"] = "1"
+asclass(Settings, env="APP")
+del os.environ["OTHER"]
+os.environ["APP_debug"] = "true"
+
+settings = asclass(Settings, env="APP")
+assert settings.workers == 4 and settings.debug is True
+
+del os.environ["APP_workers"]
+assert asclass(Settings, env="APP").workers == 1
+
+del os.environ["APP_debug"]
+del os.environ["APP__db__port"]
+assert asclass(Settings, env="APP").db.port == 5432
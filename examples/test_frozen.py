@@ -0,0 +1,35 @@
+from typing import *
+from mousse import Dataclass, Field, ReadOnlyFieldException, replace
+
+
+class Country(Dataclass, frozen=True, intern=True):
+    code: str = ""
+    name: str = ""
+
+
+class City(Dataclass):
+    name: str = ""
+    country: Country = Country()
+    code: str = Field("", freeze=True)
+
+
+vn = Country(code="vn", name="Vietnam")
+assert vn is Country(code="vn", name="Vietnam")
+assert {vn: "Hanoi"}[Country(code="vn", name="Vietnam")] == "Hanoi"
+
+try:
+    vn.name = "Viet Nam"
+    assert False
+except ReadOnlyFieldException as e:
+    print("read-only", e)
+
+# replace() goes through the intern table as well
+assert replace(vn, name="Viet Nam") is Country(code="vn", name="Viet Nam")
+
+city = City(name="Hanoi", country=vn, code="HAN")
+city.name = "Ha Noi"
+try:
+    city.code = "HN"
+    assert False
+except ReadOnlyFieldException:
+    pass
@@ -0,0 +1,38 @@
+from typing import *
+from mousse import Dataclass, asclass, validate_all
+
+
+class Section(Dataclass):
+    title: str = ""
+    words: int = 0
+
+
+class Document(Dataclass):
+    title: str = ""
+    sections: List[Section] = []
+
+
+@Section.words.validator
+def positive(words: int) -> bool:
+    return words >= 0
+
+
+payload = {
+    "title": "Guide",
+    "sections": [{"title": "Intro", "words": "120"}, {"title": "End", "words": -1}],
+}
+
+doc = asclass(Document, payload, lazy=True)
+assert doc.title == "Guide"  # only this field is parsed
+
+try:
+    validate_all(doc)
+    assert False
+except AssertionError as e:
+    print(e)
+    # Validation failed for [words]: positive
+
+payload["sections"].pop()
+doc = asclass(Document, payload, lazy=True)
+assert validate_all(doc)
+assert doc.sections[0].words == 120
@@ -0,0 +1,33 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import *
+from mousse import BatchError, Strategy, ValidationResult, parse, validate
+
+payload = list(range(10000))
+
+with ThreadPoolExecutor(4) as executor:
+    assert validate(List[int], payload, executor=executor, chunksize=1000)
+    assert not validate(List[int], payload + ["oops"], executor=executor)
+
+    values = parse(List[float], payload, executor=executor, chunksize=1000)
+    assert values[42] == 42.0 and type(values[42]) is float
+
+    try:
+        parse(Dict[str, int], {"a": "1", "b": "two"}, executor=executor, chunksize=1)
+        assert False
+    except BatchError as e:
+        print(e)
+        # 1 invalid item(s), first at [b]: ...
+
+    # strategies report the same result shape with or without an executor
+    strategy = Strategy.first(1000)
+    result = validate(
+        List[List[int]],
+        [payload] * 4,
+        strategy=strategy,
+        executor=executor,
+        chunksize=1,
+    )
+    assert isinstance(result, ValidationResult)
+    assert result == validate(List[List[int]], [payload] * 4, strategy=strategy)
+    print(result.checked, result.skipped)
+    # 4004 36000
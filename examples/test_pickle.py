@@ -0,0 +1,42 @@
+import pickle
+
+from typing import *
+from mousse import Dataclass
+
+
+class Item(Dataclass):
+    name: str
+    price: int = 0
+
+
+class CheckedItem(Item, validate_on_unpickle=True):
+    pass
+
+
+class Bag(Dataclass, dynamic=True):
+    items: List[Item] = []
+
+
+@Item.price.validator
+def positive(price: int) -> bool:
+    return price >= 0
+
+
+bag = Bag(items=[Item(name="egg", price=2)])
+bag.owner = "alice"  # dynamic fields are kept
+copy = pickle.loads(pickle.dumps(bag))
+assert copy.owner == "alice"
+assert (copy.items[0].name, copy.items[0].price) == ("egg", 2)
+
+# raw values are restored without running validators, unless the class opts in
+item, checked = Item(name="egg"), CheckedItem(name="egg")
+Item.price.set_raw(item, -1)
+CheckedItem.price.set_raw(checked, -1)
+assert pickle.loads(pickle.dumps(item)).price == -1
+
+try:
+    pickle.loads(pickle.dumps(checked))
+    assert False
+except AssertionError as e:
+    print(e)
+    # Validation failed for [price]: positive
@@ -0,0 +1,39 @@
+import copy
+
+from typing import *
+from mousse import Dataclass, replace
+
+
+class Server(Dataclass):
+    host: str = "localhost"
+    port: int = 80
+    tags: List[str] = []
+
+
+class Deploy(Dataclass):
+    server: Server = Server()
+    replicas: int = 1
+
+
+@Server.port.validator
+def valid_port(port: int) -> bool:
+    return 0 < port < 65536
+
+
+prod = Deploy(server=Server(host="prod.local", tags=["eu"]), replicas=3)
+
+staging = replace(prod, replicas=1)
+assert staging.replicas == 1 and prod.replicas == 3
+assert staging.server is prod.server  # unchanged fields are shared
+
+try:
+    replace(prod.server, port=0)
+    assert False
+except AssertionError as e:
+    print(e)
+    # Validation failed for [port]: valid_port
+
+cloned = copy.deepcopy(prod)
+assert cloned.server is not prod.server
+assert cloned.server.tags == ["eu"] and cloned.server.tags is not prod.server.tags
+assert cloned.server.host is prod.server.host  # immutable values are shared
@@ -0,0 +1,25 @@
+from typing import *
+from mousse import Dataclass, Field, Strategy, ValidationResult, validate
+
+payload = list(range(100000)) + ["oops"]
+
+assert not validate(List[int], payload)
+
+result = validate(List[int], payload, strategy=Strategy.first(1000))
+assert isinstance(result, ValidationResult)
+assert result.valid and result.checked == 1000
+print(result.strategy, result.checked, result.skipped)
+# first-1000 1000 99001
+
+result = validate(List[int], payload, strategy=Strategy.sample(100, seed=1))
+assert result.checked + result.skipped == len(payload)
+
+result = validate(List[int], payload, strategy=Strategy.within(0.001))
+assert result.checked >= 1
+
+
+class Batch(Dataclass):
+    values: List[int] = Field([], strategy=Strategy.first(10))
+
+
+assert validate(Batch, {"values": list(range(10)) + ["oops"]}, as_schema=True)
@@ -0,0 +1,40 @@
+import io
+
+from typing import *
+from mousse import Dataclass, RecordError, asclass_stream, load_stream
+
+
+class Item(Dataclass):
+    name: str
+    price: int = 0
+
+
+lines = io.StringIO('{"name": "egg", "price": 1}\n{"name": \n{"name": "ham"}\n')
+try:
+    list(asclass_stream(Item, lines))
+    assert False
+except RecordError as e:
+    print(e)
+    # Invalid record #1 at line 2: ...
+    assert e.line == 2
+
+lines.seek(0)
+items = list(asclass_stream(Item, lines, errors="skip"))
+assert [item.name for item in items] == ["egg", "ham"]
+
+# a broken record inside a top-level array does not swallow the next one
+array = io.StringIO('[{"name": "egg"}, {"name": [1,}, {"name": "ham"}]')
+items = list(asclass_stream(Item, array, format="json", errors="skip"))
+assert [item.name for item in items] == ["egg", "ham"]
+
+# malformed YAML is reported as a RecordError too
+documents = io.StringIO("name: egg\n---\nname: [ham\n---\nname: spam\n")
+try:
+    list(load_stream(documents, format="yaml"))
+    assert False
+except RecordError as e:
+    print(e.line, e.error)
+    assert e.index == 1
+
+documents.seek(0)
+assert list(load_stream(documents, format="yaml", errors="skip")) == [{"name": "egg"}]
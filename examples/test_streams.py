@@ -0,0 +1,81 @@
+import asyncio
+import io
+
+from typing import *
+from mousse import type_checking
+
+
+@type_checking
+def numbers(n: int) -> Generator[int, None, str]:
+    yield from range(n)
+    return "done"
+
+
+assert list(numbers(3)) == [0, 1, 2]
+
+
+@type_checking
+def broken() -> Iterator[int]:
+    yield "a"
+
+
+try:
+    next(broken())
+    assert False
+except AssertionError as e:
+    print(e)
+    # Incorrect yield type: <class 'str'>. Correct yield type: <class 'int'>
+
+
+@type_checking
+def counter(n: int) -> Iterator[int]:
+    return (i for i in range(n))
+
+
+gen = counter(3)
+assert next(gen) == 0 and gen.send(None) == 1
+gen.close()
+
+
+@type_checking
+def lines(text: str) -> Iterator[str]:
+    return io.StringIO(text)
+
+
+# non generator iterators keep their own API
+handle = lines("a\nb\n")
+assert isinstance(handle, io.StringIO)
+assert handle.readline() == "a\n"
+
+
+@type_checking
+async def double(value: int) -> int:
+    return value * 2
+
+
+assert asyncio.run(double(2)) == 4
+
+
+@type_checking
+async def letters(text: str) -> AsyncIterator[str]:
+    for char in text:
+        yield char
+
+
+async def collect() -> List[str]:
+    return [char async for char in letters("ab")]
+
+
+assert asyncio.run(collect()) == ["a", "b"]
+
+
+@type_checking
+def names(n: int) -> Iterator[str]:
+    return (i for i in range(n))
+
+
+try:
+    list(names(1))
+    assert False
+except AssertionError as e:
+    pass
@@ -0,0 +1,41 @@
+from typing import *
+from mousse import Dataclass, asdict, changed_fields, clear_changes, validate_all
+
+
+class Item(Dataclass, track_changes=True):
+    name: str = ""
+    price: int = 0
+
+
+class Note(Dataclass):
+    text: str = ""
+
+
+class Order(Dataclass, track_changes=True):
+    items: List[Item] = []
+    note: Note = Note()
+
+
+order = Order(items=[Item(name="egg", price=2)], note=Note(text="rush"))
+assert changed_fields(order) == set()
+
+order.items[0].price = 3
+assert changed_fields(order) == {"items"}
+assert validate_all(order, changed_only=True)
+clear_changes(order)
+
+first = asdict(order)
+first["items"][0]["price"] = 100  # the cached output is not shared
+assert asdict(order)["items"][0]["price"] == 3
+
+# a replaced child no longer reports to its former parent
+old = order.items[0]
+order.items = [Item(name="ham")]
+clear_changes(order)
+old.price = 5
+assert changed_fields(order) == set()
+
+# untracked children are never served from the cache
+asdict(order)
+order.note.text = "later"
+assert asdict(order)["note"] == {"text": "later"}
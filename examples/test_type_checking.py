@@ -0,0 +1,48 @@
+from typing import *
+from mousse import Dataclass, type_checking
+
+
+@type_checking
+def scale(value: float, *args: int, factor: int) -> float:
+    return value * factor
+
+
+assert scale(1.5, factor=2) == 3.0
+
+try:
+    scale(1.5, 1, 2)  # factor is keyword-only
+    assert False
+except AssertionError as e:
+    print(e)
+    # Missing value for factor
+
+
+@type_checking
+def first(items: List["Item"]) -> "Item":
+    return items[0]
+
+
+class Item(Dataclass):
+    name: str
+
+
+# forward references are resolved on the first call
+assert first([Item(name="egg")]).name == "egg"
+
+try:
+    first(["egg"])
+    assert False
+except AssertionError as e:
+    print(e)
+    # Wrong type for items. Expect type List
+
+
+@type_checking(sample=10)
+def double(value: int) -> int:
+    return value * 2
+
+
+# only every 10th call is checked
+assert double(1) == 2
+assert double("a") == "aa"
+assert double.sampler.calls == 2
@@ -0,0 +1,30 @@
+from typing import *
+from mousse import Dataclass, parse
+
+
+class Circle(Dataclass):
+    kind: Literal["circle"] = "circle"
+    radius: float = 0.0
+
+
+class Square(Dataclass):
+    kind: Literal["square"] = "square"
+    side: float = 0.0
+
+
+class Point(Dataclass):
+    x: float = 0.0
+    y: float = 0.0
+
+
+Shape = Union[Circle, Square]
+
+assert isinstance(parse(Shape, {"kind": "square", "side": 2}), Square)
+assert isinstance(parse(Shape, {"kind": "circle", "radius": 1}), Circle)
+
+# without the tag, the payload is dispatched by the keys it carries
+square = parse(Shape, {"side": 3})
+assert isinstance(square, Square) and square.side == 3
+
+assert isinstance(parse(Union[Circle, Point], {"x": 1, "y": 2}), Point)
+assert isinstance(parse(Union[Circle, Point], {"radius": 1}), Circle)
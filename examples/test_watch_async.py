@@ -0,0 +1,42 @@
+import asyncio
+
+from typing import *
+from mousse import Config, WatchScheduler, watch, watch_async
+
+versions = iter(range(100))
+
+
+async def fetch() -> Dict[str, Any]:
+    version = next(versions)
+    if version:
+        await asyncio.sleep(0.5)
+
+    return {"version": version}
+
+
+async def main():
+    scheduler = WatchScheduler(max_workers=1, jitter=0)
+    config = Config()
+    handle = await watch_async(
+        config, asyncio.get_running_loop(), fetch, scheduler=scheduler, milliseconds=10
+    )
+    assert config.version == 0
+
+    ticks = []
+    other = watch(
+        Config(), lambda: ticks.append(1) or {}, scheduler=scheduler, milliseconds=20
+    )
+
+    # the slow async reload does not hold the only worker
+    await asyncio.sleep(0.7)
+    assert config.version == 1
+    assert len(ticks) >= 10, len(ticks)
+    print(handle.stats.loads)
+    # 1
+
+    handle.cancel()
+    other.cancel()
+    scheduler.shutdown()
+
+
+asyncio.run(main())
@@ -0,0 +1,54 @@
+import json
+import os
+import tempfile
+import time
+
+from typing import *
+from mousse import Config, FileSource, watch_file
+
+path = os.path.join(tempfile.mkdtemp(), "app.json")
+with open(path, "w") as f:
+    json.dump({"db": {"port": 5432}, "debug": False}, f)
+
+config = Config()
+source = watch_file(config, path, milliseconds=50)
+db = config.db
+assert db.port == 5432
+
+tmp = path + ".tmp"
+with open(tmp, "w") as f:
+    json.dump({"db": {"port": 6543}}, f)
+os.replace(tmp, path)
+
+start = time.time()
+while config.db.port != 6543 and time.time() - start < 2:
+    time.sleep(0.01)
+
+# only changed paths are assigned, removed keys are removed
+assert config.db is db and config.db.port == 6543
+assert not hasattr(config, "debug")
+source.cancel()
+
+
+def broken() -> Dict[str, Any]:
+    raise OSError("temporarily unavailable")
+
+
+# a failed reload is retried on the next poll
+config = Config()
+source = FileSource(path)
+source.reload(config)
+with open(path, "w") as f:
+    json.dump({"db": {"port": 7000}}, f)
+
+source.emitter = broken
+try:
+    source.reload(config)
+    assert False
+except OSError:
+    pass
+
+source.emitter = source.read
+print(source.reload(config))
+# [(('db', 'port'), 7000)]
+assert config.db.port == 7000
@@ -13,53 +13,131 @@ from .pattern import (
 )
 from .types import (
     Accessor,
+    Array,
+    BatchError,
     Config,
+    ConfigSnapshot,
+    ConfigStore,
+    ConfigView,
     Dataclass,
+    DataclassArray,
+    EnvOverlay,
     Field,
+    FileSource,
     Parser,
+    ReadOnlyFieldException,
+    RecordError,
+    Strategy,
+    ValidationCache,
+    ValidationResult,
+    Watch,
+    WatchScheduler,
+    WatchStats,
     asclass,
+    asclass_many,
+    asclass_stream,
     asdict,
+    asdict_many,
+    changed_fields,
+    clear_changes,
+    decode_binary,
+    diff,
+    dump_binary,
+    dump_stream,
+    encode_binary,
     get_config,
+    get_scheduler,
+    in_range,
+    intern,
+    load_binary,
     load_config,
+    load_stream,
     parse,
     parser,
+    patch,
+    refresh_env,
+    register_backend,
+    replace,
+    set_backend,
+    set_type_checking,
     type_checking,
     validate,
+    validate_all,
     watch,
     watch_async,
+    watch_file,
 )
 
 __all__ = [
     "Accessor",
+    "Array",
     "AutoRegistry",
+    "BatchError",
     "Config",
+    "ConfigSnapshot",
+    "ConfigStore",
+    "ConfigView",
     "Dataclass",
+    "DataclassArray",
+    "EnvOverlay",
     "Field",
+    "FileSource",
     "Handler",
     "Listener",
     "Mediator",
     "ObjectPool",
     "Parser",
+    "ReadOnlyFieldException",
+    "RecordError",
     "Registry",
     "Singleton",
+    "Strategy",
+    "ValidationCache",
+    "ValidationResult",
+    "Watch",
+    "WatchScheduler",
+    "WatchStats",
     "asclass",
+    "asclass_many",
+    "asclass_stream",
     "asdict",
+    "asdict_many",
+    "changed_fields",
+    "clear_changes",
+    "decode_binary",
+    "diff",
+    "dump_binary",
+    "dump_stream",
+    "encode_binary",
     "export",
     "export_instance",
     "export_subclass",
     "get_config",
     "get_logger",
+    "get_scheduler",
     "handler_registry",
+    "in_range",
+    "intern",
+    "load_binary",
     "load_config",
+    "load_stream",
     "log_error",
     "log_time",
     "object_pool",
     "parse",
     "parser",
+    "patch",
+    "refresh_env",
     "register",
+    "register_backend",
+    "replace",
+    "set_backend",
+    "set_type_checking",
     "singleton",
+    "type_checking",
     "validate",
+    "validate_all",
     "watch",
     "watch_async",
-    "type_checking",
+    "watch_file",
 ]
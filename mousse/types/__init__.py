@@ -1,7 +1,16 @@
 from .accessor import *
+from .array import *
+from .backend import *
+from .batch import *
+from .binary import *
+from .columnar import *
+from .stream import *
 from .config import *
 from .dataclass import *
+from .delta import *
+from .env import *
 from .field import *
 from .parser import *
+from .scheduler import *
 from .types import *
 from .validator import *
@@ -1,10 +1,23 @@
 from copy import deepcopy
 from functools import lru_cache
+from threading import RLock
 from typing import *
+from weakref import ReferenceType, ref
 
 from .field import Field, Strictness
 
 
+@lru_cache(maxsize=None)
+def get_strictness(strict: int) -> Strictness:
+    strictness = min(Strictness)
+    for level in sorted(Strictness):
+        if strict <= level:
+            strictness = level
+            break
+
+    return strictness
+
+
 class Accessor:
     def __init__(
         self,
@@ -20,10 +33,7 @@ class Accessor:
             return self
 
         if id(obj) not in self.storage:
-            if self.field.factory is not None:
-                self.storage[id(obj)] = self.field.factory()
-            else:
-                self.storage[id(obj)] = deepcopy(self.field.default)
+            self.load(obj)
         val = self.storage.get(id(obj))
 
         for getter in self.field.getters.values():
@@ -35,14 +45,18 @@ class Accessor:
         return val
 
     def __set__(self, obj: Any, val: Any):
-        from .parser import parse
-        from .validator import validate
+        if _pending:
+            pending = _pending.get(id(obj))
+            if pending:
+                pending.pop(self.key, None)
+
+        self.assign(obj, val)
 
-        strictness = min(Strictness)
-        for level in sorted(Strictness):
-            if self.field.strict <= level:
-                strictness = level
-                break
+        if tracked and type(obj) in tracked:
+            touch(obj, self.key)
+
+    def assign(self, obj: Any, val: Any):
+        strictness = get_strictness(self.field.strict)
 
         if strictness == Strictness.REJECT:
             assert isinstance(
@@ -50,21 +64,32 @@ class Accessor:
             ), f"Invalid datatype: require {self.field.annotation}, get {type(val)}"
 
         if strictness == Strictness.CONVERT:
+            from .parser import parse
+
             val = parse(self.field.annotation, val)
 
         for setter in self.field.setters.values():
+            from .validator import validate
+
             if setter.static:
                 val = setter(val)
             else:
                 val = setter(obj, val)
 
-            assert validate(
-                self.field.annotation, val
+            if self.field.strategy is None:
+                valid = validate(self.field.annotation, val)
+            else:
+                valid = validate(
+                    self.field.annotation, val, strategy=self.field.strategy
+                )
+
+            assert (
+                valid
             ), f"Invalid datatype: require {self.field.annotation}, get {type(val)}"
 
         self.validate(obj, val)
 
-        self.storage[id(obj)] = val
+        self.set_raw(obj, val)
 
     def validator(self, func: Callable = None, static: bool = True):
         return self.field.validator(func, static=static)
@@ -76,11 +101,7 @@ class Accessor:
         return self.field.getter(func, static=static)
 
     def validate(self, obj: Any, val: Any) -> bool:
-        strictness = min(Strictness)
-        for level in sorted(Strictness):
-            if self.field.strict <= level:
-                strictness = level
-                break
+        strictness = get_strictness(self.field.strict)
 
         if strictness == Strictness.REJECT:
             assert isinstance(
@@ -91,29 +112,187 @@ class Accessor:
             if validator.static:
                 assert validator(
                     val
-                ), f"Validation failed for [{self.key}]: {validator.__name__}"
+                ), f"Validation failed for [{self.key}]: {validator.func.__name__}"
             else:
                 assert validator(
                     obj, val
-                ), f"Validation failed for [{self.key}]: {validator.__name__}"
+                ), f"Validation failed for [{self.key}]: {validator.func.__name__}"
         return True
 
+    def get_raw(self, obj: Any) -> Any:
+        if id(obj) not in self.storage:
+            self.load(obj)
 
-@lru_cache(maxsize=None)
-def _get_accessors_info(cls: Any) -> Dict[str, Accessor]:
-    return {}
+        return self.storage[id(obj)]
+
+    def load(self, obj: Any):
+        pending = _pending.get(id(obj))
+        if pending and self.key in pending:
+            with _pending_lock:
+                entry = pending.pop(self.key, None)
+                if entry is not None:
+                    raw, parse_field = entry
+                    try:
+                        self.assign(obj, parse_field(raw))
+                    except Exception:
+                        pending[self.key] = entry
+                        raise
+                    return
+
+                if id(obj) in self.storage:
+                    return
+
+        if self.field.factory is not None:
+            self.set_raw(obj, self.field.factory())
+        else:
+            self.set_raw(obj, deepcopy(self.field.default))
+
+    def set_raw(self, obj: Any, val: Any):
+        if tracked and type(obj) in tracked:
+            old = self.storage.get(id(obj))
+            if old is not None and old is not val:
+                unlink(obj, self.key, old)
+            link(obj, self.key, val)
+
+        self.storage[id(obj)] = val
+
+    def release(self, obj: Any):
+        self.storage.pop(id(obj), None)
+
+
+_custom_accessors: Dict[int, Dict[str, Accessor]] = {}
+_pending: Dict[int, Dict[str, Tuple[Any, Callable[[Any], Any]]]] = {}
+_pending_lock = RLock()
+
+tracked: Set[type] = set()
+_changes: Dict[int, Set[str]] = {}
+_parents: Dict[int, List[Tuple[ReferenceType, str]]] = {}
+_dict_cache: Dict[int, Dict[Any, Any]] = {}
 
 
 @lru_cache(maxsize=None)
-def _get_customs_info(cls: Any) -> Dict[str, Accessor]:
+def _get_accessors_info(cls: Any) -> Dict[str, Accessor]:
     return {}
 
 
 def get_accessors_info(cls: Any, obj: Any = None) -> Dict[str, Accessor]:
     defaults = _get_accessors_info(cls)
     if obj is not None:
-        customs = _get_customs_info(id(obj))
-        customs.update(defaults)
-        return customs
+        customs = _custom_accessors.get(id(obj))
+        if customs:
+            return {**defaults, **customs}
 
     return defaults
+
+
+def add_accessor_info(obj: Any, key: str, accessor: Accessor):
+    _custom_accessors.setdefault(id(obj), {})[key] = accessor
+
+
+def remove_accessor_info(obj: Any, key: str):
+    _custom_accessors.get(id(obj), {}).pop(key, None)
+
+
+def remove_accessors_info(obj: Any):
+    _custom_accessors.pop(id(obj), None)
+
+
+def get_pending(obj: Any) -> Dict[str, Tuple[Any, Callable[[Any], Any]]]:
+    return _pending.get(id(obj)) or {}
+
+
+def set_pending(obj: Any, pending: Dict[str, Tuple[Any, Callable[[Any], Any]]]):
+    if pending:
+        _pending[id(obj)] = pending
+
+
+def remove_pending(obj: Any):
+    _pending.pop(id(obj), None)
+
+
+def touch(obj: Any, key: str, memo: Set[int] = None):
+    if memo is None:
+        memo = set()
+    elif id(obj) in memo:
+        return
+    memo.add(id(obj))
+
+    changes = _changes.get(id(obj))
+    if changes is None:
+        changes = _changes[id(obj)] = set()
+    changes.add(key)
+    _dict_cache.pop(id(obj), None)
+
+    for parent_ref, parent_key in _parents.get(id(obj), ()):
+        parent = parent_ref()
+        if parent is not None:
+            touch(parent, parent_key, memo)
+
+
+def link(obj: Any, key: str, val: Any):
+    if type(val) in tracked:
+        parents = _parents.setdefault(id(val), [])
+        for parent_ref, parent_key in parents:
+            if parent_key == key and parent_ref() is obj:
+                return
+
+        parents.append((ref(obj), key))
+
+    elif isinstance(val, (list, tuple, set, frozenset)):
+        for elem in val:
+            if type(elem) in tracked:
+                link(obj, key, elem)
+
+    elif isinstance(val, dict):
+        for elem in val.values():
+            if type(elem) in tracked:
+                link(obj, key, elem)
+
+
+def unlink(obj: Any, key: str, val: Any):
+    if type(val) in tracked:
+        parents = _parents.get(id(val))
+        if parents:
+            parents[:] = [
+                (parent_ref, parent_key)
+                for parent_ref, parent_key in parents
+                if parent_key != key or parent_ref() is not obj
+            ]
+
+    elif isinstance(val, (list, tuple, set, frozenset)):
+        for elem in val:
+            if type(elem) in tracked:
+                unlink(obj, key, elem)
+
+    elif isinstance(val, dict):
+        for elem in val.values():
+            if type(elem) in tracked:
+                unlink(obj, key, elem)
+
+
+def get_changes(obj: Any) -> Set[str]:
+    return _changes.get(id(obj)) or set()
+
+
+def reset_changes(obj: Any):
+    _changes.pop(id(obj), None)
+
+
+def get_cached_dict(obj: Any, key: Any) -> Optional[Dict[str, Any]]:
+    cache = _dict_cache.get(id(obj))
+    if cache is not None:
+        return cache.get(key)
+
+
+def has_cached_dict(obj: Any) -> bool:
+    return bool(_dict_cache.get(id(obj)))
+
+
+def set_cached_dict(obj: Any, key: Any, data: Dict[str, Any]):
+    _dict_cache.setdefault(id(obj), {})[key] = data
+
+
+def remove_tracking(obj: Any):
+    _changes.pop(id(obj), None)
+    _parents.pop(id(obj), None)
+    _dict_cache.pop(id(obj), None)
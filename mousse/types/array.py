@@ -0,0 +1,221 @@
+import operator
+from functools import reduce
+from typing import *
+
+from .parser import compile_parser
+from .parser import compiler as parser_compiler
+from .validator import compile_validator
+from .validator import compiler as validator_compiler
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+__all__ = ["Array", "in_range"]
+
+KINDS = {bool: "b", int: "iu", float: "f", complex: "c", str: "U", bytes: "S"}
+
+Shape = Optional[Tuple[Optional[int], ...]]
+
+
+class ArrayMeta(type):
+    def __getitem__(cls, params: Any) -> "ArrayMeta":
+        if not isinstance(params, tuple):
+            params = (params,)
+
+        dtype, *rest = params
+        shape = rest[0] if rest else None
+        if isinstance(shape, int):
+            shape = (None,) * shape
+        elif shape is not None:
+            shape = tuple(shape)
+
+        return _specialize(cls, dtype, shape)
+
+    def __instancecheck__(cls, obj: Any) -> bool:
+        return compile_validator(cls)(obj)
+
+    def __repr__(cls) -> str:
+        if cls.dtype is None and cls.shape is None:
+            return "Array"
+
+        dtype = getattr(cls.dtype, "__name__", cls.dtype)
+        return f"Array[{dtype}, {cls.shape}]"
+
+
+class Array(metaclass=ArrayMeta):
+    dtype: Any = None
+    shape: Shape = None
+
+
+_specialized: Dict[Tuple[Any, Shape], ArrayMeta] = {}
+
+
+def _specialize(cls: ArrayMeta, dtype: Any, shape: Shape) -> ArrayMeta:
+    key = (dtype, shape)
+    if key not in _specialized:
+        _specialized[key] = ArrayMeta(
+            cls.__name__, (cls,), {"dtype": dtype, "shape": shape}
+        )
+
+    return _specialized[key]
+
+
+def _get_dtype(dtype: Any) -> Any:
+    if dtype is None or dtype in KINDS:
+        return dtype
+
+    return np.dtype(dtype)
+
+
+def _match_dtype(dtype: Any, arr: Any) -> bool:
+    if dtype is None:
+        return True
+
+    if dtype in KINDS:
+        return arr.dtype.kind in KINDS[dtype]
+
+    return arr.dtype == dtype
+
+
+def _match_shape(shape: Shape, actual: Tuple[int, ...]) -> bool:
+    if shape is None:
+        return True
+
+    if len(shape) != len(actual):
+        return False
+
+    for expected, size in zip(shape, actual):
+        if expected is not None and expected != size:
+            return False
+
+    return True
+
+
+def _nested_list(dtype: Any, shape: Shape) -> Any:
+    G = Any if dtype is None or dtype not in KINDS else dtype
+    for _ in range(len(shape) if shape is not None else 1):
+        G = List[G]
+
+    return G
+
+
+def _list_shape(obj: Any, ndim: int) -> Tuple[int, ...]:
+    shape = []
+    for _ in range(ndim):
+        if not isinstance(obj, list):
+            break
+
+        shape.append(len(obj))
+        obj = obj[0] if obj else None
+
+    return tuple(shape)
+
+
+@validator_compiler(ArrayMeta)
+def compile_array_validator(G: ArrayMeta, **kwargs) -> Callable[[Any], bool]:
+    shape = G.shape
+
+    if np is None:
+        check_list = compile_validator(_nested_list(G.dtype, shape), **kwargs)
+        ndim = len(shape) if shape is not None else 1
+
+        def check(obj: Any) -> bool:
+            return check_list(obj) and _match_shape(shape, _list_shape(obj, ndim))
+
+        return check
+
+    dtype = _get_dtype(G.dtype)
+
+    def check(obj: Any) -> bool:
+        return (
+            isinstance(obj, np.ndarray)
+            and _match_dtype(dtype, obj)
+            and _match_shape(shape, obj.shape)
+        )
+
+    return check
+
+
+@parser_compiler(ArrayMeta)
+def compile_array_parser(G: ArrayMeta, **kwargs) -> Callable[[Any], Any]:
+    shape = G.shape
+
+    if np is None:
+        parse_list = compile_parser(_nested_list(G.dtype, shape), **kwargs)
+        ndim = len(shape) if shape is not None else 1
+
+        def parse_array(obj: Any) -> List[Any]:
+            if obj is None:
+                return obj
+
+            data = parse_list(obj)
+            assert _match_shape(
+                shape, _list_shape(data, ndim)
+            ), f"Unable to parse to {G}: shape mismatch"
+            return data
+
+        return parse_array
+
+    dtype = _get_dtype(G.dtype)
+
+    def parse_array(obj: Any) -> Any:
+        if obj is None:
+            return obj
+
+        if isinstance(obj, np.ndarray) and _match_dtype(dtype, obj):
+            arr = obj
+        else:
+            arr = np.asarray(obj, dtype=dtype)
+
+        assert _match_shape(
+            shape, arr.shape
+        ), f"Unable to parse array of shape {arr.shape} to {G}"
+        return arr
+
+    return parse_array
+
+
+def in_range(
+    low: Any = None,
+    high: Any = None,
+    include_low: bool = True,
+    include_high: bool = True,
+) -> Callable[[Any], bool]:
+    above = operator.ge if include_low else operator.gt
+    below = operator.le if include_high else operator.lt
+
+    def in_range(val: Any) -> bool:
+        if np is not None and isinstance(val, np.ndarray):
+            masks = []
+            if low is not None:
+                masks.append(above(val, low))
+            if high is not None:
+                masks.append(below(val, high))
+
+            return not masks or bool(np.all(reduce(operator.and_, masks)))
+
+        if isinstance(val, (list, tuple, set, frozenset)):
+            return all(map(in_range, val))
+
+        if low is not None and not above(val, low):
+            return False
+
+        if high is not None and not below(val, high):
+            return False
+
+        return True
+
+    return in_range
+
+
+if np is not None:
+
+    @validator_compiler(np.ndarray)
+    def compile_ndarray_validator(G: type, **kwargs) -> Callable[[Any], bool]:
+        return lambda obj: isinstance(obj, np.ndarray)
+
+    @parser_compiler(np.ndarray)
+    def compile_ndarray_parser(G: type, **kwargs) -> Callable[[Any], Any]:
+        return np.asarray
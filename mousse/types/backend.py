@@ -0,0 +1,155 @@
+import io
+import json
+from pathlib import Path
+from typing import *
+
+import yaml
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+__all__ = ["Backend", "get_backend", "register_backend", "set_backend"]
+
+
+class YamlLoader(getattr(yaml, "CSafeLoader", yaml.SafeLoader)):
+    pass
+
+
+YamlLoader.add_constructor(
+    "tag:yaml.org,2002:python/tuple",
+    lambda loader, node: tuple(loader.construct_sequence(node)),
+)
+
+YamlDumper = getattr(yaml, "CDumper", yaml.Dumper)
+
+
+class Backend(NamedTuple):
+    load: Callable[[IO], Any]
+    dump: Callable[[Any, IO], None]
+    loads: Callable[[Union[str, bytes]], Any]
+    binary: bool = False
+
+
+FORMATS = {".json": "json", ".yaml": "yaml", ".yml": "yaml"}
+
+backends: Dict[str, Dict[str, Backend]] = {}
+selected: Dict[str, str] = {}
+
+
+def register_backend(
+    format: str,
+    name: str,
+    load: Callable[[IO], Any],
+    dump: Callable[[Any, IO], None],
+    loads: Callable[[Union[str, bytes]], Any] = None,
+    binary: bool = False,
+    suffixes: Iterable[str] = (),
+    select: bool = False,
+) -> Backend:
+    if loads is None:
+        loads = lambda data: load(_as_stream(data))
+
+    codec = Backend(load, dump, loads, binary)
+    backends.setdefault(format, {})[name] = codec
+
+    for suffix in suffixes:
+        FORMATS[suffix.lower()] = format
+
+    if select or format not in selected:
+        selected[format] = name
+
+    return codec
+
+
+def set_backend(format: str, name: str):
+    assert name in backends.get(format, {}), f"Unknown {format} backend: {name}"
+    selected[format] = name
+
+
+def get_backend(format: str) -> Backend:
+    if format.startswith("."):
+        name = FORMATS.get(format.lower())
+        if name is None:
+            raise Exception(f"file format {format} is not supported")
+        format = name
+
+    if format not in selected:
+        raise Exception(f"file format {format} is not supported")
+
+    return backends[format][selected[format]]
+
+
+def load(path: Union[str, Path]) -> Any:
+    if type(path) is not Path:
+        path = Path(path).resolve()
+
+    codec = get_backend(path.suffix)
+    if codec.binary:
+        with open(path, "rb") as fin:
+            return codec.load(fin)
+
+    with open(path, encoding="utf-8") as fin:
+        return codec.load(fin)
+
+
+def dump(data: Any, path: Union[str, Path]):
+    if type(path) is not Path:
+        path = Path(path)
+
+    codec = get_backend(path.suffix)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if codec.binary:
+        with open(path, "wb") as fout:
+            codec.dump(data, fout)
+        return
+
+    with open(path, "w", encoding="utf-8") as fout:
+        codec.dump(data, fout)
+
+
+def _as_stream(data: Union[str, bytes]) -> IO:
+    if isinstance(data, bytes):
+        return io.BytesIO(data)
+
+    return io.StringIO(data)
+
+
+def load_yaml(stream: Any) -> Dict[str, Any]:
+    return yaml.load(stream, Loader=YamlLoader) or {}
+
+
+def dump_yaml(data: Any, stream: Any):
+    return yaml.dump(
+        data,
+        stream,
+        Dumper=YamlDumper,
+        default_flow_style=False,
+        indent=2,
+        allow_unicode=True,
+    )
+
+
+register_backend("json", "json", json.load, json.dump, loads=json.loads)
+register_backend("yaml", "yaml", load_yaml, dump_yaml, loads=load_yaml)
+
+if orjson is not None:
+    register_backend(
+        "json",
+        "orjson",
+        lambda stream: orjson.loads(stream.read()),
+        lambda data, stream: stream.write(
+            orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        ),
+        loads=orjson.loads,
+        binary=True,
+    )
+
+if ujson is not None:
+    register_backend("json", "ujson", ujson.load, ujson.dump, loads=ujson.loads)
@@ -0,0 +1,367 @@
+import collections.abc
+import os
+from collections import deque
+from concurrent.futures import Executor, Future
+from functools import partial
+from itertools import islice
+from typing import *
+
+from .dataclass import Dataclass
+from .field import get_fields_info
+from .parser import (
+    ClassParser,
+    DictParser,
+    Parser,
+    asdict,
+    build_class,
+    compile_parser,
+    get_class_plan,
+)
+from .types import get_args, get_origin
+from .validator import (
+    ValidationResult,
+    _get_run,
+    _run_field_validators,
+    _running,
+    _Run,
+    _select,
+    compile_validator,
+)
+
+__all__ = ["BatchError", "asclass_many", "asdict_many"]
+
+DEFAULT_CHUNKSIZE = 1024
+
+
+class BatchError(AssertionError):
+    def __init__(self, errors: List[Tuple[Any, str]]):
+        self.errors = errors
+        index, message = errors[0]
+        super().__init__(
+            f"{len(errors)} invalid item(s), first at [{index}]: {message}"
+        )
+
+    def __reduce__(self):
+        return BatchError, (self.errors,)
+
+    def shift(self, offset: int) -> "BatchError":
+        return BatchError([(index + offset, message) for index, message in self.errors])
+
+
+def chunked(objs: Iterable[Any], chunksize: int) -> Iterator[List[Any]]:
+    iterator = iter(objs)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def map_chunks(
+    func: Callable[[List[Any]], List[Any]],
+    objs: Iterable[Any],
+    executor: Executor,
+    chunksize: int = None,
+    prefetch: int = None,
+) -> Iterator[Any]:
+    if prefetch is None:
+        workers = getattr(executor, "_max_workers", None) or os.cpu_count() or 1
+        prefetch = 2 * workers
+
+    pending = deque()
+    offset = 0
+    try:
+        for chunk in chunked(objs, chunksize or DEFAULT_CHUNKSIZE):
+            pending.append((offset, executor.submit(func, chunk)))
+            offset += len(chunk)
+            if len(pending) >= prefetch:
+                yield from _chunk_result(*pending.popleft())
+
+        while pending:
+            yield from _chunk_result(*pending.popleft())
+    finally:
+        for _, future in pending:
+            future.cancel()
+
+
+def _chunk_result(offset: int, future: Future) -> List[Any]:
+    try:
+        return future.result()
+    except BatchError as e:
+        raise e.shift(offset) from None
+
+
+def asclass_many(
+    cls: Type[Dataclass],
+    objs: Iterable[Any],
+    parser: Parser = ClassParser(),
+    chunksize: int = None,
+    executor: Executor = None,
+) -> Iterator[Dataclass]:
+    if executor is not None:
+        func = partial(_asclass_chunk, cls, parser)
+        yield from map_chunks(func, objs, executor, chunksize=chunksize)
+        return
+
+    plan = get_class_plan(cls, parser)
+    for obj in objs:
+        if isinstance(obj, Dataclass):
+            obj = asdict(obj)
+
+        yield build_class(cls, plan, obj or {})
+
+
+def asdict_many(
+    objs: Iterable[Dataclass],
+    by_alias: bool = True,
+    parser: Parser = DictParser(),
+    chunksize: int = None,
+    executor: Executor = None,
+) -> Iterator[Dict[str, Any]]:
+    if executor is not None:
+        func = partial(_asdict_chunk, by_alias, parser)
+        yield from map_chunks(func, objs, executor, chunksize=chunksize)
+        return
+
+    for obj in objs:
+        yield asdict(obj, by_alias=by_alias, parser=parser)
+
+
+def _asclass_chunk(
+    cls: Type[Dataclass], parser: Parser, objs: List[Any]
+) -> List[Dataclass]:
+    plan = get_class_plan(cls, parser)
+
+    results = []
+    errors = []
+    for idx, obj in enumerate(objs):
+        try:
+            if isinstance(obj, Dataclass):
+                obj = asdict(obj)
+
+            results.append(build_class(cls, plan, obj or {}))
+        except Exception as e:
+            errors.append((idx, _describe(e)))
+
+    if errors:
+        raise BatchError(errors)
+
+    return results
+
+
+def _asdict_chunk(
+    by_alias: bool, parser: Parser, objs: List[Dataclass]
+) -> List[Dict[str, Any]]:
+    return list(asdict_many(objs, by_alias=by_alias, parser=parser))
+
+
+def validate_parallel(
+    G: Any, obj: Any, executor: Executor, chunksize: int = None, **kwargs
+) -> Union[bool, ValidationResult]:
+    chunksize = chunksize or DEFAULT_CHUNKSIZE
+
+    strategy = kwargs.get("strategy")
+    if strategy is None:
+        return _validate_parallel(G, obj, executor, chunksize, **kwargs)
+
+    with _running(_get_run(strategy)) as run:
+        valid = _validate_parallel(G, obj, executor, chunksize, **kwargs)
+
+    return ValidationResult(bool(valid), strategy, run.checked, run.skipped)
+
+
+def _validate_parallel(
+    G: Any, obj: Any, executor: Executor, chunksize: int, **kwargs
+) -> bool:
+    if isinstance(G, type) and issubclass(G, Dataclass):
+        if not kwargs.get("as_schema"):
+            return isinstance(obj, G)
+
+        return _validate_schema(G, obj, executor, chunksize, **kwargs)
+
+    split = _split(G, obj)
+    if split is None or len(obj) <= chunksize:
+        return compile_validator(G, **kwargs)(obj)
+
+    kind, types, elems = split
+    strategy = kwargs.get("strategy")
+    if strategy is not None:
+        elems = list(_select(strategy, elems))
+
+    func = partial(_validate_chunk, kind, types, kwargs)
+    futures = [executor.submit(func, chunk) for chunk in chunked(elems, chunksize)]
+    results = [future.result() for future in futures]
+
+    if strategy is not None:
+        run = _get_run(strategy)
+        run.checked += sum(checked for _, checked, _ in results)
+        run.skipped += sum(skipped for _, _, skipped in results)
+
+    return all(valid for valid, _, _ in results)
+
+
+def parse_parallel(
+    G: Any, obj: Any, executor: Executor, chunksize: int = None, **kwargs
+) -> Any:
+    chunksize = chunksize or DEFAULT_CHUNKSIZE
+
+    split = _split(G, obj)
+    if split is None or len(obj) <= chunksize:
+        return compile_parser(G, **kwargs)(obj)
+
+    kind, types, elems = split
+    func = partial(_parse_chunk, kind, types, kwargs)
+    futures = [executor.submit(func, chunk) for chunk in chunked(elems, chunksize)]
+
+    data = []
+    errors = []
+    for future in futures:
+        results, failures = future.result()
+        data.extend(results)
+        errors.extend(failures)
+
+    if errors:
+        raise BatchError(errors)
+
+    if kind == "items":
+        return dict(data)
+
+    origin = get_origin(G)
+    if origin not in (list, tuple, set, frozenset):
+        origin = list
+
+    return origin(data)
+
+
+def _split(G: Any, obj: Any) -> Optional[Tuple[str, Tuple[Any, ...], List[Any]]]:
+    origin = get_origin(G)
+    args = get_args(G)
+
+    if origin is dict and isinstance(obj, dict):
+        key_type, val_type = args or (Any, Any)
+        return "items", (key_type, val_type), list(obj.items())
+
+    if origin is tuple:
+        if not (len(args) == 2 and args[1] is Ellipsis) or not isinstance(obj, tuple):
+            return None
+
+        return "elems", args[:1], list(enumerate(obj))
+
+    if origin in (list, set, frozenset, collections.abc.Sequence):
+        expected = list if origin is collections.abc.Sequence else origin
+        if not isinstance(obj, expected):
+            return None
+
+        arg, *_ = args or (Any,)
+        return "elems", (arg,), list(enumerate(obj))
+
+    return None
+
+
+def _validate_chunk(
+    kind: str, types: Tuple[Any, ...], options: Dict[str, Any], chunk: List[Any]
+) -> Tuple[bool, int, int]:
+    strategy = options.get("strategy")
+    if strategy is None:
+        return _check_chunk(kind, types, options, chunk), 0, 0
+
+    with _running(_Run(strategy)) as run:
+        valid = _check_chunk(kind, types, options, chunk)
+
+    return valid, run.checked, run.skipped
+
+
+def _check_chunk(
+    kind: str, types: Tuple[Any, ...], options: Dict[str, Any], chunk: List[Any]
+) -> bool:
+    if kind == "items":
+        check_key = compile_validator(types[0], **options)
+        check_val = compile_validator(types[1], **options)
+        return all(check_key(key) and check_val(val) for key, val in chunk)
+
+    check = compile_validator(types[0], **options)
+    return all(check(elem) for _, elem in chunk)
+
+
+def _parse_chunk(
+    kind: str, types: Tuple[Any, ...], options: Dict[str, Any], chunk: List[Any]
+) -> Tuple[List[Any], List[Tuple[Any, str]]]:
+    results = []
+    errors = []
+
+    if kind == "items":
+        parse_key = compile_parser(types[0], **options)
+        parse_val = compile_parser(types[1], **options)
+        for key, val in chunk:
+            try:
+                results.append((parse_key(key), parse_val(val)))
+            except Exception as e:
+                errors.append((key, _describe(e)))
+
+        return results, errors
+
+    parse_elem = compile_parser(types[0], **options)
+    for idx, elem in chunk:
+        try:
+            results.append(parse_elem(elem))
+        except Exception as e:
+            errors.append((idx, _describe(e)))
+
+    return results, errors
+
+
+def _validate_schema(
+    G: Type[Dataclass],
+    obj: Any,
+    executor: Executor,
+    chunksize: int,
+    as_schema: bool = True,
+    strict: bool = False,
+    **kwargs,
+) -> bool:
+    if not isinstance(obj, Mapping):
+        return False
+
+    plan = {}
+    required = set()
+    for key, field in get_fields_info(G).items():
+        name = field.alias if field.alias is not None else key
+        plan[name] = field
+        if field.default is Ellipsis:
+            required.add(name)
+
+    if strict and any(key not in plan for key in obj):
+        return False
+
+    if not required.issubset(obj):
+        return False
+
+    options = {**kwargs, "as_schema": as_schema, "strict": strict}
+    for key, val in obj.items():
+        field = plan.get(key)
+        if field is None:
+            continue
+
+        field_options = options
+        if field.strategy is not None:
+            field_options = {**options, "strategy": field.strategy}
+
+        if not validate_parallel(
+            field.annotation, val, executor, chunksize, **field_options
+        ):
+            return False
+
+        is_dataclass = isinstance(field.annotation, type) and issubclass(
+            field.annotation, Dataclass
+        )
+        if field.validators and not _run_field_validators(
+            field, obj, val, is_dataclass
+        ):
+            return False
+
+    return True
+
+
+def _describe(e: Exception) -> str:
+    return f"{type(e).__name__}: {e}"
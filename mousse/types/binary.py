@@ -0,0 +1,535 @@
+import collections.abc
+import struct
+import zlib
+from itertools import chain
+from pathlib import Path
+from threading import RLock
+from typing import *
+
+from .accessor import Accessor, get_accessors_info
+from .dataclass import Dataclass, build_raw
+from .field import get_fields_info
+from .types import get_args, get_origin
+from .validator import compile_validator
+
+__all__ = ["decode_binary", "dump_binary", "encode_binary", "load_binary"]
+
+MAGIC = b"MSB2"
+BUFFER_SIZE = 1 << 16
+NoneType = type(None)
+
+DOUBLE = struct.Struct("<d")
+
+Encoder = Callable[[bytearray, Any], None]
+Decoder = Callable[[bytes, int], Tuple[Any, int]]
+
+
+def write_uvarint(buf: bytearray, val: int):
+    while val > 0x7F:
+        buf.append((val & 0x7F) | 0x80)
+        val >>= 7
+    buf.append(val)
+
+
+def read_uvarint(data: bytes, pos: int) -> Tuple[int, int]:
+    byte = data[pos]
+    if byte < 0x80:
+        return byte, pos + 1
+
+    result, shift = byte & 0x7F, 7
+    while True:
+        pos += 1
+        byte = data[pos]
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos + 1
+        shift += 7
+
+
+def encode_bool(buf: bytearray, val: bool):
+    buf.append(1 if val else 0)
+
+
+def decode_bool(data: bytes, pos: int) -> Tuple[bool, int]:
+    return data[pos] != 0, pos + 1
+
+
+def encode_int(buf: bytearray, val: int):
+    if not isinstance(val, int):
+        raise TypeError(f"Unable to encode {type(val)} as int")
+
+    write_uvarint(buf, val << 1 if val >= 0 else ((-val) << 1) - 1)
+
+
+def decode_int(data: bytes, pos: int) -> Tuple[int, int]:
+    val, pos = read_uvarint(data, pos)
+    return (val >> 1) if not val & 1 else -((val + 1) >> 1), pos
+
+
+def encode_float(buf: bytearray, val: float):
+    buf += DOUBLE.pack(val)
+
+
+def decode_float(data: bytes, pos: int) -> Tuple[float, int]:
+    return DOUBLE.unpack_from(data, pos)[0], pos + 8
+
+
+def encode_bytes(buf: bytearray, val: bytes):
+    write_uvarint(buf, len(val))
+    buf += val
+
+
+def decode_bytes(data: bytes, pos: int) -> Tuple[bytes, int]:
+    size, pos = read_uvarint(data, pos)
+    return bytes(data[pos : pos + size]), pos + size
+
+
+def encode_str(buf: bytearray, val: str):
+    encode_bytes(buf, val.encode("utf-8"))
+
+
+def decode_str(data: bytes, pos: int) -> Tuple[str, int]:
+    size, pos = read_uvarint(data, pos)
+    return str(data[pos : pos + size], "utf-8"), pos + size
+
+
+def encode_any(buf: bytearray, val: Any):
+    if val is None:
+        buf.append(0)
+    elif val is False:
+        buf.append(1)
+    elif val is True:
+        buf.append(2)
+    elif isinstance(val, int):
+        buf.append(3)
+        encode_int(buf, val)
+    elif isinstance(val, float):
+        buf.append(4)
+        encode_float(buf, val)
+    elif isinstance(val, str):
+        buf.append(5)
+        encode_str(buf, val)
+    elif isinstance(val, (bytes, bytearray)):
+        buf.append(6)
+        encode_bytes(buf, val)
+    elif isinstance(val, (list, tuple, set)):
+        buf.append({list: 7, tuple: 8}.get(type(val), 9))
+        write_uvarint(buf, len(val))
+        for elem in val:
+            encode_any(buf, elem)
+    elif isinstance(val, dict):
+        buf.append(10)
+        write_uvarint(buf, len(val))
+        for key, elem in val.items():
+            encode_any(buf, key)
+            encode_any(buf, elem)
+    else:
+        raise TypeError(f"Unable to encode {type(val)} without a schema")
+
+
+def decode_any(data: bytes, pos: int) -> Tuple[Any, int]:
+    tag = data[pos]
+    pos += 1
+
+    if tag < 3:
+        return (None, False, True)[tag], pos
+
+    if tag == 3:
+        return decode_int(data, pos)
+
+    if tag == 4:
+        return decode_float(data, pos)
+
+    if tag == 5:
+        return decode_str(data, pos)
+
+    if tag == 6:
+        return decode_bytes(data, pos)
+
+    if tag in (7, 8, 9):
+        size, pos = read_uvarint(data, pos)
+        elems = []
+        for _ in range(size):
+            elem, pos = decode_any(data, pos)
+            elems.append(elem)
+
+        return (list, tuple, set)[tag - 7](elems), pos
+
+    if tag == 10:
+        size, pos = read_uvarint(data, pos)
+        result = {}
+        for _ in range(size):
+            key, pos = decode_any(data, pos)
+            result[key], pos = decode_any(data, pos)
+
+        return result, pos
+
+    raise ValueError(f"Invalid binary tag {tag}")
+
+
+PRIMITIVES = {
+    bool: (encode_bool, decode_bool),
+    int: (encode_int, decode_int),
+    float: (encode_float, decode_float),
+    str: (encode_str, decode_str),
+    bytes: (encode_bytes, decode_bytes),
+}
+
+
+def compile_sequence(
+    kind: type, encode: Encoder, decode: Decoder
+) -> Tuple[Encoder, Decoder]:
+    def encode_sequence(buf: bytearray, val: Iterable[Any]):
+        write_uvarint(buf, len(val))
+        for elem in val:
+            encode(buf, elem)
+
+    def decode_sequence(data: bytes, pos: int) -> Tuple[Any, int]:
+        size, pos = read_uvarint(data, pos)
+        elems = []
+        for _ in range(size):
+            elem, pos = decode(data, pos)
+            elems.append(elem)
+
+        return elems if kind is list else kind(elems), pos
+
+    return encode_sequence, decode_sequence
+
+
+def compile_tuple(codecs: List[Tuple[Encoder, Decoder]]) -> Tuple[Encoder, Decoder]:
+    def encode_tuple(buf: bytearray, val: Tuple[Any, ...]):
+        if len(val) != len(codecs):
+            raise TypeError(f"Expect tuple of size {len(codecs)}, got {len(val)}")
+
+        for (encode, _), elem in zip(codecs, val):
+            encode(buf, elem)
+
+    def decode_tuple(data: bytes, pos: int) -> Tuple[Any, int]:
+        elems = []
+        for _, decode in codecs:
+            elem, pos = decode(data, pos)
+            elems.append(elem)
+
+        return tuple(elems), pos
+
+    return encode_tuple, decode_tuple
+
+
+def compile_dict(
+    key_codec: Tuple[Encoder, Decoder], val_codec: Tuple[Encoder, Decoder]
+) -> Tuple[Encoder, Decoder]:
+    encode_key, decode_key = key_codec
+    encode_val, decode_val = val_codec
+
+    def encode_dict(buf: bytearray, val: Mapping[Any, Any]):
+        write_uvarint(buf, len(val))
+        for key, elem in val.items():
+            encode_key(buf, key)
+            encode_val(buf, elem)
+
+    def decode_dict(data: bytes, pos: int) -> Tuple[Dict[Any, Any], int]:
+        size, pos = read_uvarint(data, pos)
+        result = {}
+        for _ in range(size):
+            key, pos = decode_key(data, pos)
+            result[key], pos = decode_val(data, pos)
+
+        return result, pos
+
+    return encode_dict, decode_dict
+
+
+def compile_union(
+    members: Tuple[Any, ...], validate: bool = False
+) -> Tuple[Encoder, Decoder]:
+    codecs = [
+        (None, None) if member is NoneType else compile_codec(member, validate)
+        for member in members
+    ]
+    checks = [compile_validator(member) for member in members]
+
+    def encode_union(buf: bytearray, val: Any):
+        for idx, (member, check, (encode, _)) in enumerate(
+            zip(members, checks, codecs)
+        ):
+            if member is NoneType:
+                if val is None:
+                    buf.append(idx)
+                    return
+            elif check(val):
+                buf.append(idx)
+                encode(buf, val)
+                return
+
+        raise TypeError(f"Unable to encode {type(val)} as Union{list(members)}")
+
+    def decode_union(data: bytes, pos: int) -> Tuple[Any, int]:
+        _, decode = codecs[data[pos]]
+        if decode is None:
+            return None, pos + 1
+
+        return decode(data, pos + 1)
+
+    return encode_union, decode_union
+
+
+def compile_optional(codec: Tuple[Encoder, Decoder]) -> Tuple[Encoder, Decoder]:
+    encode, decode = codec
+
+    def encode_optional(buf: bytearray, val: Any):
+        if val is None:
+            buf.append(0)
+        else:
+            buf.append(1)
+            encode(buf, val)
+
+    def decode_optional(data: bytes, pos: int) -> Tuple[Any, int]:
+        if not data[pos]:
+            return None, pos + 1
+
+        return decode(data, pos + 1)
+
+    return encode_optional, decode_optional
+
+
+_codecs: Dict[Any, Tuple[Encoder, Decoder]] = {}
+_records: Dict[Tuple[Type[Dataclass], bool], "RecordCodec"] = {}
+_pending: Dict[Tuple[Type[Dataclass], bool], "RecordCodec"] = {}
+_lock = RLock()
+
+
+def compile_codec(G: Any, validate: bool = False) -> Tuple[Encoder, Decoder]:
+    try:
+        codec = _codecs.get((G, id(G), validate))
+    except TypeError:
+        return _build_codec(G, validate)
+
+    if codec is None:
+        codec = _codecs[G, id(G), validate] = _build_codec(G, validate)
+
+    return codec
+
+
+def _build_codec(G: Any, validate: bool) -> Tuple[Encoder, Decoder]:
+    if G in PRIMITIVES:
+        return PRIMITIVES[G]
+
+    if isinstance(G, type) and issubclass(G, Dataclass):
+        record = get_record_codec(G, validate)
+        return record.encode_into, record.decode_from
+
+    origin = get_origin(G)
+    args = [arg for arg in get_args(G) if not isinstance(arg, TypeVar)]
+
+    if origin is Union:
+        members = tuple(arg for arg in args if arg is not NoneType)
+        if len(members) == 1 and len(members) < len(args):
+            return compile_optional(compile_codec(members[0], validate))
+
+        return compile_union(tuple(args), validate)
+
+    if origin in (list, set, frozenset) or origin is collections.abc.Sequence:
+        elem = compile_codec(args[0], validate) if args else (encode_any, decode_any)
+        return compile_sequence(
+            list if origin is collections.abc.Sequence else origin, *elem
+        )
+
+    if origin is tuple:
+        if not args:
+            return compile_sequence(tuple, encode_any, decode_any)
+
+        if len(args) == 2 and args[1] is Ellipsis:
+            return compile_sequence(tuple, *compile_codec(args[0], validate))
+
+        return compile_tuple([compile_codec(arg, validate) for arg in args])
+
+    if origin in (dict, collections.abc.Mapping):
+        if len(args) == 2:
+            return compile_dict(
+                compile_codec(args[0], validate), compile_codec(args[1], validate)
+            )
+
+    return encode_any, decode_any
+
+
+class RecordCodec:
+    def __init__(self, cls: Type[Dataclass], validate: bool = False):
+        self.cls = cls
+        self.validate = validate
+        self.entries: List[Tuple[str, Accessor, Encoder, Decoder]] = []
+        self.mask_size = 0
+        self.fingerprint = 0
+        self.has_build = hasattr(cls, "__build__")
+
+    def build(self):
+        schema = []
+        accessors = get_accessors_info(self.cls)
+        for key, field in get_fields_info(self.cls).items():
+            encode, decode = compile_codec(field.annotation, self.validate)
+            self.entries.append((key, accessors[key], encode, decode))
+            schema.append(f"{key}:{field.annotation}")
+
+        self.mask_size = (len(self.entries) + 7) // 8
+        self.fingerprint = zlib.crc32(
+            f"{self.cls.__qualname__}({','.join(schema)})".encode("utf-8")
+        )
+
+    def encode_into(self, buf: bytearray, obj: Dataclass):
+        if not isinstance(obj, self.cls):
+            raise TypeError(f"Unable to encode {type(obj)} as {self.cls.__name__}")
+
+        vals = [accessor.get_raw(obj) for _, accessor, _, _ in self.entries]
+
+        mask = nulls = 0
+        for idx, val in enumerate(vals):
+            if val is None:
+                nulls |= 1 << idx
+            elif val is not Ellipsis:
+                mask |= 1 << idx
+
+        buf += mask.to_bytes(self.mask_size, "little")
+        buf += nulls.to_bytes(self.mask_size, "little")
+        for (_, _, encode, _), val in zip(self.entries, vals):
+            if val is not None and val is not Ellipsis:
+                encode(buf, val)
+
+    def decode_from(self, data: bytes, pos: int) -> Tuple[Dataclass, int]:
+        end = pos + self.mask_size
+        mask = int.from_bytes(data[pos:end], "little")
+        nulls = int.from_bytes(data[end : end + self.mask_size], "little")
+        pos = end + self.mask_size
+
+        kwargs = {}
+        for key, _, _, decode in self.entries:
+            if mask & 1:
+                kwargs[key], pos = decode(data, pos)
+            elif nulls & 1:
+                kwargs[key] = None
+            mask >>= 1
+            nulls >>= 1
+
+        obj = build_raw(self.cls, kwargs, validate=self.validate)
+        if self.has_build:
+            obj.__build__(**kwargs)
+
+        return obj, pos
+
+
+def get_record_codec(cls: Type[Dataclass], validate: bool = False) -> RecordCodec:
+    record = _records.get((cls, validate))
+    if record is not None:
+        return record
+
+    with _lock:
+        record = _records.get((cls, validate)) or _pending.get((cls, validate))
+        if record is None:
+            record = _pending[cls, validate] = RecordCodec(cls, validate)
+            try:
+                record.build()
+                _records[cls, validate] = record
+            finally:
+                del _pending[cls, validate]
+
+    return record
+
+
+def encode_binary(obj: Dataclass) -> bytes:
+    buf = bytearray()
+    get_record_codec(type(obj)).encode_into(buf, obj)
+    return bytes(buf)
+
+
+def decode_binary(
+    cls: Type[Dataclass], data: bytes, validate: bool = False
+) -> Dataclass:
+    obj, pos = get_record_codec(cls, validate).decode_from(data, 0)
+    assert pos == len(data), f"Unexpected {len(data) - pos} trailing bytes"
+    return obj
+
+
+def dump_binary(
+    objs: Iterable[Dataclass],
+    target: Union[str, Path, IO[bytes]],
+    cls: Type[Dataclass] = None,
+    buffer_size: int = BUFFER_SIZE,
+):
+    if not hasattr(target, "write"):
+        if type(target) is not Path:
+            target = Path(target)
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with open(target, "wb") as fout:
+            return dump_binary(objs, fout, cls=cls, buffer_size=buffer_size)
+
+    iterator = iter(objs)
+    if cls is None:
+        first = next(iterator, None)
+        if first is None:
+            return
+
+        cls = type(first)
+        iterator = chain([first], iterator)
+
+    record = get_record_codec(cls)
+
+    buf = bytearray(MAGIC)
+    buf += record.fingerprint.to_bytes(4, "little")
+
+    chunk = bytearray()
+    for obj in iterator:
+        record.encode_into(chunk, obj)
+        write_uvarint(buf, len(chunk))
+        buf += chunk
+        chunk.clear()
+
+        if len(buf) >= buffer_size:
+            target.write(buf)
+            buf = bytearray()
+
+    if buf:
+        target.write(buf)
+
+
+def load_binary(
+    cls: Type[Dataclass],
+    source: Union[str, Path, IO[bytes]],
+    validate: bool = False,
+    buffer_size: int = BUFFER_SIZE,
+) -> Iterator[Dataclass]:
+    if not hasattr(source, "read"):
+        with open(source, "rb") as fin:
+            yield from load_binary(cls, fin, validate=validate, buffer_size=buffer_size)
+        return
+
+    record = get_record_codec(cls, validate)
+
+    header = source.read(8)
+    if not header:
+        return
+
+    assert header[:4] == MAGIC, f"Invalid binary stream header"
+    assert (
+        int.from_bytes(header[4:], "little") == record.fingerprint
+    ), f"Binary stream was not written with the schema of {cls.__name__}"
+
+    data, pos, eof = b"", 0, False
+    while True:
+        try:
+            size, start = read_uvarint(data, pos)
+            end = start + size
+            if end > len(data):
+                raise IndexError
+        except IndexError:
+            if eof:
+                assert pos == len(data), f"Truncated binary stream"
+                return
+
+            chunk = source.read(buffer_size)
+            eof = not chunk
+            data, pos = data[pos:] + chunk, 0
+            continue
+
+        obj, start = record.decode_from(data, start)
+        assert start == end, f"Corrupted binary record"
+        pos = end
+        yield obj
@@ -0,0 +1,433 @@
+from abc import ABC, abstractmethod
+from array import array
+from typing import *
+
+from .dataclass import Dataclass
+from .field import Field, get_fields_info
+from .parser import compile_parser
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+__all__ = ["DataclassArray"]
+
+
+class Column(ABC):
+    @abstractmethod
+    def append(self, val: Any):
+        pass
+
+    @abstractmethod
+    def take(self, indices: Sequence[int]) -> "Column":
+        pass
+
+    @abstractmethod
+    def export(self, copy: bool = False) -> Any:
+        pass
+
+    @abstractmethod
+    def truncate(self, size: int):
+        pass
+
+    @abstractmethod
+    def __getitem__(self, idx: int) -> Any:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @property
+    @abstractmethod
+    def nbytes(self) -> int:
+        pass
+
+
+class ArrayColumn(Column):
+    def __init__(self, typecode: str, dtype: str, values: array = None):
+        self.typecode = typecode
+        self.dtype = dtype
+        self.values = values if values is not None else array(typecode)
+        self.data = None
+        self.filled = 0
+
+    def append(self, val: Any):
+        try:
+            self.values.append(val)
+        except (TypeError, OverflowError):
+            assert False, f"Unable to store {type(val)} in a column of {self.dtype}"
+
+    def take(self, indices: Sequence[int]) -> "ArrayColumn":
+        values = array(self.typecode)
+        if np is not None:
+            indices = np.asarray(indices, dtype=np.intp)
+            values.frombytes(self.view()[indices].tobytes())
+        else:
+            values.extend(self[idx] for idx in indices)
+
+        return type(self)(self.typecode, self.dtype, values)
+
+    def truncate(self, size: int):
+        if size >= self.filled:
+            del self.values[size - self.filled :]
+            return
+
+        self.data = self.data[:size].copy()
+        self.filled = size
+        del self.values[:]
+
+    def export(self, copy: bool = False) -> Any:
+        if np is None:
+            return array(self.typecode, self.values)
+
+        view = self.view()
+        if copy:
+            return view.copy()
+
+        view.flags.writeable = False
+        return view
+
+    def view(self) -> Any:
+        if self.values:
+            self._flush()
+
+        if self.data is None:
+            return np.empty(0, dtype=self.dtype)
+
+        return self.data[: self.filled]
+
+    def _flush(self):
+        size = self.filled + len(self.values)
+        if self.data is None or len(self.data) < size:
+            data = np.empty(max(size, 2 * self.filled, 16), dtype=self.dtype)
+            if self.filled:
+                data[: self.filled] = self.data[: self.filled]
+            self.data = data
+
+        pending = np.frombuffer(self.values, dtype=self.dtype)
+        self.data[self.filled : size] = pending
+        del pending
+        del self.values[:]
+        self.filled = size
+
+    def __getitem__(self, idx: int) -> Any:
+        if idx < 0:
+            idx += len(self)
+
+        if idx < self.filled:
+            return self.data[idx].item()
+
+        return self.values[idx - self.filled]
+
+    def __len__(self) -> int:
+        return self.filled + len(self.values)
+
+    @property
+    def nbytes(self) -> int:
+        nbytes = self.values.itemsize * len(self.values)
+        if self.data is not None:
+            nbytes += self.data.nbytes
+
+        return nbytes
+
+
+class BoolColumn(ArrayColumn):
+    def __init__(self, typecode: str = "b", dtype: str = "bool", values: array = None):
+        super().__init__(typecode, dtype, values)
+
+    def append(self, val: Any):
+        assert isinstance(val, bool), f"Unable to store {type(val)} in a column of bool"
+        self.values.append(1 if val else 0)
+
+    def __getitem__(self, idx: int) -> bool:
+        return bool(super().__getitem__(idx))
+
+
+class StringColumn(Column):
+    def __init__(self, offsets: array = None, buffer: bytearray = None):
+        self.offsets = offsets if offsets is not None else array("q", [0])
+        self.buffer = buffer if buffer is not None else bytearray()
+
+    def append(self, val: Any):
+        assert isinstance(val, str), f"Unable to store {type(val)} in a column of str"
+        self.buffer += val.encode("utf-8")
+        self.offsets.append(len(self.buffer))
+
+    def take(self, indices: Sequence[int]) -> "StringColumn":
+        offsets = array("q", [0])
+        buffer = bytearray()
+
+        if np is not None:
+            indices = np.asarray(indices, dtype=np.intp)
+            bounds = np.frombuffer(self.offsets, dtype="int64")
+            starts = bounds[indices]
+            lengths = bounds[indices + 1] - starts
+            ends = np.cumsum(lengths)
+
+            positions = np.arange(ends[-1] if len(ends) else 0, dtype=np.int64)
+            positions += np.repeat(starts - (ends - lengths), lengths)
+            data = np.frombuffer(self.buffer, dtype="uint8")[positions]
+
+            offsets.frombytes(ends.astype("int64").tobytes())
+            buffer += data.tobytes()
+            return StringColumn(offsets, buffer)
+
+        for idx in indices:
+            buffer += self.buffer[self.offsets[idx] : self.offsets[idx + 1]]
+            offsets.append(len(buffer))
+
+        return StringColumn(offsets, buffer)
+
+    def truncate(self, size: int):
+        del self.offsets[size + 1 :]
+        del self.buffer[self.offsets[-1] :]
+
+    def export(self, copy: bool = False) -> Any:
+        if np is None:
+            return self.tolist()
+
+        return np.array(self.tolist(), dtype=str)
+
+    def tolist(self) -> List[str]:
+        return [self[idx] for idx in range(len(self))]
+
+    def __getitem__(self, idx: int) -> str:
+        start, end = self.offsets[idx], self.offsets[idx + 1]
+        return self.buffer[start:end].decode("utf-8")
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def nbytes(self) -> int:
+        return self.offsets.itemsize * len(self.offsets) + len(self.buffer)
+
+
+class ObjectColumn(Column):
+    def __init__(self, values: List[Any] = None):
+        self.values = values if values is not None else []
+
+    def append(self, val: Any):
+        self.values.append(val)
+
+    def take(self, indices: Sequence[int]) -> "ObjectColumn":
+        return ObjectColumn([self.values[idx] for idx in indices])
+
+    def truncate(self, size: int):
+        del self.values[size:]
+
+    def export(self, copy: bool = False) -> Any:
+        if np is None:
+            return list(self.values)
+
+        values = np.empty(len(self.values), dtype=object)
+        values[:] = self.values
+        return values
+
+    def tolist(self) -> List[Any]:
+        return list(self.values)
+
+    def __getitem__(self, idx: int) -> Any:
+        return self.values[idx]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def nbytes(self) -> int:
+        return 8 * len(self.values)
+
+
+class Schema(NamedTuple):
+    cls: Type[Dataclass]
+    entries: List[Tuple[str, str, Field, Callable[[Any], Any], Any]]
+
+
+def _create_column(field: Field) -> Column:
+    if field.default is None:
+        return ObjectColumn()
+
+    if field.annotation is bool:
+        return BoolColumn()
+
+    if field.annotation is int:
+        return ArrayColumn("q", "int64")
+
+    if field.annotation is float:
+        return ArrayColumn("d", "float64")
+
+    if field.annotation is str:
+        return StringColumn()
+
+    return ObjectColumn()
+
+
+def _build_schema(
+    cls: Type[Dataclass], columns: Dict[str, Column], prefix: str = ""
+) -> Schema:
+    entries = []
+    for key, field in get_fields_info(cls).items():
+        name = field.alias if field.alias is not None else key
+        path = prefix + key
+        annotation = field.annotation
+
+        if (
+            isinstance(annotation, type)
+            and issubclass(annotation, Dataclass)
+            and field.default is not None
+        ):
+            child = _build_schema(annotation, columns, prefix=path + ".")
+            entries.append((key, name, field, None, child))
+            continue
+
+        columns[path] = _create_column(field)
+        entries.append((key, name, field, compile_parser(annotation), path))
+
+    return Schema(cls, entries)
+
+
+class DataclassArray:
+    def __init__(self, cls: Type[Dataclass], records: Iterable[Any] = None):
+        self.cls = cls
+        self.columns: Dict[str, Column] = {}
+        self.schema = _build_schema(cls, self.columns)
+        self.size = 0
+
+        if records is not None:
+            self.extend(records)
+
+    def append(self, record: Union[Dataclass, Mapping[str, Any]]):
+        try:
+            self._append(self.schema, record)
+        except Exception:
+            for column in self.columns.values():
+                column.truncate(self.size)
+            raise
+
+        self.size += 1
+
+    def extend(self, records: Iterable[Union[Dataclass, Mapping[str, Any]]]):
+        for record in records:
+            self.append(record)
+
+    def _append(self, schema: Schema, record: Any):
+        if isinstance(record, Dataclass):
+            for key, name, field, parse_field, target in schema.entries:
+                val = getattr(record, key)
+                if parse_field is None:
+                    self._append(target, val)
+                else:
+                    self.columns[target].append(val)
+            return
+
+        assert isinstance(
+            record, Mapping
+        ), f"Unable to store {type(record)} as {schema.cls.__name__}"
+
+        for key, name, field, parse_field, target in schema.entries:
+            if name in record or key in record:
+                val = record[name] if name in record else record[key]
+                if parse_field is not None:
+                    val = parse_field(val)
+            elif field.factory is not None:
+                val = field.factory()
+            else:
+                assert field.default is not Ellipsis, f"Missing value for {key}"
+                val = field.default
+
+            if parse_field is None:
+                self._append(target, val)
+            else:
+                self.columns[target].append(val)
+
+    def _build_row(self, schema: Schema, idx: int) -> Dataclass:
+        data = {}
+        for key, name, field, parse_field, target in schema.entries:
+            if parse_field is None:
+                data[key] = self._build_row(target, idx)
+            else:
+                data[key] = self.columns[target][idx]
+
+        return schema.cls(**data)
+
+    def _from_columns(self, columns: Dict[str, Column], size: int) -> "DataclassArray":
+        result = type(self).__new__(type(self))
+        result.cls = self.cls
+        result.columns = columns
+        result.schema = self.schema
+        result.size = size
+        return result
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[Dataclass]:
+        for idx in range(self.size):
+            yield self._build_row(self.schema, idx)
+
+    def __getitem__(self, key: Union[int, str, slice, Sequence[int]]) -> Any:
+        if isinstance(key, str):
+            return self.columns[key].export()
+
+        if isinstance(key, slice):
+            return self.take(range(*key.indices(self.size)))
+
+        if isinstance(key, int) or (np is not None and isinstance(key, np.integer)):
+            if key < 0:
+                key += self.size
+
+            if not 0 <= key < self.size:
+                raise IndexError("DataclassArray index out of range")
+
+            return self._build_row(self.schema, int(key))
+
+        return self.take(key)
+
+    def __repr__(self) -> str:
+        return f"DataclassArray[{self.cls.__name__}](size={self.size})"
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self.columns.values())
+
+    def export(self, copy: bool = False) -> Dict[str, Any]:
+        return {name: column.export(copy) for name, column in self.columns.items()}
+
+    def take(self, indices: Sequence[int]) -> "DataclassArray":
+        indices = list(indices) if np is None else np.asarray(indices, dtype=np.intp)
+        columns = {name: column.take(indices) for name, column in self.columns.items()}
+        return self._from_columns(columns, len(indices))
+
+    def filter(self, mask: Sequence[bool]) -> "DataclassArray":
+        assert len(mask) == self.size, f"Mask size mismatch"
+        if np is not None:
+            return self.take(np.flatnonzero(np.asarray(mask, dtype=bool)))
+
+        return self.take([idx for idx, keep in enumerate(mask) if keep])
+
+    def sort(self, *keys: str, reverse: bool = False) -> "DataclassArray":
+        assert keys, f"Require at least one column to sort by"
+        columns = [self.columns[key] for key in keys]
+
+        if np is not None:
+            arrays = [
+                (
+                    np.asarray(column.tolist())
+                    if isinstance(column, (StringColumn, ObjectColumn))
+                    else column.view()
+                )
+                for column in columns
+            ]
+            indices = np.lexsort(arrays[::-1])
+        else:
+            indices = sorted(
+                range(self.size),
+                key=lambda idx: tuple(column[idx] for column in columns),
+            )
+
+        if reverse:
+            indices = indices[::-1]
+
+        return self.take(indices)
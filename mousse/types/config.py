@@ -1,36 +1,36 @@
 import asyncio
-import json
+import hashlib
 import logging
+import os
 import time
 from datetime import timedelta
-from functools import lru_cache
+from functools import lru_cache, partial
 from pathlib import Path
-from threading import Thread
 from typing import *
 from typing import Callable
+from threading import Lock
 
-from dialga import call_after
-from yaml import Loader, load
-
-from .accessor import Accessor
-from .dataclass import Dataclass
-from .parser import asclass, parse, parser
+from .accessor import Accessor, remove_accessor_info
+from .backend import get_backend, load
+from .dataclass import Dataclass, ReadOnlyFieldException
+from .field import remove_field_info
+from .parser import asclass, asdict, parse, parser
+from .scheduler import Watch, WatchScheduler, get_scheduler
 
 NoneType = type(None)
 
-__all__ = ["get_config", "load_config", "watch", "watch_async", "Config"]
-
-
-def load_yaml(stream: Any) -> Dict[str, Any]:
-    return load(stream, Loader=Loader) or {}
-
-
-LOADER = {".json": json.load, ".yaml": load_yaml, ".yml": load_yaml}
-
-
-class ReadOnlyFieldException(Exception):
-    def __init__(self, key: str):
-        super().__init__(f"Field `{key}` is readonly")
+__all__ = [
+    "get_config",
+    "load_config",
+    "watch",
+    "watch_async",
+    "watch_file",
+    "Config",
+    "ConfigSnapshot",
+    "ConfigStore",
+    "ConfigView",
+    "FileSource",
+]
 
 
 class ConfigMetadata(Dataclass, dynamic=True):
@@ -50,65 +50,180 @@ class ConfigAccessor(Accessor):
     def __get__(self, obj: Any):
         return self.val
 
+    def get_raw(self, obj: Any) -> Any:
+        return self.__get__(obj)
+
+    def set_raw(self, obj: Any, val: Any):
+        self.__set__(obj, val)
+
 
 class Config(Dataclass, dynamic=True, accessor=ConfigAccessor):
-    pass
+    def __del__(self):
+        _metadata.pop(id(self), None)
+
+
+_metadata: Dict[int, Dict[str, ConfigMetadata]] = {}
 
 
-@lru_cache(maxsize=None)
 def _get_metadata(obj: Any, key: str) -> ConfigMetadata:
-    return ConfigMetadata()
+    metadata = _metadata.setdefault(id(obj), {})
+    if key not in metadata:
+        metadata[key] = ConfigMetadata()
+
+    return metadata[key]
+
+
+class ConfigView:
+    __slots__ = ("__dict__", "_paths", "_prefix")
+
+    def __init__(self, config: Config):
+        object.__setattr__(self, "_paths", {})
+        object.__setattr__(self, "_prefix", "")
+        self._fill(config)
+
+    def __getitem__(self, path: str) -> Any:
+        return self._paths[self._prefix + path]
+
+    def __contains__(self, path: str) -> bool:
+        return self._prefix + path in self._paths
+
+    def get(self, path: str, default: Any = None) -> Any:
+        return self._paths.get(self._prefix + path, default)
+
+    def __setattr__(self, key: str, val: Any):
+        raise ReadOnlyFieldException(key)
+
+    def __delattr__(self, key: str):
+        raise ReadOnlyFieldException(key)
+
+    def __iter__(self):
+        return iter(self.__dict__.items())
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={val!r}" for key, val in self.__dict__.items())
+        return f"ConfigView({fields})"
+
+    def _fill(self, config: Config):
+        for key, val in config:
+            self.__dict__[key] = self._build(val, self._prefix + str(key))
+
+    def _build(self, val: Any, path: str) -> Any:
+        if isinstance(val, Config):
+            view = ConfigView.__new__(ConfigView)
+            object.__setattr__(view, "_paths", self._paths)
+            object.__setattr__(view, "_prefix", path + ".")
+            view._fill(val)
+            val = view
+        elif isinstance(val, tuple):
+            val = tuple(
+                self._build(elem, f"{path}.{idx}") for idx, elem in enumerate(val)
+            )
+
+        self._paths[path] = val
+        return val
+
+
+class ConfigSnapshot(NamedTuple):
+    version: int
+    config: Config
+    timestamp: float
+    view: ConfigView
+
+
+class ConfigStore:
+    def __init__(self, config: Any = None):
+        if not isinstance(config, Config):
+            config = parse(Config, config or {})
+
+        self.lock = Lock()
+        self.current = ConfigSnapshot(0, config, time.time(), ConfigView(config))
+
+    @property
+    def config(self) -> Config:
+        return self.current.config
+
+    @property
+    def version(self) -> int:
+        return self.current.version
+
+    @property
+    def view(self) -> ConfigView:
+        return self.current.view
+
+    def snapshot(self) -> ConfigSnapshot:
+        return self.current
+
+    def publish(self, data: Mapping[str, Any]) -> ConfigSnapshot:
+        with self.lock:
+            return self._commit(diff_config(asdict(self.current.config), data))
+
+    def apply(self, changes: List[Tuple["KeyPath", Any]]) -> ConfigSnapshot:
+        with self.lock:
+            return self._commit(changes)
+
+    def _commit(self, changes: List[Tuple["KeyPath", Any]]) -> ConfigSnapshot:
+        current = self.current
+        if not changes:
+            return current
+
+        config = rebuild(current.config, changes)
+        snapshot = ConfigSnapshot(
+            current.version + 1, config, time.time(), ConfigView(config)
+        )
+        self.current = snapshot
+        return snapshot
 
 
 async def watch_async(
-    config: Config,
+    config: Union[Config, ConfigStore],
     loop: asyncio.AbstractEventLoop,
     emitter: Callable,
     refresh: bool = True,
     logger: Optional[logging.Logger] = None,
+    scheduler: Optional[WatchScheduler] = None,
     **timedetail,
-):
-
-    if not asyncio.iscoroutinefunction(emitter):
-        emitter = asyncio.coroutine(emitter)
+) -> Optional[Watch]:
+    source = EmitterSource(emitter)
 
-    @call_after(loop, repeated=refresh, **timedetail)
-    async def observer(ignore_exception: bool = True):
-        try:
+    async def reload():
+        if asyncio.iscoroutinefunction(emitter):
             data = await emitter()
-            update(config, **data)
-        except Exception as e:
-            if not ignore_exception:
-                raise e
+        else:
+            data = emitter()
+
+        source.apply(config, data)
 
-            if logger:
-                logger.error(e)
+    await reload()
+    if not refresh:
+        return None
 
-    await observer(ignore_exception=False)
-    observer.promise(ignore_exception=True)
+    def observer():
+        if loop.is_closed():
+            task.cancel()
+            return
+
+        return asyncio.run_coroutine_threadsafe(reload(), loop)
+
+    timestamp = timedelta(**timedetail).total_seconds()
+    scheduler = scheduler or get_scheduler()
+    task = scheduler.add(observer, timestamp, logger=logger)
+    return task
 
 
 def watch(
-    config: Config,
+    config: Union[Config, ConfigStore],
     emitter: Callable,
     logger: Optional[logging.Logger] = None,
+    scheduler: Optional[WatchScheduler] = None,
     **timedetail,
-):
+) -> Watch:
     timestamp = timedelta(**timedetail).total_seconds()
 
-    def observer():
-        while True:
-            time.sleep(timestamp)
-            try:
-                update(config, **emitter())
-            except Exception as e:
-                if logger:
-                    logger.error(e)
+    source = EmitterSource(emitter)
+    source.reload(config)
 
-    update(config, **emitter())
-    task = Thread(target=observer)
-    task.daemon = True
-    task.start()
+    scheduler = scheduler or get_scheduler()
+    return scheduler.add(partial(source.reload, config), timestamp, logger=logger)
 
 
 def update(config: Config, **kwargs):
@@ -116,6 +231,183 @@ def update(config: Config, **kwargs):
         setattr(config, key, val)
 
 
+DELETED = object()
+
+KeyPath = Tuple[str, ...]
+
+
+class EmitterSource:
+    def __init__(self, emitter: Callable[[], Mapping[str, Any]]):
+        self.emitter = emitter
+        self.data = None
+
+    def reload(self, config: Union[Config, ConfigStore]) -> List[Tuple[KeyPath, Any]]:
+        return self.apply(config, self.emitter())
+
+    def apply(
+        self, config: Union[Config, ConfigStore], data: Mapping[str, Any]
+    ) -> List[Tuple[KeyPath, Any]]:
+        if self.data is None:
+            base = config.config if isinstance(config, ConfigStore) else config
+            changes = diff_config(asdict(base), data, deletes=False)
+        else:
+            changes = diff_config(self.data, data)
+
+        if isinstance(config, ConfigStore):
+            config.apply(changes)
+        else:
+            apply_changes(config, changes)
+        self.data = data
+        return changes
+
+
+class FileSource(EmitterSource):
+    def __init__(self, path: Union[str, Path]):
+        super().__init__(self.read)
+        self.path = Path(path).resolve()
+        self.codec = get_backend(self.path.suffix)
+        self.signature = None
+        self.digest = None
+        self.pending = None
+        self.raw = None
+
+    def poll(self) -> bool:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        if signature == self.signature:
+            return False
+
+        raw = self.path.read_bytes()
+        digest = hashlib.blake2b(raw, digest_size=16).digest()
+        if digest == self.digest:
+            self.signature = signature
+            return False
+
+        self.pending = (signature, digest)
+        self.raw = raw
+        return True
+
+    def read(self) -> Any:
+        raw = self.raw if self.codec.binary else self.raw.decode("utf-8")
+        return self.codec.loads(raw) or {}
+
+    def reload(self, config: Union[Config, ConfigStore]) -> List[Tuple[KeyPath, Any]]:
+        if not self.poll():
+            return []
+
+        changes = super().reload(config)
+        self.signature, self.digest = self.pending
+        return changes
+
+
+def diff_config(
+    old: Any, new: Any, path: KeyPath = (), deletes: bool = True
+) -> List[Tuple[KeyPath, Any]]:
+    if isinstance(old, Mapping) and isinstance(new, Mapping):
+        changes = []
+        for key, val in new.items():
+            if key in old:
+                changes.extend(diff_config(old[key], val, (*path, key), deletes))
+            else:
+                changes.append(((*path, key), val))
+
+        if deletes:
+            for key in old:
+                if key not in new:
+                    changes.append(((*path, key), DELETED))
+
+        return changes
+
+    if isinstance(old, (list, tuple)) and isinstance(new, (list, tuple)):
+        if len(old) == len(new) and not any(
+            diff_config(prev, curr, deletes=deletes) for prev, curr in zip(old, new)
+        ):
+            return []
+
+        return [(path, new)]
+
+    if type(old) is type(new) and old == new:
+        return []
+
+    return [(path, new)]
+
+
+def apply_changes(config: Config, changes: List[Tuple[KeyPath, Any]]):
+    for path, val in changes:
+        if not path:
+            continue
+
+        *parents, key = path
+        node = config
+        for name in parents:
+            node = getattr(node, name)
+
+        if val is DELETED:
+            discard(node, key)
+        else:
+            assign(node, key, val)
+
+
+def rebuild(config: Config, changes: List[Tuple[KeyPath, Any]]) -> Config:
+    replaced = {}
+    nested = {}
+    for path, val in changes:
+        if not path:
+            continue
+
+        key, *rest = path
+        if rest:
+            nested.setdefault(key, []).append((tuple(rest), val))
+        else:
+            replaced[key] = val
+
+    data = dict(config)
+    for key, val in replaced.items():
+        if val is DELETED:
+            data.pop(key, None)
+        else:
+            data[key] = val
+
+    for key, sub in nested.items():
+        data[key] = rebuild(data[key], sub)
+
+    return Config(**data)
+
+
+def assign(config: Config, key: str, val: Any):
+    _get_metadata(config, key).readonly = False
+    setattr(config, key, val)
+
+
+def discard(config: Config, key: str):
+    remove_accessor_info(config, key)
+    remove_field_info(config, key)
+    _metadata.get(id(config), {}).pop(key, None)
+    config.__dict__.pop(key, None)
+
+
+def watch_file(
+    config: Union[Config, ConfigStore],
+    path: Union[str, Path],
+    logger: Optional[logging.Logger] = None,
+    scheduler: Optional[WatchScheduler] = None,
+    **timedetail,
+) -> Watch:
+    timestamp = timedelta(**timedetail).total_seconds() or 1.0
+
+    source = FileSource(path)
+    source.reload(config)
+
+    scheduler = scheduler or get_scheduler()
+    return scheduler.add(
+        partial(source.reload, config), timestamp, logger=logger, path=source.path
+    )
+
+
 def freeze(config: Any):
     if isinstance(config, tuple):
         for elem in config:
@@ -172,15 +464,7 @@ def __load_config(key: str, path: Union[str, Path, NoneType] = None):
     params = {}
 
     if path:
-        if type(path) is str:
-            path = Path(path)
-
-        with open(path, encoding="utf-8") as f:
-            loader = LOADER.get(path.suffix)
-            if loader is None:
-                raise Exception(f"file format {path.suffix} is not supported")
-
-            params = loader(f)
+        params = load(path)
 
     if key is not None:
         config = get_config(key)
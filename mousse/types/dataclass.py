@@ -1,11 +1,48 @@
 from copy import copy, deepcopy
+from enum import Enum
+from functools import lru_cache
 from inspect import Parameter, Signature
 from typing import *
+from weakref import WeakValueDictionary
 
-from .accessor import Accessor, get_accessors_info
-from .field import Field, get_fields_info
+from .accessor import (
+    Accessor,
+    add_accessor_info,
+    get_accessors_info,
+    remove_accessors_info,
+    get_changes,
+    remove_pending,
+    remove_tracking,
+    reset_changes,
+    tracked,
+)
+from .field import Field, add_field_info, get_fields_info, remove_fields_info
 
-__all__ = ["Dataclass", "DataMetaclass"]
+__all__ = [
+    "Dataclass",
+    "DataMetaclass",
+    "ReadOnlyFieldException",
+    "changed_fields",
+    "clear_changes",
+    "intern",
+    "replace",
+]
+
+IMMUTABLES = {str, int, float, bool, complex, bytes, frozenset, range, type(None)}
+
+
+_hashes: Dict[int, int] = {}
+_interned: "WeakValueDictionary[Tuple[Any, ...], Any]" = WeakValueDictionary()
+
+
+class ReadOnlyFieldException(Exception):
+    def __init__(self, key: str):
+        super().__init__(f"Field `{key}` is readonly")
+
+
+@lru_cache(maxsize=None)
+def get_options(cls: Any) -> Dict[str, Any]:
+    return {}
 
 
 class DataMetaclass(type):
@@ -17,15 +54,42 @@ class DataMetaclass(type):
         accessor: Type[Accessor] = Accessor,
         strict: int = 0,
         dynamic: bool = False,
+        validate_on_unpickle: bool = None,
+        frozen: bool = None,
+        intern: bool = None,
+        track_changes: bool = None,
     ):
         parameters = [Parameter("self", Parameter.POSITIONAL_ONLY)]
         defaults = []
         fields = {}
         accessors = {}
+        options = {}
 
         for base in bases[::-1]:
             if issubclass(base, Dataclass):
                 accessors.update(get_accessors_info(base))
+                options.update(get_options(base))
+
+        if validate_on_unpickle is not None:
+            options["validate_on_unpickle"] = validate_on_unpickle
+
+        if frozen is not None:
+            options["frozen"] = frozen
+
+        if intern is not None:
+            options["intern"] = intern
+
+        if track_changes is not None:
+            options["track_changes"] = track_changes
+
+        options["dynamic"] = dynamic
+
+        frozen = options.get("frozen", False)
+        assert not (frozen and dynamic), f"A frozen Dataclass cannot be dynamic"
+        assert frozen or not options.get(
+            "intern"
+        ), f"Only a frozen Dataclass can be interned"
+        track_changes = options.get("track_changes", False)
 
         if "__annotations__" in data:
             annotations = data.pop("__annotations__")
@@ -60,10 +124,20 @@ class DataMetaclass(type):
                 )
                 defaults.append(default_val)
 
+        custom_del = data.get("__del__")
+        if custom_del is None:
+            for base in bases:
+                inherited = getattr(base, "__del__", None)
+                if inherited is not None:
+                    custom_del = getattr(inherited, "custom_del", inherited)
+                    break
+
         def __init__(self, *args, **kwargs):
             fields = get_fields_info(self.__class__, self)
             for key, val in kwargs.items():
-                if key in fields or dynamic:
+                if key in accessors:
+                    object.__setattr__(self, key, val)
+                elif key in fields or dynamic:
                     setattr(self, key, val)
 
             for key, val in accessors.items():
@@ -72,8 +146,17 @@ class DataMetaclass(type):
             if hasattr(self, "__build__"):
                 self.__build__(*args, **kwargs)
 
+            if track_changes:
+                reset_changes(self)
+
         def __setattr__(self, key: str, val: Any):
+            if frozen:
+                raise ReadOnlyFieldException(key)
+
             fields = get_fields_info(self.__class__, self)
+            if key in fields and fields[key].freeze:
+                raise ReadOnlyFieldException(key)
+
             accessors = get_accessors_info(self.__class__, self)
             if key not in fields and dynamic:
                 dtype = type(val)
@@ -82,10 +165,13 @@ class DataMetaclass(type):
                 field.annotation = dtype
                 field.private = key.startswith("_")
                 field.strict = strict
-                fields[key] = field
+                add_field_info(self, key, field)
 
-                accessors[key] = accessor(key, field=field)
-                object.__setattr__(self, key, accessors[key])
+                custom = accessor(key, field=field)
+                add_accessor_info(self, key, custom)
+                object.__setattr__(self, key, custom)
+                custom.__set__(self, val)
+                return
 
             accessors[key].__set__(self, val)
 
@@ -101,17 +187,8 @@ class DataMetaclass(type):
 
         def __copy__(self):
             cls = self.__class__
-
             result = cls.__new__(cls)
-            result.__dict__.update(self.__dict__)
-
-            fields = get_fields_info(cls, result)
-            fields.update(get_fields_info(cls, self))
-
-            for key in fields:
-                val = getattr(self, key)
-                setattr(result, key, copy(val))
-
+            copy_fields(self, result, copy)
             return result
 
         def __deepcopy__(self, memo: Dict[int, Any]):
@@ -119,24 +196,92 @@ class DataMetaclass(type):
             result = cls.__new__(cls)
             memo[id(self)] = result
 
-            for k, v in self.__dict__.items():
-                setattr(result, k, deepcopy(v, memo))
+            def copy_val(val: Any) -> Any:
+                if is_immutable(val):
+                    return val
 
-            fields = get_fields_info(cls, result)
-            fields.update(get_fields_info(cls, self))
-
-            for key in fields:
-                val = getattr(self, key)
-                setattr(result, key, deepcopy(val))
+                return deepcopy(val, memo)
 
+            copy_fields(self, result, copy_val, copy_extra=copy_val)
             return result
 
+        def __eq__(self, other: Any) -> bool:
+            if type(other) is not type(self):
+                return NotImplemented
+
+            for accessor in accessors.values():
+                if accessor.get_raw(self) != accessor.get_raw(other):
+                    return False
+
+            return True
+
+        def __hash__(self) -> int:
+            val = _hashes.get(id(self))
+            if val is None:
+                val = _hashes[id(self)] = hash(
+                    (
+                        type(self),
+                        *[accessor.get_raw(self) for accessor in accessors.values()],
+                    )
+                )
+
+            return val
+
+        def __del__(self):
+            if custom_del is not None:
+                custom_del(self)
+
+            if frozen:
+                _hashes.pop(id(self), None)
+
+            for val in get_accessors_info(type(self), self).values():
+                val.release(self)
+
+            remove_accessors_info(self)
+            remove_fields_info(self)
+            remove_pending(self)
+
+            if track_changes:
+                remove_tracking(self)
+
         def __getstate__(self):
             from .parser import asdict
 
             return asdict(self)
 
-        def __setstate__(self, state: Dict[str, Any]):
+        def __reduce__(self):
+            cls = type(self)
+            accessors = get_accessors_info(cls)
+            values = tuple([accessor.get_raw(self) for accessor in accessors.values()])
+
+            customs = get_accessors_info(cls, self)
+            extra = {
+                key: val
+                for key, val in object.__getattribute__(self, "__dict__").items()
+                if key not in customs
+            }
+            dynamic = {}
+            if customs is not accessors:
+                for key in customs:
+                    if key not in accessors:
+                        dynamic[key] = getattr(self, key)
+
+            if extra or dynamic:
+                return restore, (cls, values), (extra, dynamic)
+
+            return restore, (cls, values)
+
+        def __setstate__(self, state: Union[Tuple[dict, dict], Dict[str, Any]]):
+            if isinstance(state, tuple):
+                extra, dynamic = state
+                for key, val in extra.items():
+                    object.__setattr__(self, key, val)
+
+                for key, val in dynamic.items():
+                    setattr(self, key, val)
+
+                return
+
             from .parser import asclass
 
             new = asclass(self.__class__, state)
@@ -168,11 +313,18 @@ class DataMetaclass(type):
         data["__getattribute__"] = __getattr__
         data["__copy__"] = __copy__
         data["__deepcopy__"] = __deepcopy__
+        __del__.custom_del = custom_del
+        data["__del__"] = __del__
         data["__getstate__"] = __getstate__
+        data["__reduce__"] = __reduce__
         data["__setstate__"] = __setstate__
         data["__iter__"] = __iter__
         data["__repr__"] = __repr__
 
+        if frozen:
+            data["__eq__"] = __eq__
+            data["__hash__"] = __hash__
+
         cls = super().__new__(cls, name, bases, data)
         fields_info = get_fields_info(cls)
 
@@ -183,8 +335,151 @@ class DataMetaclass(type):
         fields_info.update(fields)
 
         get_accessors_info(cls).update(accessors)
+        get_options(cls).update(options)
+
+        if track_changes:
+            tracked.add(cls)
+
         return cls
 
+    def __call__(cls, *args, **kwargs):
+        obj = super().__call__(*args, **kwargs)
+        if get_options(cls).get("intern"):
+            return intern(obj)
+
+        return obj
+
 
 class Dataclass(metaclass=DataMetaclass):
     pass
+
+
+def build_raw(
+    cls: Type[Dataclass], values: Mapping[str, Any], validate: bool = False
+) -> Dataclass:
+    obj = cls.__new__(cls)
+    accessors = get_accessors_info(cls)
+    for key, val in values.items():
+        accessors[key].set_raw(obj, val)
+
+    if validate:
+        for key, accessor in accessors.items():
+            accessor.validate(obj, getattr(obj, key))
+
+    if get_options(cls).get("intern"):
+        return intern(obj)
+
+    return obj
+
+
+def restore(cls: Type[Dataclass], values: Tuple[Any, ...]) -> Dataclass:
+    obj = cls.__new__(cls)
+    accessors = get_accessors_info(cls)
+    assert len(values) == len(
+        accessors
+    ), f"Pickled {cls.__name__} does not match its current fields"
+
+    for accessor, val in zip(accessors.values(), values):
+        accessor.set_raw(obj, val)
+
+    options = get_options(cls)
+    if options.get("validate_on_unpickle"):
+        for key, accessor in accessors.items():
+            accessor.validate(obj, getattr(obj, key))
+
+    if options.get("intern"):
+        return intern(obj)
+
+    return obj
+
+
+def is_immutable(val: Any) -> bool:
+    if type(val) in IMMUTABLES or val is Ellipsis:
+        return True
+
+    if type(val) is tuple:
+        return all(map(is_immutable, val))
+
+    if isinstance(val, Dataclass):
+        return get_options(type(val)).get("frozen", False)
+
+    return isinstance(val, Enum)
+
+
+def _identity(val: Any) -> Any:
+    return val
+
+
+def copy_fields(
+    src: Dataclass,
+    dst: Dataclass,
+    copy_val: Callable[[Any], Any] = _identity,
+    copy_extra: Callable[[Any], Any] = _identity,
+    skip: Container[str] = (),
+):
+    cls = type(src)
+    accessors = get_accessors_info(cls)
+    customs = get_accessors_info(cls, src)
+
+    for key, val in object.__getattribute__(src, "__dict__").items():
+        if key not in customs:
+            object.__setattr__(dst, key, copy_extra(val))
+
+    for key, accessor in accessors.items():
+        if key not in skip:
+            accessor.set_raw(dst, copy_val(accessor.get_raw(src)))
+
+    if customs is not accessors:
+        for key in customs:
+            if key not in accessors and key not in skip:
+                setattr(dst, key, copy_val(getattr(src, key)))
+
+
+def replace(obj: Dataclass, **changes: Any) -> Dataclass:
+    cls = type(obj)
+    result = cls.__new__(cls)
+    copy_fields(obj, result, skip=changes)
+
+    accessors = get_accessors_info(cls)
+    for key, val in changes.items():
+        if key in accessors:
+            accessors[key].__set__(result, val)
+        else:
+            setattr(result, key, val)
+
+    return intern(result) if get_options(cls).get("intern") else result
+
+
+def intern(obj: Dataclass) -> Dataclass:
+    cls = type(obj)
+    assert get_options(cls).get("frozen"), f"Only a frozen Dataclass can be interned"
+
+    key = (
+        cls,
+        *[accessor.get_raw(obj) for accessor in get_accessors_info(cls).values()],
+    )
+    return _interned.setdefault(key, obj)
+
+
+def changed_fields(obj: Dataclass) -> Set[str]:
+    return set(get_changes(obj))
+
+
+def clear_changes(obj: Dataclass, recursive: bool = True):
+    reset_changes(obj)
+    if not recursive:
+        return
+
+    for key, val in obj:
+        _clear_nested(val)
+
+
+def _clear_nested(val: Any):
+    if type(val) in tracked:
+        clear_changes(val)
+    elif isinstance(val, (list, tuple, set, frozenset)):
+        for elem in val:
+            _clear_nested(elem)
+    elif isinstance(val, dict):
+        for elem in val.values():
+            _clear_nested(elem)
@@ -0,0 +1,211 @@
+from typing import *
+
+from .dataclass import Dataclass, replace
+from .field import get_fields_info
+from .parser import asdict, parse
+from .types import get_args, get_origin
+
+__all__ = ["diff", "patch"]
+
+SET = "="
+DELETE = "-"
+INSERT = "+"
+NESTED = "~"
+ITEMS = "["
+ENTRIES = "{"
+
+Change = Dict[str, Any]
+
+
+def diff(old: Dataclass, new: Dataclass) -> Dict[str, Change]:
+    assert type(old) is type(
+        new
+    ), f"Unable to diff {type(old).__name__} against {type(new).__name__}"
+
+    delta = {}
+    old_fields = get_fields_info(type(old), old)
+    for key in get_fields_info(type(new), new):
+        val = getattr(new, key)
+        if key not in old_fields:
+            delta[key] = {SET: _encode(val)}
+            continue
+
+        change = _diff_value(getattr(old, key), val)
+        if change is not None:
+            delta[key] = change
+
+    return delta
+
+
+def patch(obj: Dataclass, delta: Mapping[str, Change]) -> Dataclass:
+    fields = get_fields_info(type(obj), obj)
+
+    changes = {}
+    for key, change in delta.items():
+        if key in fields:
+            changes[key] = _patch_value(
+                fields[key].annotation, getattr(obj, key), change
+            )
+        else:
+            changes[key] = _patch_value(Any, None, change)
+
+    return replace(obj, **changes)
+
+
+def _diff_value(old: Any, new: Any) -> Optional[Change]:
+    if old is new:
+        return None
+
+    if type(old) is not type(new):
+        return {SET: _encode(new)}
+
+    if isinstance(new, Dataclass):
+        delta = diff(old, new)
+        return {NESTED: delta} if delta else None
+
+    if type(new) in (list, tuple):
+        edits = _diff_items(old, new)
+        return {ITEMS: edits} if edits else None
+
+    if type(new) is dict:
+        edits = {}
+        for key, val in new.items():
+            if key not in old:
+                edits[key] = {SET: _encode(val)}
+                continue
+
+            change = _diff_value(old[key], val)
+            if change is not None:
+                edits[key] = change
+
+        for key in old:
+            if key not in new:
+                edits[key] = {DELETE: 1}
+
+        return {ENTRIES: edits} if edits else None
+
+    if old == new:
+        return None
+
+    return {SET: _encode(new)}
+
+
+def _diff_items(old: Sequence[Any], new: Sequence[Any]) -> List[Tuple[int, Change]]:
+    start = 0
+    limit = min(len(old), len(new))
+
+    change = None
+    while start < limit:
+        change = _diff_value(old[start], new[start])
+        if change is not None:
+            break
+        start += 1
+
+    old_end, new_end = len(old), len(new)
+    while old_end > start and new_end > start:
+        if _diff_value(old[old_end - 1], new[new_end - 1]) is not None:
+            break
+        old_end -= 1
+        new_end -= 1
+
+    edits = []
+    end = min(old_end, new_end)
+    for idx in range(start, end):
+        if idx > start:
+            change = _diff_value(old[idx], new[idx])
+
+        if change is not None:
+            edits.append((idx, change))
+
+    if old_end > new_end:
+        edits.append((end, {DELETE: old_end - new_end}))
+    elif new_end > old_end:
+        edits.append((end, {INSERT: [_encode(val) for val in new[end:new_end]]}))
+
+    return edits
+
+
+def _encode(val: Any) -> Any:
+    if isinstance(val, (set, frozenset)):
+        return [_encode(elem) for elem in val]
+
+    if type(val) in (list, tuple):
+        return type(val)(_encode(elem) for elem in val)
+
+    if type(val) is dict:
+        return {key: _encode(elem) for key, elem in val.items()}
+
+    if isinstance(val, Dataclass):
+        return _encode(asdict(val))
+
+    return asdict(val)
+
+
+def _patch_value(G: Any, old: Any, change: Change) -> Any:
+    if SET in change:
+        return parse(G, change[SET])
+
+    G = _narrow(G, old)
+
+    if NESTED in change:
+        return patch(old, change[NESTED])
+
+    if ITEMS in change:
+        items = list(old)
+        for idx, edit in change[ITEMS]:
+            if DELETE in edit:
+                del items[idx : idx + edit[DELETE]]
+            elif INSERT in edit:
+                items[idx:idx] = [
+                    parse(_item_type(G, idx + offset), val)
+                    for offset, val in enumerate(edit[INSERT])
+                ]
+            else:
+                items[idx] = _patch_value(_item_type(G, idx), items[idx], edit)
+
+        return type(old)(items)
+
+    if ENTRIES in change:
+        key_type, val_type = _entry_types(G)
+        data = dict(old)
+        for key, edit in change[ENTRIES].items():
+            key = parse(key_type, key)
+            if DELETE in edit:
+                data.pop(key, None)
+            else:
+                data[key] = _patch_value(val_type, data.get(key), edit)
+
+        return data
+
+    assert False, f"Invalid change: {change}"
+
+
+def _narrow(G: Any, val: Any) -> Any:
+    if get_origin(G) is not Union:
+        return G
+
+    for arg in get_args(G):
+        origin = get_origin(arg) or arg
+        if isinstance(origin, type) and isinstance(val, origin):
+            return arg
+
+    return Any
+
+
+def _item_type(G: Any, idx: int) -> Any:
+    args = get_args(G)
+    if not args:
+        return Any
+
+    if get_origin(G) is tuple and not (len(args) == 2 and args[1] is Ellipsis):
+        return args[idx] if idx < len(args) else Any
+
+    return args[0]
+
+
+def _entry_types(G: Any) -> Tuple[Any, Any]:
+    args = get_args(G)
+    if len(args) == 2:
+        return args
+
+    return Any, Any
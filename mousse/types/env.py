@@ -0,0 +1,144 @@
+import os
+from threading import RLock
+from typing import *
+
+from .dataclass import Dataclass
+from .field import get_fields_info
+
+__all__ = ["EnvOverlay", "refresh_env"]
+
+SEPARATOR = "__"
+
+
+class EnvOverlay:
+    def __init__(self, environ: Mapping[str, str] = None, separator: str = SEPARATOR):
+        self.environ = os.environ if environ is None else environ
+        self.separator = separator
+        self.indexes: Dict[str, Dict[Tuple[str, ...], str]] = {}
+        self.overlays: Dict[Any, Dict[str, Any]] = {}
+        self.keysets: Dict[str, FrozenSet[str]] = {}
+        self.size = len(self.environ)
+        self.lock = RLock()
+
+    def refresh(self):
+        with self.lock:
+            self.indexes.clear()
+            self.overlays.clear()
+            self.keysets.clear()
+            self.size = len(self.environ)
+
+    def changed(self) -> bool:
+        if len(self.environ) != self.size:
+            return True
+
+        environ = self.environ
+        for prefix, index in self.indexes.items():
+            for path, val in index.items():
+                if environ.get(self._name(prefix, path)) != val:
+                    return True
+
+        if not self.keysets:
+            return False
+
+        keysets = {prefix: set() for prefix in self.keysets}
+        heads = [(prefix + "_", prefix + self.separator) for prefix in keysets]
+        for key in environ:
+            for head, keys in zip(heads, keysets.values()):
+                if key.startswith(head):
+                    keys.add(key)
+
+        return keysets != self.keysets
+
+    def index(self, prefix: str) -> Dict[Tuple[str, ...], str]:
+        with self.lock:
+            index = self.indexes.get(prefix)
+            if index is not None:
+                return index
+
+            index = {}
+            keys = set()
+            head = prefix + "_"
+            nested = prefix + self.separator
+            for key, val in self.environ.items():
+                if key.startswith(nested):
+                    index[tuple(key[len(nested) :].split(self.separator))] = val
+                elif key.startswith(head):
+                    index[(key[len(head) :],)] = val
+                else:
+                    continue
+
+                keys.add(key)
+
+            self.indexes[prefix] = index
+            self.keysets[prefix] = frozenset(keys)
+            return index
+
+    def overlay(self, cls: Type[Dataclass], prefix: str, parser: Any) -> Dict[str, Any]:
+        from .parser import get_class_plan
+
+        with self.lock:
+            if self.changed():
+                self.refresh()
+
+            key = (cls, prefix, parser)
+            data = self.overlays.get(key)
+            if data is not None:
+                return data
+
+            data = {}
+            for path, val in self.index(prefix).items():
+                target = cls
+                node = data
+                for depth, name in enumerate(path):
+                    entry = get_class_plan(target, parser).get(name)
+                    if entry is None:
+                        break
+
+                    field_key, parse_field = entry
+                    if depth == len(path) - 1:
+                        node[field_key] = parse_field(val)
+                        break
+
+                    annotation = get_fields_info(target)[field_key].annotation
+                    if not (
+                        isinstance(annotation, type)
+                        and issubclass(annotation, Dataclass)
+                    ):
+                        break
+
+                    child = node.get(field_key)
+                    if not isinstance(child, dict):
+                        child = node[field_key] = {}
+
+                    target = annotation
+                    node = child
+
+            self.overlays[key] = data
+            return data
+
+    def _name(self, prefix: str, path: Tuple[str, ...]) -> str:
+        if len(path) == 1:
+            name = f"{prefix}_{path[0]}"
+            if name in self.environ:
+                return name
+
+        return prefix + self.separator + self.separator.join(path)
+
+
+env_overlay = EnvOverlay()
+
+
+def refresh_env():
+    env_overlay.refresh()
+
+
+def merge_env(env_obj: Dict[str, Any], data: Mapping[str, Any]) -> Dict[str, Any]:
+    merged = dict(env_obj)
+    for key, val in data.items():
+        base = merged.get(key)
+        if isinstance(base, dict) and isinstance(val, Mapping):
+            merged[key] = merge_env(base, val)
+        else:
+            merged[key] = val
+
+    return merged
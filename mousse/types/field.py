@@ -29,6 +29,7 @@ class Field:
         private: bool = None,
         strict: int = None,
         factory: Callable = None,
+        strategy: Any = None,
     ) -> None:
         self.default = default
         self.alias = alias
@@ -37,6 +38,7 @@ class Field:
         self.private = private
         self.strict = strict
         self.factory = factory
+        self.strategy = strategy
 
         self.validators = OrderedDict()
         self.setters = OrderedDict()
@@ -73,21 +75,31 @@ class Field:
         return decorator
 
 
+_custom_fields: Dict[int, Dict[str, Field]] = {}
+
+
 def get_fields_info(cls: Any, ins: Any = None) -> Dict[str, Field]:
     defaults = _get_fields_info(cls)
     if ins is not None:
-        custom = _get_custome_info(id(ins))
-        custom.update(defaults)
-        return custom
+        custom = _custom_fields.get(id(ins))
+        if custom:
+            return {**defaults, **custom}
 
     return defaults
 
 
-@lru_cache(typed=True)
-def _get_fields_info(cls: Any) -> Dict[str, Field]:
-    return {}
+def add_field_info(ins: Any, key: str, field: Field):
+    _custom_fields.setdefault(id(ins), {})[key] = field
+
+
+def remove_field_info(ins: Any, key: str):
+    _custom_fields.get(id(ins), {}).pop(key, None)
+
+
+def remove_fields_info(ins: Any):
+    _custom_fields.pop(id(ins), None)
 
 
 @lru_cache(typed=True)
-def _get_custome_info(ins: Any) -> Dict[str, Field]:
+def _get_fields_info(cls: Any) -> Dict[str, Field]:
     return {}
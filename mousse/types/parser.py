@@ -1,50 +1,68 @@
 import collections
-import json
-import os
+from concurrent.futures import Executor
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import *
 
-import yaml
-
-from .dataclass import Dataclass
+from .backend import dump, load
+from .accessor import (
+    get_accessors_info,
+    get_cached_dict,
+    has_cached_dict,
+    get_changes,
+    set_cached_dict,
+    set_pending,
+    tracked,
+)
+from .dataclass import Dataclass, get_options
+from .env import env_overlay, merge_env
 from .field import Field, get_fields_info
-from .types import Generic, get_args, get_origin, is_generic
+from .types import Generic, Literal, get_args, get_origin, is_generic
 from .validator import validate
 
-__all__ = ["Parser", "asdict", "asclass", "parse", "parser"]
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
+__all__ = ["Parser", "asdict", "asclass", "parse", "parser", "validate_all"]
 
-def load_yaml(stream: Any) -> Dict[str, Any]:
-    return yaml.load(stream, Loader=yaml.Loader) or {}
 
+parsers = {}
+compilers = {}
 
-def dump_yaml(data: Any, stream: Any):
-    return yaml.dump(
-        data,
-        stream,
-        Dumper=yaml.Dumper,
-        default_flow_style=False,
-        indent=2,
-        allow_unicode=True,
-    )
+SCALARS = (bool, int, float, complex, str)
 
 
-LOADER = {".json": json.load, ".yaml": load_yaml, ".yml": load_yaml}
+def parser(*types: Type[Generic], func: Callable = None):
+    def decorator(func: Callable):
+        for _type in types:
+            origin = get_origin(_type)
+            if origin is None:
+                origin = _type
 
-DUMPER = {".json": json.dump, ".yaml": dump_yaml, ".yml": dump_yaml}
+            parsers[origin] = func
+            compilers.pop(origin, None)
 
+        _compile_parser.cache_clear()
+        return func
 
-parsers = {}
+    if func is not None:
+        return decorator(func)
 
+    return decorator
 
-def parser(*types: Type[Generic], func: Callable = None):
+
+def compiler(*types: Type[Generic], func: Callable = None):
     def decorator(func: Callable):
         for _type in types:
             origin = get_origin(_type)
             if origin is None:
                 origin = _type
 
-            parsers[origin] = func
+            compilers[origin] = func
+
+        _compile_parser.cache_clear()
         return func
 
     if func is not None:
@@ -53,30 +71,87 @@ def parser(*types: Type[Generic], func: Callable = None):
     return decorator
 
 
-def parse(G: Union[Generic, Type], obj: Any, **kwargs):
-    if is_generic(G):
+def parse(
+    G: Union[Generic, Type],
+    obj: Any,
+    executor: Executor = None,
+    chunksize: int = None,
+    **kwargs,
+):
+    if executor is not None:
+        from .batch import parse_parallel
+
+        return parse_parallel(G, obj, executor, chunksize=chunksize, **kwargs)
+
+    return compile_parser(G, **kwargs)(obj)
+
+
+def compile_parser(G: Union[Generic, Type], **kwargs) -> Callable[[Any], Any]:
+    options = tuple(sorted(kwargs.items())) if kwargs else ()
+    try:
+        # Union members compare equal regardless of order, but parsing is order-sensitive
+        return _compile_parser(G, id(G), options)
+    except TypeError:
+        return _build_parser(G, **kwargs)
+
+
+@lru_cache(maxsize=None)
+def _compile_parser(
+    G: Union[Generic, Type], key: int, options: Tuple[Tuple[str, Any], ...]
+):
+    return _build_parser(G, **dict(options))
+
+
+def _build_parser(G: Union[Generic, Type], **kwargs) -> Callable[[Any], Any]:
+    if G is Any:
+        return _identity
+
+    if is_generic(G) or get_origin(G) is not None:
         origin = get_origin(G)
+        if origin in compilers:
+            return compilers[origin](G, **kwargs)
+
         if origin in parsers:
             parser = parsers[origin]
-            return parser(G, obj, **kwargs)
+            return lambda obj: parser(G, obj, **kwargs)
+
+    if G in compilers:
+        return compilers[G](G, **kwargs)
 
     if G in parsers:
         parser = parsers[G]
-        return parser(G, obj, **kwargs)
+        return lambda obj: parser(G, obj, **kwargs)
 
-    if isinstance(obj, G):
-        return obj
+    if type(G) is not type and type(G) in compilers:
+        return compilers[type(G)](G, **kwargs)
 
-    if issubclass(G, Dataclass):
-        return asclass(G, obj, **kwargs)
+    if isinstance(G, type) and issubclass(G, Dataclass):
 
-    if obj is Ellipsis:
-        return G()
+        def parse_dataclass(obj: Any):
+            if isinstance(obj, G):
+                return obj
 
-    if obj is None:
-        return obj
+            return asclass(G, obj, **kwargs)
+
+        return parse_dataclass
+
+    def parse_type(obj: Any):
+        if isinstance(obj, G):
+            return obj
 
-    return G(obj)
+        if obj is Ellipsis:
+            return G()
+
+        if obj is None:
+            return obj
+
+        return G(obj)
+
+    return parse_type
+
+
+def _identity(obj: Any) -> Any:
+    return obj
 
 
 @parser(Any)
@@ -89,7 +164,16 @@ def parse_none(G: Generic, obj: Any, **kwargs):
     return None
 
 
-@parser(List, Set, Sequence)
+def parse_literal(G: Generic, obj: Any, **kwargs):
+    assert obj in get_args(G), f"Unable to parse from {obj} to {G}"
+    return obj
+
+
+if Literal is not None:
+    parser(Literal, func=parse_literal)
+
+
+@parser(List, Set, FrozenSet, Sequence)
 def parse_sequence(G: Generic, obj: Any, **kwargs):
     arg, *_ = get_args(G) + (Any,)
     origin = get_origin(G) or G
@@ -155,6 +239,237 @@ def parse_union(G: Generic, obj: Any, **kwargs):
     assert False, f"Unable to parse from {type(obj)} to {G}"
 
 
+@compiler(List, Set, FrozenSet, Sequence)
+def compile_sequence(G: Generic, **kwargs):
+    arg, *_ = get_args(G) + (Any,)
+    origin = get_origin(G) or G
+    if origin is collections.abc.Sequence:
+        origin = list
+
+    parse_elem = compile_parser(arg, **kwargs)
+    scalar = np is not None and arg in SCALARS
+
+    def parse_sequence(obj: Any):
+        assert isinstance(obj, Iterable), f"Object is not an iterable"
+        if scalar and isinstance(obj, np.ndarray) and obj.ndim == 1:
+            return origin(_to_scalars(arg, obj))
+
+        if parse_elem is _identity:
+            return origin(obj)
+
+        return origin(map(parse_elem, obj))
+
+    return parse_sequence
+
+
+def _to_scalars(dtype: type, arr: Any) -> List[Any]:
+    if dtype is int and arr.dtype.kind in "fc":
+        assert np.isfinite(arr).all(), f"Unable to parse non-finite values to int"
+
+    return arr.astype(dtype, copy=False).tolist()
+
+
+@compiler(Tuple)
+def compile_tuple(G: Generic, **kwargs):
+    if G is tuple:
+        return tuple
+
+    args = get_args(G)
+    if not args or (len(args) == 2 and args[1] is Ellipsis):
+        arg, *_ = args or (Any,)
+        parse_elem = compile_parser(arg, **kwargs)
+
+        def parse_tuple(obj: Any):
+            assert isinstance(obj, Iterable), f"Object is not an iterable"
+            return tuple(map(parse_elem, obj))
+
+        return parse_tuple
+
+    if Ellipsis in args:
+        return lambda obj: parsers[tuple](G, obj, **kwargs)
+
+    parse_elems = tuple(compile_parser(arg, **kwargs) for arg in args)
+    size = len(parse_elems)
+
+    def parse_tuple(obj: Any):
+        if size == 1 and len(obj) > 1:
+            assert False, f"Number of params mismatch"
+        assert isinstance(obj, Iterable), f"Object is not an iterable"
+
+        if len(obj) != size and not (size == 1 and len(obj) == 0):
+            assert False, f"Number of params mismatch"
+
+        return tuple(parse_elem(elem) for parse_elem, elem in zip(parse_elems, obj))
+
+    return parse_tuple
+
+
+@compiler(Dict)
+def compile_dict(G: Generic, **kwargs):
+    args = get_args(G) if is_generic(G) else ()
+    if not args:
+
+        def parse_mapping(obj: Any):
+            assert issubclass(
+                type(obj), Mapping
+            ), f"Unable to parse from {type(obj)} to {G}"
+            return {key: asdict(val, **kwargs) for key, val in obj.items()}
+
+        return parse_mapping
+
+    key_type, val_type = args
+    parse_key = compile_parser(key_type, **kwargs)
+    parse_val = compile_parser(val_type, **kwargs)
+
+    def parse_dict(obj: Any):
+        assert issubclass(
+            type(obj), Mapping
+        ), f"Unable to parse from {type(obj)} to {G}"
+        return {parse_key(key): parse_val(val) for key, val in obj.items()}
+
+    return parse_dict
+
+
+@compiler(Union)
+def compile_union(G: Generic, **kwargs):
+    args = get_args(G)
+    parse_args = tuple(compile_parser(arg, **kwargs) for arg in args)
+    dtypes = tuple(_get_plain_type(arg) for arg in args)
+    members = frozenset(arg for arg in args if _is_dataclass(arg))
+    dispatch = compile_discriminator(args)
+
+    def parse_union(obj: Any):
+        if dispatch is not None:
+            if type(obj) in members:
+                return obj
+
+            if isinstance(obj, Mapping):
+                idx = dispatch(obj)
+                if idx is not None:
+                    try:
+                        return parse_args[idx](obj)
+                    except Exception as e:
+                        pass
+
+        for parse_arg, dtype in zip(parse_args, dtypes):
+            if dtype is not None and isinstance(obj, dtype):
+                return obj
+
+            try:
+                return parse_arg(obj)
+            except Exception as e:
+                continue
+
+        assert False, f"Unable to parse from {type(obj)} to {G}"
+
+    return parse_union
+
+
+def _is_dataclass(G: Any) -> bool:
+    return isinstance(G, type) and issubclass(G, Dataclass)
+
+
+def _get_plain_type(G: Any) -> Optional[type]:
+    if not isinstance(G, type) or is_generic(G) or get_origin(G) is not None:
+        return None
+
+    if G in parsers or G in compilers or issubclass(G, Dataclass):
+        return None
+
+    return G
+
+
+def compile_discriminator(
+    args: Sequence[Any],
+) -> Optional[Callable[[Mapping[str, Any]], Optional[int]]]:
+    classes = {idx: arg for idx, arg in enumerate(args) if _is_dataclass(arg)}
+    if len(classes) < 2:
+        return None
+
+    dispatch_keys = None
+    owners: Dict[str, Set[int]] = {}
+    for idx, cls in classes.items():
+        for key, field in get_fields_info(cls).items():
+            owners.setdefault(key, set()).add(idx)
+            if field.alias is not None:
+                owners.setdefault(field.alias, set()).add(idx)
+
+    unique = {name: min(idxs) for name, idxs in owners.items() if len(idxs) == 1}
+    if unique:
+
+        def dispatch_keys(obj: Mapping[str, Any]) -> Optional[int]:
+            found = None
+            for name in obj:
+                idx = unique.get(name)
+                if idx is None:
+                    continue
+
+                if found is not None and found != idx:
+                    return None
+
+                found = idx
+
+            return found
+
+    tag = _find_tag(classes)
+    if tag is None:
+        return dispatch_keys
+
+    names, table = tag
+
+    def dispatch_tag(obj: Mapping[str, Any]) -> Optional[int]:
+        for name in names:
+            if name in obj:
+                try:
+                    return table.get(obj[name])
+                except TypeError:
+                    return None
+
+        if dispatch_keys is not None:
+            return dispatch_keys(obj)
+
+        return None
+
+    return dispatch_tag
+
+
+def _find_tag(
+    classes: Dict[int, Type[Dataclass]],
+) -> Optional[Tuple[Tuple[str, ...], Dict[Any, int]]]:
+    if Literal is None:
+        return None
+
+    infos = {idx: get_fields_info(cls) for idx, cls in classes.items()}
+    first = next(iter(infos.values()))
+
+    for key in first:
+        fields = [info.get(key) for info in infos.values()]
+        if not all(
+            field is not None and get_origin(field.annotation) is Literal
+            for field in fields
+        ):
+            continue
+
+        names = [key]
+        table = {}
+        ambiguous = set()
+        for idx, field in zip(infos, fields):
+            if field.alias is not None and field.alias not in names:
+                names.insert(0, field.alias)
+
+            for val in get_args(field.annotation):
+                if table.get(val, idx) != idx:
+                    ambiguous.add(val)
+                table[val] = idx
+
+        for val in ambiguous:
+            table.pop(val)
+
+        return tuple(names), table
+
+    return None
+
+
 class ParserMetaclass(type):
     def __new__(
         cls: Type,
@@ -170,51 +485,107 @@ class Parser(metaclass=ParserMetaclass):
     def __call__(self, val: Any, field: Field, **kwargs) -> Any:
         return val
 
+    def compile(self, field: Field, **kwargs) -> Callable[[Any], Any]:
+        return lambda val: self(val, field, **kwargs)
+
 
 class DictParser(Parser):
     def __call__(self, val: Any, field: Field, **kwargs):
-        if val == Ellipsis:
-            return val
+        return self.compile(field, **kwargs)(val)
 
-        if isinstance(field.annotation, get_args(Generic)):
-            if getattr(field.annotation, "_name", None) == "Dict":
-                return parse(field.annotation, val, **kwargs)
+    def compile(self, field: Field, **kwargs) -> Callable[[Any], Any]:
+        if not isinstance(field.annotation, get_args(Generic)):
+            return _identity
 
-            return parse(field.annotation, val, **kwargs)
+        parse_val = compile_parser(field.annotation, **kwargs)
 
-        return val
+        def parse_field(val: Any):
+            if val is Ellipsis:
+                return val
+
+            return parse_val(val)
+
+        return parse_field
 
 
 class ClassParser(Parser):
     def __call__(self, val: Any, field: Field, **kwargs) -> Any:
-        return parse(field.annotation, val, **kwargs)
+        return compile_parser(field.annotation, **kwargs)(val)
+
+    def compile(self, field: Field, **kwargs) -> Callable[[Any], Any]:
+        return compile_parser(field.annotation, **kwargs)
+
+
+@lru_cache(maxsize=256)
+def get_dict_plan(
+    cls: Type[Dataclass], by_alias: bool, parser: Parser
+) -> List[Tuple[str, str, Callable[[Any], Any]]]:
+    return _build_dict_plan(get_fields_info(cls), by_alias, parser)
+
+
+def _build_dict_plan(
+    fields: Dict[str, Field], by_alias: bool, parser: Parser
+) -> List[Tuple[str, str, Callable[[Any], Any]]]:
+    plan = []
+    for key, field in fields.items():
+        if field.private:
+            continue
+
+        name = field.alias if by_alias and field.alias is not None else key
+        plan.append((key, name, parser.compile(field, by_alias=by_alias)))
+
+    return plan
+
+
+def get_instance_plan(
+    obj: Dataclass, by_alias: bool, parser: Parser
+) -> List[Tuple[str, str, Callable[[Any], Any]]]:
+    cls = type(obj)
+    fields: Dict[str, Field] = get_fields_info(cls, obj)
+    if fields is get_fields_info(cls):
+        return get_dict_plan(cls, by_alias, parser)
+
+    return _build_dict_plan(fields, by_alias, parser)
+
+
+@lru_cache(maxsize=256)
+def get_class_plan(
+    cls: Type[Dataclass], parser: Parser
+) -> Dict[str, Tuple[str, Callable[[Any], Any]]]:
+    fields: Dict[str, Field] = get_fields_info(cls)
+
+    plan = {}
+    for key, field in fields.items():
+        plan[key] = (key, parser.compile(field))
+
+    for key, field in fields.items():
+        if field.alias is not None:
+            plan[field.alias] = plan[key]
+
+    return plan
 
 
-def load(path: Union[str, Path]) -> Dict[str, Any]:
-    if type(path) is not Path:
-        path = Path(path).resolve()
+def _copy_tree(val: Any) -> Any:
+    if type(val) is dict:
+        return {key: _copy_tree(elem) for key, elem in val.items()}
 
-    with open(path, encoding="utf-8") as fin:
-        loader = LOADER.get(path.suffix.lower())
-        if loader is None:
-            raise Exception(f"file format {path.suffix} is not supported")
+    if type(val) in (list, tuple, set):
+        return type(val)(_copy_tree(elem) for elem in val)
 
-        params = loader(fin)
+    return val
 
-    return params
 
+def _is_cached_tree(val: Any) -> bool:
+    if isinstance(val, Dataclass):
+        return has_cached_dict(val)
 
-def dump(data: Any, path: Union[str, Path]):
-    if type(path) is not Path:
-        path = Path(path)
+    if isinstance(val, (list, tuple, set, frozenset)):
+        return all(_is_cached_tree(elem) for elem in val)
 
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as fout:
-        dumper = DUMPER.get(path.suffix.lower())
-        if dumper is None:
-            raise Exception(f"file format {path.suffix} is not supported")
+    if isinstance(val, dict):
+        return all(_is_cached_tree(elem) for elem in val.values())
 
-        dumper(data, fout)
+    return True
 
 
 def asdict(
@@ -232,16 +603,14 @@ def asdict(
     elif not isinstance(obj, Dataclass):
         data = parse(type(obj), obj)
 
+    elif type(obj) in tracked and get_cached_dict(obj, (by_alias, parser)):
+        data = _copy_tree(get_cached_dict(obj, (by_alias, parser)))
+
     else:
-        fields: Dict[str, Field] = get_fields_info(type(obj), obj)
         data: Dict[str, Any] = {}
-
-        for key, field in fields.items():
-            if field.private:
-                continue
-
-            val = getattr(obj, key)
-            val = parser(val, field, by_alias=by_alias)
+        cacheable = type(obj) in tracked
+        for key, name, parse_field in get_instance_plan(obj, by_alias, parser):
+            field_val = val = parse_field(getattr(obj, key))
 
             if isinstance(val, Dataclass):
                 val = asdict(val, by_alias=by_alias, parser=parser)
@@ -257,9 +626,15 @@ def asdict(
             else:
                 pass
 
-            key = field.alias if by_alias and field.alias is not None else key
-            if val != Ellipsis:
-                data[key] = val
+            if val is not Ellipsis:
+                data[name] = val
+
+            if cacheable:
+                cacheable = _is_cached_tree(field_val)
+
+        if cacheable:
+            set_cached_dict(obj, (by_alias, parser), data)
+            data = _copy_tree(data)
 
     if path is not None and data is not None:
         dump(data, path=path)
@@ -273,11 +648,9 @@ def asclass(
     path: Union[str, Path] = None,
     env: str = None,
     parser: Parser = ClassParser(),
+    lazy: bool = False,
 ):
-    fields: Dict[str, Field] = get_fields_info(cls)
-    alias = {}
-    for key, field in fields.items():
-        alias[field.alias if field.alias is not None else key] = key
+    plan = get_class_plan(cls, parser)
 
     local_obj = obj or {}
 
@@ -287,34 +660,124 @@ def asclass(
             path = Path(path).resolve()
         path_obj = load(path)
 
-    env_obj = {}
-    if env:
-        for key, val in os.environ.items():
-            if key.startswith(env + "_"):
-                key = key[len(env) + 1 :]
-                if key in alias:
-                    key = alias[key]
-                    env_obj[key] = val
-
-    data = {**env_obj, **path_obj}
+    data = dict(path_obj)
     if isinstance(local_obj, Dataclass):
         local_obj = asdict(local_obj)
 
     for key in local_obj:
         data[key] = local_obj[key]
 
+    if env:
+        data = merge_env(env_overlay.overlay(cls, env, parser), data)
+
+    if lazy:
+        return build_lazy(cls, parser, data)
+
+    return build_class(cls, plan, data)
+
+
+def build_class(
+    cls: Type[Dataclass],
+    plan: Dict[str, Tuple[str, Callable[[Any], Any]]],
+    data: Mapping[str, Any],
+):
     schema_data = {}
     custom_data = {}
     for key, val in data.items():
-        if key in alias:
-            key = alias[key]
-
-        if key in fields:
-            schema_data[key] = parser(val, fields[key])
+        entry = plan.get(key)
+        if entry is None:
+            custom_data[key] = val
             continue
 
-        custom_data[key] = val
+        key, parse_field = entry
+        schema_data[key] = parse_field(val)
 
     data = {**custom_data, **schema_data}
     ins = cls(**data)
     return ins
+
+
+@lru_cache(maxsize=256)
+def get_lazy_plan(
+    cls: Type[Dataclass], parser: Parser
+) -> Dict[str, Tuple[str, Callable[[Any], Any]]]:
+    plan = {}
+    for name, (key, parse_field) in get_class_plan(cls, parser).items():
+        annotation = get_fields_info(cls)[key].annotation
+        if isinstance(annotation, type) and issubclass(annotation, Dataclass):
+            parse_field = partial(_parse_lazy, annotation, parser, parse_field)
+
+        plan[name] = (key, parse_field)
+
+    return plan
+
+
+def _parse_lazy(
+    cls: Type[Dataclass],
+    parser: Parser,
+    parse_field: Callable[[Any], Any],
+    val: Any,
+) -> Any:
+    if isinstance(val, Mapping):
+        return build_lazy(cls, parser, val)
+
+    return parse_field(val)
+
+
+def build_lazy(cls: Type[Dataclass], parser: Parser, data: Mapping[str, Any]):
+    options = get_options(cls)
+    if options.get("intern") or hasattr(cls, "__build__"):
+        return build_class(cls, get_class_plan(cls, parser), data)
+
+    plan = get_lazy_plan(cls, parser)
+
+    obj = cls.__new__(cls)
+    pending = {}
+    custom_data = {}
+    for key, val in data.items():
+        entry = plan.get(key)
+        if entry is None:
+            custom_data[key] = val
+            continue
+
+        key, parse_field = entry
+        pending[key] = (val, parse_field)
+
+    set_pending(obj, pending)
+
+    if options.get("dynamic"):
+        for key, val in custom_data.items():
+            setattr(obj, key, val)
+
+    return obj
+
+
+def validate_all(obj: Any, memo: Set[int] = None, changed_only: bool = False) -> Any:
+    memo = memo if memo is not None else set()
+    if id(obj) in memo:
+        return obj
+    memo.add(id(obj))
+
+    if isinstance(obj, Dataclass):
+        accessors = get_accessors_info(type(obj), obj)
+        if changed_only and type(obj) in tracked:
+            accessors = {
+                key: accessors[key] for key in get_changes(obj) if key in accessors
+            }
+
+        for key, accessor in accessors.items():
+            val = getattr(obj, key)
+            accessor.validate(obj, val)
+            validate_all(val, memo, changed_only)
+
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for elem in obj:
+            if isinstance(elem, (Dataclass, list, tuple, set, frozenset, dict)):
+                validate_all(elem, memo, changed_only)
+
+    elif isinstance(obj, dict):
+        for elem in obj.values():
+            if isinstance(elem, (Dataclass, list, tuple, set, frozenset, dict)):
+                validate_all(elem, memo, changed_only)
+
+    return obj
@@ -0,0 +1,417 @@
+import ctypes
+import ctypes.util
+import heapq
+import itertools
+import logging
+import os
+import random
+import select
+import socket
+import struct
+import time
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from functools import lru_cache, partial
+from pathlib import Path
+from threading import Lock, Thread
+from typing import *
+
+__all__ = ["Watch", "WatchScheduler", "WatchStats", "get_scheduler"]
+
+DEFAULT_INTERVAL = 1.0
+
+
+class WatchStats(NamedTuple):
+    loads: int
+    failures: int
+    consecutive_failures: int
+    last_load: Optional[float]
+    last_duration: Optional[float]
+    last_error: Optional[BaseException]
+    next_due: Optional[float]
+
+
+class Watch:
+    def __init__(
+        self,
+        scheduler: "WatchScheduler",
+        func: Callable[[], Any],
+        interval: float,
+        logger: Optional[logging.Logger] = None,
+        path: Optional[Path] = None,
+    ):
+        self.scheduler = scheduler
+        self.func = func
+        self.interval = interval
+        self.logger = logger
+        self.path = path
+        self.active = True
+        self.running = False
+        self.pending = False
+        self.token = 0
+        self.due = None
+        self.loads = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.last_load = None
+        self.last_duration = None
+        self.last_error = None
+
+    def cancel(self):
+        self.scheduler.remove(self)
+
+    def trigger(self):
+        self.scheduler.trigger(self)
+
+    @property
+    def stats(self) -> WatchStats:
+        next_due = None
+        if self.active and self.due is not None:
+            next_due = time.time() + self.due - time.monotonic()
+
+        return WatchStats(
+            self.loads,
+            self.failures,
+            self.consecutive_failures,
+            self.last_load,
+            self.last_duration,
+            self.last_error,
+            next_due,
+        )
+
+    def delay(self) -> float:
+        scheduler = self.scheduler
+        delay = self.interval
+        if self.consecutive_failures:
+            delay = min(
+                delay * scheduler.backoff**self.consecutive_failures,
+                max(scheduler.max_backoff, self.interval),
+            )
+
+        if scheduler.jitter:
+            delay *= 1 + random.uniform(-scheduler.jitter, scheduler.jitter)
+
+        return max(delay, 0)
+
+
+class WatchScheduler:
+    def __init__(
+        self,
+        max_workers: int = 4,
+        jitter: float = 0.1,
+        backoff: float = 2.0,
+        max_backoff: float = 300.0,
+        notify: bool = True,
+    ):
+        self.max_workers = max_workers
+        self.jitter = jitter
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.notify = notify
+
+        self.heap: List[Tuple[float, int, int, Watch]] = []
+        self.counter = itertools.count()
+        self.lock = Lock()
+        self.paths: Dict[Path, Set[Watch]] = {}
+        self.watches: Set[Watch] = set()
+        self.executor = None
+        self.notifier = None
+        self.thread = None
+        self.wakeup = None
+
+    def add(
+        self,
+        func: Callable[[], Any],
+        interval: float,
+        logger: Optional[logging.Logger] = None,
+        path: Union[str, Path, None] = None,
+        delay: Optional[float] = None,
+    ) -> Watch:
+        interval = interval or DEFAULT_INTERVAL
+        assert interval > 0, f"Watch interval must be positive, got {interval}"
+        if path is not None:
+            path = Path(path).resolve()
+
+        watch = Watch(self, func, interval, logger=logger, path=path)
+        with self.lock:
+            self._start()
+            self.watches.add(watch)
+            if path is not None:
+                self._subscribe(watch)
+
+            self._push(watch, watch.delay() if delay is None else delay)
+
+        self._wake()
+        return watch
+
+    def remove(self, watch: Watch):
+        with self.lock:
+            watch.active = False
+            watch.token += 1
+            self.watches.discard(watch)
+            if watch.path is not None:
+                self.paths.get(watch.path, set()).discard(watch)
+
+    def trigger(self, watch: Watch):
+        with self.lock:
+            if not watch.active:
+                return
+
+            if watch.running:
+                watch.pending = True
+                return
+
+            self._push(watch, 0)
+
+        self._wake()
+
+    def shutdown(self, wait: bool = True):
+        with self.lock:
+            for watch in self.watches:
+                watch.active = False
+
+            self.watches.clear()
+            self.heap.clear()
+            self.paths.clear()
+            thread, self.thread = self.thread, None
+            executor, self.executor = self.executor, None
+
+        if thread is not None:
+            self._wake()
+            if wait:
+                thread.join()
+
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+        if thread is None or wait:
+            self._close()
+
+    def _close(self):
+        with self.lock:
+            if self.thread is not None:
+                return
+
+            wakeup, self.wakeup = self.wakeup, None
+            notifier, self.notifier = self.notifier, None
+
+        if wakeup is not None:
+            for sock in wakeup:
+                sock.close()
+
+        if notifier is not None:
+            notifier.close()
+
+    def _start(self):
+        if self.thread is not None:
+            return
+
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="mousse-watch"
+        )
+
+        if self.wakeup is None:
+            self.wakeup = socket.socketpair()
+            for sock in self.wakeup:
+                sock.setblocking(False)
+
+        if self.notify and self.notifier is None and _get_libc() is not None:
+            try:
+                self.notifier = Inotify()
+            except (AssertionError, OSError):
+                self.notifier = None
+
+        self.thread = Thread(target=self._run, name="mousse-scheduler")
+        self.thread.daemon = True
+        self.thread.start()
+
+    def _subscribe(self, watch: Watch):
+        self.paths.setdefault(watch.path, set()).add(watch)
+        if self.notifier is not None:
+            try:
+                self.notifier.add(watch.path)
+            except (AssertionError, OSError) as e:
+                if watch.logger:
+                    watch.logger.error(e)
+
+    def _push(self, watch: Watch, delay: float):
+        watch.token += 1
+        watch.due = time.monotonic() + delay
+        heapq.heappush(self.heap, (watch.due, next(self.counter), watch.token, watch))
+
+    def _wake(self):
+        wakeup = self.wakeup
+        if wakeup is not None:
+            try:
+                wakeup[1].send(b"\0")
+            except OSError:
+                pass
+
+    def _run(self):
+        current = self.thread
+        wakeup = self.wakeup[0]
+        notifier = self.notifier
+
+        while self.thread is current:
+            with self.lock:
+                timeout = None
+                if self.heap:
+                    timeout = max(self.heap[0][0] - time.monotonic(), 0)
+
+            fds = [wakeup] if notifier is None else [wakeup, notifier.fd]
+            ready, _, _ = select.select(fds, [], [], timeout)
+
+            if wakeup in ready:
+                try:
+                    wakeup.recv(4096)
+                except OSError:
+                    pass
+
+            if notifier is not None and notifier.fd in ready:
+                for path in notifier.read():
+                    with self.lock:
+                        watches = list(self.paths.get(path, ()))
+
+                    for watch in watches:
+                        self.trigger(watch)
+
+            self._dispatch()
+
+        if self.thread is None:
+            self._close()
+
+    def _dispatch(self):
+        now = time.monotonic()
+        with self.lock:
+            while self.heap and self.heap[0][0] <= now:
+                _, _, token, watch = heapq.heappop(self.heap)
+                if not watch.active or token != watch.token or watch.running:
+                    continue
+
+                try:
+                    self.executor.submit(self._execute, watch)
+                except RuntimeError:
+                    self.thread = None
+                    return
+
+                watch.running = True
+
+    def _execute(self, watch: Watch):
+        start = time.perf_counter()
+        try:
+            result = watch.func()
+        except Exception as e:
+            self._finish(watch, start, e)
+            return
+
+        if isinstance(result, Future):
+            result.add_done_callback(partial(self._settle, watch, start))
+            return
+
+        self._finish(watch, start, None)
+
+    def _settle(self, watch: Watch, start: float, future: Future):
+        try:
+            error = future.exception()
+        except CancelledError as e:
+            error = e
+
+        self._finish(watch, start, error)
+
+    def _finish(self, watch: Watch, start: float, error: Optional[BaseException]):
+        watch.last_duration = time.perf_counter() - start
+        if error is None:
+            watch.loads += 1
+            watch.consecutive_failures = 0
+            watch.last_load = time.time()
+        else:
+            watch.failures += 1
+            watch.consecutive_failures += 1
+            watch.last_error = error
+            if watch.logger:
+                watch.logger.error(error)
+
+        with self.lock:
+            watch.running = False
+            if not watch.active:
+                return
+
+            pending, watch.pending = watch.pending, False
+            self._push(watch, 0 if pending else watch.delay())
+
+        self._wake()
+
+
+_scheduler = None
+_scheduler_lock = Lock()
+
+
+def get_scheduler() -> WatchScheduler:
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = WatchScheduler()
+
+        return _scheduler
+
+
+class Inotify:
+    IN_MODIFY = 0x002
+    IN_ATTRIB = 0x004
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    IN_NONBLOCK = 0x800
+    IN_CLOEXEC = 0x80000
+    MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    EVENT = struct.Struct("iIII")
+
+    def __init__(self):
+        self.libc = _get_libc()
+        assert self.libc is not None, "inotify is not available"
+        self.fd = self.libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        assert self.fd >= 0, f"inotify_init1 failed: {os.strerror(ctypes.get_errno())}"
+        self.dirs: Dict[Path, int] = {}
+        self.wds: Dict[int, Path] = {}
+
+    def add(self, path: Path):
+        directory = path.parent
+        if directory in self.dirs:
+            return
+
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), self.MASK)
+        assert wd >= 0, f"inotify_add_watch failed: {os.strerror(ctypes.get_errno())}"
+        self.dirs[directory] = wd
+        self.wds[wd] = directory
+
+    def read(self) -> Set[Path]:
+        try:
+            buffer = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        paths = set()
+        offset = 0
+        while offset + self.EVENT.size <= len(buffer):
+            wd, _, _, size = self.EVENT.unpack_from(buffer, offset)
+            offset += self.EVENT.size
+            name = buffer[offset : offset + size].rstrip(b"\0")
+            offset += size
+            directory = self.wds.get(wd)
+            if directory is not None and name:
+                paths.add(directory / os.fsdecode(name))
+
+        return paths
+
+    def close(self):
+        os.close(self.fd)
+
+
+@lru_cache(maxsize=1)
+def _get_libc() -> Optional[ctypes.CDLL]:
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        libc.inotify_init1
+        return libc
+    except (OSError, AttributeError, TypeError):
+        return None
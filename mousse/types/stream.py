@@ -0,0 +1,652 @@
+import gzip
+import json
+import logging
+import re
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from functools import partial
+from json.encoder import encode_basestring_ascii
+from operator import itemgetter
+from pathlib import Path
+from typing import *
+
+import yaml
+
+from .backend import YamlDumper, YamlLoader, get_backend
+from .batch import chunked, map_chunks
+from .dataclass import Dataclass
+from .parser import (
+    ClassParser,
+    DictParser,
+    Parser,
+    build_class,
+    get_class_plan,
+    get_instance_plan,
+)
+
+__all__ = ["RecordError", "asclass_stream", "dump_stream", "load_stream"]
+
+
+FORMATS = {
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".json": "json",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+}
+
+WHITESPACE = " \t\r\n"
+BUFFER_SIZE = 1 << 16
+MAX_RECORD = 1 << 26
+
+STRUCTURE = re.compile(r'[\[\]{}"]')
+STRING = re.compile(r'["\\]')
+SCALAR_END = re.compile(r'[\s,\[\]{}"]')
+
+
+class RecordError(Exception):
+    def __init__(self, index: int, line: int, error: Any):
+        super().__init__(f"Invalid record #{index} at line {line}: {error}")
+        self.index = index
+        self.line = line
+        self.error = error
+
+    def __reduce__(self):
+        return type(self), (self.index, self.line, self.error)
+
+
+def _identity(raw: Any) -> Any:
+    return raw
+
+
+def _get_format(path: Path) -> str:
+    suffixes = [suffix.lower() for suffix in path.suffixes]
+    if suffixes and suffixes[-1] == ".gz":
+        suffixes.pop()
+
+    fmt = FORMATS.get(suffixes[-1] if suffixes else "")
+    if fmt is None:
+        raise Exception(f"file format {path.suffix} is not supported")
+
+    return fmt
+
+
+@contextmanager
+def _open(source: Union[str, Path, IO], format: str = None):
+    if hasattr(source, "read"):
+        yield source, format or "jsonl"
+        return
+
+    if type(source) is not Path:
+        source = Path(source)
+
+    with open(source, "rb") as fin:
+        compressed = fin.read(2) == b"\x1f\x8b"
+
+    if compressed:
+        stream = gzip.open(source, "rt", encoding="utf-8")
+    else:
+        stream = open(source, encoding="utf-8")
+
+    with stream:
+        yield stream, format or _get_format(source)
+
+
+def _iter_jsonl(stream: IO) -> Iterator[Tuple[int, Any, Callable[[Any], Any]]]:
+    loads = get_backend("json").loads
+    for line, text in enumerate(stream, 1):
+        if text.strip():
+            yield line, text, loads
+
+
+def _iter_json(
+    stream: IO, buffer_size: int = BUFFER_SIZE, max_record: int = MAX_RECORD
+) -> Iterator[Tuple[int, Any, Callable[[Any], Any]]]:
+    decoder = json.JSONDecoder()
+    loads = get_backend("json").loads
+    buffer, pos, line, eof = "", 0, 1, False
+    separators = WHITESPACE
+    first = True
+
+    def refill() -> int:
+        nonlocal buffer, pos, eof
+        chunk = stream.read(buffer_size)
+        if not chunk:
+            eof = True
+            return 0
+
+        shift = pos
+        buffer, pos = buffer[pos:] + chunk, 0
+        return shift
+
+    while True:
+        while True:
+            while pos < len(buffer) and buffer[pos] in separators:
+                if buffer[pos] == "\n":
+                    line += 1
+                pos += 1
+
+            if pos < len(buffer) or eof:
+                break
+
+            refill()
+
+        if pos >= len(buffer):
+            return
+
+        if first:
+            first = False
+            if buffer[pos] == "[":
+                separators = WHITESPACE + ",]"
+                pos += 1
+                continue
+
+        try:
+            data, end = decoder.raw_decode(buffer, pos)
+            if end < len(buffer) or eof:
+                yield line, data, _identity
+                line += buffer.count("\n", pos, end)
+                pos = end
+                continue
+        except ValueError:
+            pass
+
+        start_line = line
+        scanner = _Scanner(buffer[pos])
+        dropped = 0
+        while True:
+            end = scanner.scan(buffer, pos)
+            if end is not None or eof:
+                break
+
+            if dropped + len(buffer) - pos > max_record:
+                dropped += scanner.offset - pos
+                line += buffer.count("\n", pos, scanner.offset)
+                pos = scanner.offset
+
+            scanner.offset -= refill()
+
+        if end is None:
+            end = len(buffer)
+
+        if dropped:
+            yield start_line, None, partial(_reject, max_record)
+        else:
+            yield start_line, buffer[pos:end], loads
+
+        line += buffer.count("\n", pos, end)
+        pos = end
+
+
+def _reject(max_record: int, raw: Any) -> Any:
+    raise ValueError(f"Record exceeds {max_record} characters")
+
+
+class _Scanner:
+    def __init__(self, char: str):
+        self.offset = None
+        self.closers = []
+        self.in_string = False
+        self.scalar = char not in '[{"'
+
+    def scan(self, buffer: str, start: int) -> Optional[int]:
+        pos = start if self.offset is None else self.offset
+
+        if self.scalar:
+            match = SCALAR_END.search(buffer, max(pos, start + 1))
+            if match is not None:
+                return match.start()
+
+            self.offset = len(buffer)
+            return None
+
+        while True:
+            if self.in_string:
+                match = STRING.search(buffer, pos)
+                if match is None:
+                    self.offset = len(buffer)
+                    return None
+
+                if match.group() == "\\":
+                    if match.end() >= len(buffer):
+                        self.offset = match.start()
+                        return None
+
+                    pos = match.end() + 1
+                    continue
+
+                self.in_string = False
+                pos = match.end()
+                if not self.closers:
+                    return pos
+
+                continue
+
+            match = STRUCTURE.search(buffer, pos)
+            if match is None:
+                self.offset = len(buffer)
+                return None
+
+            char = match.group()
+            pos = match.end()
+            if char == '"':
+                self.in_string = True
+            elif char == "[":
+                self.closers.append("]")
+            elif char == "{":
+                self.closers.append("}")
+            elif char not in self.closers:
+                self.closers.clear()
+                return match.start()
+            else:
+                while self.closers.pop() != char:
+                    pass
+
+                if not self.closers:
+                    return pos
+
+
+def _iter_yaml(stream: IO) -> Iterator[Tuple[int, Any, Callable[[Any], Any]]]:
+    loader = YamlLoader(stream)
+    line = 1
+    try:
+        while True:
+            try:
+                if not loader.check_node():
+                    return
+
+                node = loader.get_node()
+                line = node.start_mark.line + 1
+                data = loader.construct_document(node)
+            except yaml.YAMLError as e:
+                mark = getattr(e, "problem_mark", None)
+                yield line if mark is None else mark.line + 1, e, _raise
+                return
+
+            yield line, data, _identity
+    finally:
+        loader.dispose()
+
+
+def _raise(error: Exception) -> Any:
+    raise error
+
+
+READERS = {"jsonl": _iter_jsonl, "json": _iter_json, "yaml": _iter_yaml}
+
+
+def _iter_raw(
+    source: Union[str, Path, IO], format: str = None
+) -> Iterator[Tuple[int, int, Any, Callable[[Any], Any]]]:
+    with _open(source, format=format) as (stream, format):
+        reader = READERS.get(format)
+        if reader is None:
+            raise Exception(f"file format {format} is not supported")
+
+        for index, (line, raw, decode) in enumerate(reader(stream)):
+            yield index, line, raw, decode
+
+
+def _handle_error(error: RecordError, errors: str, logger: Optional[logging.Logger]):
+    if errors == "raise":
+        raise error from error.error if isinstance(error.error, Exception) else None
+
+    if logger:
+        logger.error(error)
+
+
+def load_stream(
+    source: Union[str, Path, IO],
+    format: str = None,
+    errors: str = "raise",
+    logger: Optional[logging.Logger] = None,
+) -> Iterator[Any]:
+    for index, line, raw, decode in _iter_raw(source, format=format):
+        try:
+            data = decode(raw)
+        except Exception as e:
+            _handle_error(RecordError(index, line, e), errors, logger)
+            continue
+
+        yield data
+
+
+def _asclass_chunk(
+    cls: Type[Dataclass],
+    parser: Parser,
+    records: List[Tuple[int, int, Any, Callable[[Any], Any]]],
+) -> List[Tuple[int, int, Any, Optional[Exception]]]:
+    plan = get_class_plan(cls, parser)
+
+    results = []
+    for index, line, raw, decode in records:
+        try:
+            results.append(
+                (index, line, build_class(cls, plan, decode(raw) or {}), None)
+            )
+        except Exception as e:
+            results.append((index, line, None, e))
+
+    return results
+
+
+def asclass_stream(
+    cls: Type[Dataclass],
+    source: Union[str, Path, IO],
+    format: str = None,
+    parser: Parser = ClassParser(),
+    errors: str = "raise",
+    logger: Optional[logging.Logger] = None,
+    chunksize: int = None,
+    executor: Executor = None,
+) -> Iterator[Dataclass]:
+    records = _iter_raw(source, format=format)
+    convert = partial(_asclass_chunk, cls, parser)
+
+    if executor is not None:
+        results = map_chunks(convert, records, executor, chunksize=chunksize)
+    else:
+        results = (
+            result
+            for chunk in chunked(records, chunksize or 1)
+            for result in convert(chunk)
+        )
+
+    for index, line, obj, error in results:
+        if error is not None:
+            _handle_error(RecordError(index, line, error), errors, logger)
+            continue
+
+        yield obj
+
+
+class _Writer:
+    def __init__(self, stream: IO, buffer_size: int = BUFFER_SIZE):
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self.parts = []
+        self.size = 0
+
+    def write(self, text: str):
+        self.parts.append(text)
+        self.size += len(text)
+        if self.size >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self.parts:
+            self.stream.write("".join(self.parts))
+            self.parts = []
+            self.size = 0
+
+
+@contextmanager
+def _open_write(target: Union[str, Path, IO], format: str = None):
+    if hasattr(target, "write"):
+        yield target, format or "jsonl"
+        return
+
+    if hasattr(target, "makefile"):
+        with target.makefile("w", encoding="utf-8") as stream:
+            yield stream, format or "jsonl"
+        return
+
+    if type(target) is not Path:
+        target = Path(target)
+
+    format = format or _get_format(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+
+    if target.suffix.lower() == ".gz":
+        stream = gzip.open(target, "wt", encoding="utf-8")
+    else:
+        stream = open(target, "w", encoding="utf-8")
+
+    with stream:
+        yield stream, format
+
+
+def _iter_fields(
+    obj: Dataclass, by_alias: bool, parser: Parser
+) -> Iterator[Tuple[str, Any]]:
+    for key, name, parse_field in get_instance_plan(obj, by_alias, parser):
+        val = parse_field(getattr(obj, key))
+        if val is not Ellipsis:
+            yield name, val
+
+
+def _encode_float(val: float) -> str:
+    if val != val:
+        return "NaN"
+
+    if val == float("inf"):
+        return "Infinity"
+
+    if val == -float("inf"):
+        return "-Infinity"
+
+    return float.__repr__(val)
+
+
+def _encode_key(key: Any) -> str:
+    if isinstance(key, str):
+        return encode_basestring_ascii(key)
+
+    if key is True:
+        return '"true"'
+
+    if key is False:
+        return '"false"'
+
+    if key is None:
+        return '"null"'
+
+    if isinstance(key, int):
+        return '"' + int.__repr__(key) + '"'
+
+    if isinstance(key, float):
+        return '"' + _encode_float(key) + '"'
+
+    raise TypeError(
+        f"keys must be str, int, float, bool or None, not {type(key).__name__}"
+    )
+
+
+class JsonEncoder:
+    def __init__(self, write: Callable[[str], None], by_alias: bool, parser: Parser):
+        self.write = write
+        self.by_alias = by_alias
+        self.parser = parser
+
+    def encode(self, val: Any, by_alias: bool = None):
+        write = self.write
+        if by_alias is None:
+            by_alias = self.by_alias
+
+        if isinstance(val, str):
+            write(encode_basestring_ascii(val))
+        elif val is None:
+            write("null")
+        elif val is True:
+            write("true")
+        elif val is False:
+            write("false")
+        elif isinstance(val, int):
+            write(int.__repr__(val))
+        elif isinstance(val, float):
+            write(_encode_float(val))
+        elif isinstance(val, Dataclass):
+            write("{")
+            first = True
+            for name, field_val in _iter_fields(val, by_alias, self.parser):
+                if not first:
+                    write(", ")
+                first = False
+                write(encode_basestring_ascii(name))
+                write(": ")
+                self.encode(field_val, by_alias=by_alias)
+            write("}")
+        elif isinstance(val, (list, tuple)):
+            write("[")
+            first = True
+            for elem in val:
+                if not first:
+                    write(", ")
+                first = False
+                self.encode(elem, by_alias=by_alias)
+            write("]")
+        elif isinstance(val, dict):
+            write("{")
+            first = True
+            for key, elem in val.items():
+                if not first:
+                    write(", ")
+                first = False
+                write(_encode_key(key))
+                write(": ")
+                self.encode(elem, by_alias=True)
+            write("}")
+        else:
+            raise TypeError(
+                f"Object of type {type(val).__name__} is not JSON serializable"
+            )
+
+
+MAP_TAG = "tag:yaml.org,2002:map"
+SEQ_TAG = "tag:yaml.org,2002:seq"
+TUPLE_TAG = "tag:yaml.org,2002:python/tuple"
+
+
+class YamlEncoder:
+    def __init__(self, stream: IO, by_alias: bool, parser: Parser):
+        self.dumper = YamlDumper(
+            stream, default_flow_style=False, indent=2, allow_unicode=True
+        )
+        self.by_alias = by_alias
+        self.parser = parser
+
+    def open(self):
+        self.dumper.emit(yaml.StreamStartEvent())
+
+    def close(self):
+        self.dumper.emit(yaml.StreamEndEvent())
+        self.dumper.dispose()
+
+    def document(self, val: Any):
+        self.dumper.emit(yaml.DocumentStartEvent(explicit=False))
+        self.encode(val)
+        self.dumper.emit(yaml.DocumentEndEvent(explicit=False))
+
+    def encode(self, val: Any, by_alias: bool = None):
+        emit = self.dumper.emit
+        if by_alias is None:
+            by_alias = self.by_alias
+
+        if isinstance(val, Dataclass):
+            items = sorted(_iter_fields(val, by_alias, self.parser), key=itemgetter(0))
+            emit(yaml.MappingStartEvent(None, MAP_TAG, True, flow_style=False))
+            for name, field_val in items:
+                self.encode(name)
+                self.encode(field_val, by_alias=by_alias)
+            emit(yaml.MappingEndEvent())
+        elif type(val) is list or type(val) is tuple:
+            tag, implicit = (SEQ_TAG, True) if type(val) is list else (TUPLE_TAG, False)
+            emit(yaml.SequenceStartEvent(None, tag, implicit, flow_style=False))
+            for elem in val:
+                self.encode(elem, by_alias=by_alias)
+            emit(yaml.SequenceEndEvent())
+        elif type(val) is dict:
+            keys = list(val)
+            try:
+                keys = sorted(keys)
+            except TypeError:
+                pass
+
+            emit(yaml.MappingStartEvent(None, MAP_TAG, True, flow_style=False))
+            for key in keys:
+                self.encode(key)
+                self.encode(val[key], by_alias=True)
+            emit(yaml.MappingEndEvent())
+        else:
+            dumper = self.dumper
+            node = dumper.represent_data(val)
+            dumper.represented_objects = {}
+            dumper.object_keeper = []
+            dumper.alias_key = None
+            self.encode_node(node)
+
+    def encode_node(self, node: yaml.Node):
+        dumper = self.dumper
+        if isinstance(node, yaml.ScalarNode):
+            implicit = (
+                node.tag == dumper.resolve(yaml.ScalarNode, node.value, (True, False)),
+                node.tag == dumper.resolve(yaml.ScalarNode, node.value, (False, True)),
+            )
+            dumper.emit(
+                yaml.ScalarEvent(None, node.tag, implicit, node.value, style=node.style)
+            )
+        elif isinstance(node, yaml.SequenceNode):
+            implicit = node.tag == dumper.resolve(yaml.SequenceNode, node.value, True)
+            dumper.emit(
+                yaml.SequenceStartEvent(
+                    None, node.tag, implicit, flow_style=node.flow_style
+                )
+            )
+            for item in node.value:
+                self.encode_node(item)
+            dumper.emit(yaml.SequenceEndEvent())
+        else:
+            implicit = node.tag == dumper.resolve(yaml.MappingNode, node.value, True)
+            dumper.emit(
+                yaml.MappingStartEvent(
+                    None, node.tag, implicit, flow_style=node.flow_style
+                )
+            )
+            for key, item in node.value:
+                self.encode_node(key)
+                self.encode_node(item)
+            dumper.emit(yaml.MappingEndEvent())
+
+
+def dump_stream(
+    objs: Union[Dataclass, Iterable[Dataclass]],
+    target: Union[str, Path, IO],
+    format: str = None,
+    by_alias: bool = True,
+    parser: Parser = DictParser(),
+    buffer_size: int = BUFFER_SIZE,
+):
+    single = isinstance(objs, (Dataclass, Mapping))
+
+    with _open_write(target, format=format) as (stream, format):
+        writer = _Writer(stream, buffer_size=buffer_size)
+
+        if format == "yaml":
+            encoder = YamlEncoder(writer, by_alias, parser)
+            encoder.open()
+            for obj in [objs] if single else objs:
+                encoder.document(obj)
+            encoder.close()
+
+        elif format == "json":
+            encoder = JsonEncoder(writer.write, by_alias, parser)
+            if single:
+                encoder.encode(objs)
+            else:
+                writer.write("[")
+                for idx, obj in enumerate(objs):
+                    if idx:
+                        writer.write(", ")
+                    encoder.encode(obj)
+                writer.write("]")
+
+        elif format == "jsonl":
+            encoder = JsonEncoder(writer.write, by_alias, parser)
+            for obj in [objs] if single else objs:
+                encoder.encode(obj)
+                writer.write("\n")
+
+        else:
+            raise Exception(f"file format {format} is not supported")
+
+        writer.flush()
@@ -17,6 +17,12 @@ else:
     setattr(Generic, "__args__", (Generic,))
 
 
+try:
+    from typing import Literal
+except ImportError:
+    Literal = None
+
+
 if sys.version_info > (3, 8):
     from typing import get_args, get_origin
 
@@ -1,18 +1,37 @@
+import collections.abc
 import inspect
-from collections import OrderedDict
+import os
+import random
+import threading
+import time
 
 # from inspect import Parameter
-from functools import lru_cache, wraps
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import Executor
+from functools import lru_cache, partial, wraps
+from itertools import islice, repeat
 from typing import *
+from weakref import ref
 
-from .dataclass import Dataclass
+from .dataclass import Dataclass, get_options
 from .field import Field, get_fields_info
-from .types import Generic, get_args, get_origin
+from .types import Generic, Literal, get_args, get_origin
 
-__all__ = ["validate", "type_checking"]
+__all__ = [
+    "Strategy",
+    "ValidationCache",
+    "ValidationResult",
+    "validate",
+    "type_checking",
+    "compile_validator",
+    "set_type_checking",
+    "validation_cache",
+]
 
 
 validators = {}
+compilers = {}
 
 
 def validator(*types: Type[Generic], func: Callable = None):
@@ -23,6 +42,27 @@ def validator(*types: Type[Generic], func: Callable = None):
                 origin = _type
 
             validators[origin] = func
+            compilers.pop(origin, None)
+
+        _compile_validator.cache_clear()
+        return func
+
+    if func is not None:
+        return decorator(func)
+
+    return decorator
+
+
+def compiler(*types: Type[Generic], func: Callable = None):
+    def decorator(func: Callable):
+        for _type in types:
+            origin = get_origin(_type)
+            if origin is None:
+                origin = _type
+
+            compilers[origin] = func
+
+        _compile_validator.cache_clear()
         return func
 
     if func is not None:
@@ -31,21 +71,323 @@ def validator(*types: Type[Generic], func: Callable = None):
     return decorator
 
 
-def validate(G: Union[Generic, Type], obj: Any, **kwargs):
-    if isinstance(G, get_args(Generic)):
-        origin = get_origin(G) if G is not Any else Any
+def validate(
+    G: Union[Generic, Type],
+    obj: Any,
+    cache: Union[bool, "ValidationCache"] = False,
+    executor: Executor = None,
+    chunksize: int = None,
+    **kwargs,
+):
+    if executor is not None:
+        from .batch import validate_parallel
+
+        return validate_parallel(G, obj, executor, chunksize=chunksize, **kwargs)
+
+    if cache:
+        cache = validation_cache if cache is True else cache
+        return cache.validate(G, obj, **kwargs)
+
+    strategy = kwargs.get("strategy")
+    if strategy is None:
+        return compile_validator(G, **kwargs)(obj)
+
+    run = _Run(strategy)
+    with _running(run):
+        valid = compile_validator(G, **kwargs)(obj)
+
+    return ValidationResult(bool(valid), strategy, run.checked, run.skipped)
+
+
+SCALARS = {str, bytes, int, float, bool, complex, type(None)}
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ValidationCache:
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.entries: "OrderedDict[Any, Tuple[bool, Any]]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    def validate(self, G: Union[Generic, Type], obj: Any, **kwargs) -> bool:
+        dtype = type(obj)
+        if dtype in SCALARS:
+            token = (dtype, obj)
+        elif dtype in (tuple, frozenset) or (
+            isinstance(obj, Dataclass) and get_options(dtype).get("frozen")
+        ):
+            token = id(obj)
+        else:
+            return validate(G, obj, **kwargs)
+
+        if "strategy" in kwargs:
+            return validate(G, obj, **kwargs)
+
+        options = tuple(sorted(kwargs.items())) if kwargs else ()
+        key = (G, id(G), options, token)
+        try:
+            with self.lock:
+                entry = self.entries.get(key)
+                if entry is not None:
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+        except TypeError:
+            return validate(G, obj, **kwargs)
+
+        if type(token) is int:
+            try:
+                hash(obj)
+            except TypeError:
+                return validate(G, obj, **kwargs)
+
+        valid = validate(G, obj, **kwargs)
+        if isinstance(obj, Dataclass):
+            holder = ref(obj, partial(self._discard, key))
+        else:
+            holder = obj
+
+        with self.lock:
+            self.misses += 1
+            self.entries[key] = (valid, holder)
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+        return valid
+
+    def _discard(self, key: Any, holder: Any):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[1] is holder:
+                del self.entries[key]
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self.entries))
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+validation_cache = ValidationCache()
+
+
+def compile_validator(G: Union[Generic, Type], **kwargs) -> Callable[[Any], bool]:
+    options = tuple(sorted(kwargs.items())) if kwargs else ()
+    try:
+        return _compile_validator(G, options)
+    except TypeError:
+        return _build_validator(G, **kwargs)
+
+
+@lru_cache(maxsize=None)
+def _compile_validator(G: Union[Generic, Type], options: Tuple[Tuple[str, Any], ...]):
+    return _build_validator(G, **dict(options))
+
+
+def _build_validator(G: Union[Generic, Type], **kwargs) -> Callable[[Any], bool]:
+    if G is Any:
+        return _accept
+
+    if isinstance(G, get_args(Generic)) or get_origin(G) is not None:
+        origin = get_origin(G)
+        if origin is None:
+            origin = G
+
+        if origin in compilers:
+            return compilers[origin](G, **kwargs)
+
         assert origin in validators, f"Validator not found"
         validator = validators[origin]
-        return validator(G, obj)
+        return lambda obj: validator(G, obj, **kwargs)
+
+    if type(G) is not type and type(G) in compilers:
+        return compilers[type(G)](G, **kwargs)
+
+    if G in compilers:
+        return compilers[G](G, **kwargs)
+
+    if isinstance(G, type) and issubclass(G, Dataclass):
+        if Dataclass in compilers:
+            return compilers[Dataclass](G, **kwargs)
 
-    if issubclass(G, Dataclass):
         validator = validators[Dataclass]
-        return validator(G, obj, **kwargs)
+        return lambda obj: validator(G, obj, **kwargs)
+
+    return lambda obj: isinstance(obj, G)
+
+
+def _accept(obj: Any) -> bool:
+    return True
+
+
+def _get_plain_type(G: Any) -> Optional[type]:
+    if G is Any or not isinstance(G, type):
+        return None
+
+    if isinstance(G, get_args(Generic)) or get_origin(G) is not None:
+        return None
+
+    if issubclass(G, Dataclass):
+        return None
+
+    return G
+
+
+def _compile_all(G: Union[Generic, Type], **kwargs) -> Callable[[Iterable], bool]:
+    if G is Any:
+        return _accept
+
+    strategy = kwargs.get("strategy")
+    dtype = _get_plain_type(G)
+    if dtype is not None:
+        check_all = lambda elems: all(map(isinstance, elems, repeat(dtype)))
+    else:
+        check = compile_validator(G, **kwargs)
+        check_all = lambda elems: all(map(check, elems))
+
+    if strategy is None or strategy.mode == "full":
+        return check_all
+
+    return lambda elems: check_all(_select(strategy, elems))
+
+
+class Strategy(NamedTuple):
+    mode: str = "full"
+    size: int = None
+    budget: float = None
+    seed: int = None
+
+    @classmethod
+    def full(cls) -> "Strategy":
+        return cls()
+
+    @classmethod
+    def first(cls, size: int) -> "Strategy":
+        return cls("first", size=size)
 
-    return isinstance(obj, G)
+    @classmethod
+    def sample(cls, size: int, seed: int = None) -> "Strategy":
+        return cls("sample", size=size, seed=seed)
 
+    @classmethod
+    def within(cls, budget: float) -> "Strategy":
+        return cls("budget", budget=budget)
 
-@validator(List, Set, Sequence)
+    def __str__(self) -> str:
+        if self.mode == "budget":
+            return f"budget-{self.budget}s"
+
+        if self.size is not None:
+            return f"{self.mode}-{self.size}"
+
+        return self.mode
+
+
+class ValidationResult(NamedTuple):
+    valid: bool
+    strategy: Strategy
+    checked: int = 0
+    skipped: int = 0
+
+    @property
+    def complete(self) -> bool:
+        return self.skipped == 0
+
+    def __bool__(self) -> bool:
+        return self.valid
+
+
+class _Run:
+    def __init__(self, strategy: Strategy):
+        self.strategy = strategy
+        self.deadline = None
+        if strategy.budget is not None:
+            self.deadline = time.perf_counter() + strategy.budget
+
+        self.random = random.Random(strategy.seed)
+        self.checked = 0
+        self.skipped = 0
+
+
+_runs = threading.local()
+
+BUDGET_STRIDE = 256
+
+
+def _get_run(strategy: Strategy) -> _Run:
+    stack = getattr(_runs, "stack", None)
+    if stack and stack[-1].strategy == strategy:
+        return stack[-1]
+
+    return _Run(strategy)
+
+
+@contextmanager
+def _running(run: _Run) -> Iterator[_Run]:
+    stack = getattr(_runs, "stack", None)
+    if stack is None:
+        stack = _runs.stack = []
+
+    stack.append(run)
+    try:
+        yield run
+    finally:
+        stack.pop()
+
+
+def _select(strategy: Strategy, elems: Iterable) -> Iterable:
+    run = _get_run(strategy)
+    size = len(elems) if isinstance(elems, Sized) else None
+
+    if strategy.mode == "budget":
+        return _until(run, elems, size)
+
+    if size is None:
+        run.checked += strategy.size
+        return islice(elems, strategy.size)
+
+    if size <= strategy.size:
+        run.checked += size
+        return elems
+
+    run.checked += strategy.size
+    run.skipped += size - strategy.size
+    if strategy.mode == "first":
+        return islice(elems, strategy.size)
+
+    if not isinstance(elems, collections.abc.Sequence):
+        elems = list(elems)
+
+    indices = sorted(run.random.sample(range(size), strategy.size))
+    return map(elems.__getitem__, indices)
+
+
+def _until(run: _Run, elems: Iterable, size: Optional[int]) -> Iterator:
+    count = 0
+    for elem in elems:
+        if count % BUDGET_STRIDE == 0 and count and time.perf_counter() > run.deadline:
+            break
+
+        count += 1
+        yield elem
+
+    run.checked += count
+    if size is not None:
+        run.skipped += size - count
+
+
+@validator(List, Set, FrozenSet, Sequence)
 def validate_sequence(G: Generic, obj: Any, **kwargs):
     arg, *_ = get_args(G)
     origin = get_origin(G)
@@ -97,6 +439,14 @@ def validate_union(G: Generic, obj: Any, **kwargs):
     return any(validate(arg, obj, **kwargs) for arg in args)
 
 
+def validate_literal(G: Generic, obj: Any, **kwargs):
+    return obj in get_args(G)
+
+
+if Literal is not None:
+    validator(Literal, func=validate_literal)
+
+
 @validator(type(None))
 def validate_none(G: Generic, obj: Any, **kwargs):
     return obj is None
@@ -155,50 +505,163 @@ def validate_iterable(G: Generic, obj: Any, **kwargs):
 def validate_dataclass(
     G: Dataclass, obj: Any, as_schema: bool = False, strict: bool = False, **kwargs
 ):
-    from .parser import asclass
+    return compile_validator(G, as_schema=as_schema, strict=strict, **kwargs)(obj)
 
-    if not as_schema:
-        return isinstance(obj, G)
 
-    if not isinstance(obj, Mapping):
-        return False
+@compiler(List, Set, FrozenSet, Sequence)
+def compile_sequence(G: Generic, **kwargs):
+    arg, *_ = get_args(G) or (Any,)
+    origin = get_origin(G)
+    check_all = _compile_all(arg, **kwargs)
+
+    def check(obj: Any) -> bool:
+        return isinstance(obj, origin) and check_all(obj)
+
+    return check
+
+
+@compiler(Tuple)
+def compile_tuple(G: Generic, **kwargs):
+    args = get_args(G)
+
+    if not args or (len(args) == 2 and args[1] is Ellipsis):
+        arg, *_ = args or (Any,)
+        check_all = _compile_all(arg, **kwargs)
+
+        def check(obj: Any) -> bool:
+            return isinstance(obj, tuple) and check_all(obj)
 
-    fields = get_fields_info(G)
-    fields = {
-        field.alias if field.alias is not None else key: field
-        for key, field in fields.items()
-    }
+        return check
 
-    for key, val in obj.items():
-        if key not in fields:
-            if strict:
+    if Ellipsis in args:
+        return lambda obj: validate_tuple(G, obj, **kwargs)
+
+    checks = tuple(compile_validator(arg, **kwargs) for arg in args)
+    size = len(checks)
+
+    def check(obj: Any) -> bool:
+        if not isinstance(obj, tuple) or len(obj) > size:
+            return False
+
+        for check_elem, elem in zip(checks, obj):
+            if not check_elem(elem):
                 return False
-            continue
 
-        field: Field = fields.pop(key)
-        if not validate(
-            field.annotation, val, as_schema=as_schema, strict=strict, **kwargs
-        ):
+        return True
+
+    return check
+
+
+@compiler(Dict)
+def compile_dict(G: Generic, **kwargs):
+    key_type, val_type = get_args(G) or (Any, Any)
+    check_keys = _compile_all(key_type, **kwargs)
+    check_vals = _compile_all(val_type, **kwargs)
+
+    def check(obj: Any) -> bool:
+        return (
+            isinstance(obj, dict)
+            and check_keys(obj.keys())
+            and check_vals(obj.values())
+        )
+
+    return check
+
+
+@compiler(Union)
+def compile_union(G: Generic, **kwargs):
+    args = get_args(G)
+    if Any in args:
+        return _accept
+
+    dtypes = tuple(arg for arg in args if _get_plain_type(arg) is not None)
+    checks = tuple(
+        compile_validator(arg, **kwargs) for arg in args if _get_plain_type(arg) is None
+    )
+
+    def check(obj: Any) -> bool:
+        if isinstance(obj, dtypes):
+            return True
+
+        for check_arg in checks:
+            if check_arg(obj):
+                return True
+
+        return False
+
+    return check
+
+
+@compiler(Dataclass)
+def compile_dataclass(
+    G: Dataclass, as_schema: bool = False, strict: bool = False, **kwargs
+):
+    if not as_schema:
+        return lambda obj: isinstance(obj, G)
+
+    plan = {}
+    required = set()
+    for key, field in get_fields_info(G).items():
+        name = field.alias if field.alias is not None else key
+        options = kwargs
+        if field.strategy is not None:
+            options = {**kwargs, "strategy": field.strategy}
+
+        check_field = compile_validator(
+            field.annotation, as_schema=as_schema, strict=strict, **options
+        )
+        is_dataclass = isinstance(field.annotation, type) and issubclass(
+            field.annotation, Dataclass
+        )
+        plan[name] = (field, check_field, is_dataclass)
+        if field.default is Ellipsis:
+            required.add(name)
+
+    def check(obj: Any) -> bool:
+        if not isinstance(obj, Mapping):
             return False
 
-        if field.validators:
-            if issubclass(field.annotation, Dataclass):
-                try:
-                    val = asclass(field.annotation, val)
-                except AssertionError:
+        missing = len(required)
+        for key, val in obj.items():
+            entry = plan.get(key)
+            if entry is None:
+                if strict:
                     return False
+                continue
 
-            for validator in field.validators.values():
-                if validator.static:
-                    valid = validator(val)
-                else:
-                    valid = validator(obj, val)
+            field, check_field, is_dataclass = entry
+            if not check_field(val):
+                return False
 
-                if not valid:
-                    return False
+            if field.validators and not _run_field_validators(
+                field, obj, val, is_dataclass
+            ):
+                return False
 
-    for key, field in fields.items():
-        if field.default == Ellipsis:
+            if key in required:
+                missing -= 1
+
+        return missing == 0
+
+    return check
+
+
+def _run_field_validators(field: Field, obj: Any, val: Any, is_dataclass: bool):
+    from .parser import asclass
+
+    if is_dataclass:
+        try:
+            val = asclass(field.annotation, val)
+        except AssertionError:
+            return False
+
+    for validator in field.validators.values():
+        if validator.static:
+            valid = validator(val)
+        else:
+            valid = validator(obj, val)
+
+        if not valid:
             return False
 
     return True
@@ -215,104 +678,136 @@ def validate_dataclass(
 
 
 @lru_cache(maxsize=None)
-def get_func_validator(func: Callable):
+def get_func_validator(func: Callable, strategy: Strategy = None):
+    try:
+        hints = _get_type_hints(func)
+    except NameError:
+        return _defer(partial(_compile_func_validator, func, strategy))
+
+    return _compile_func_validator(func, strategy, hints)
+
+
+def _compile_func_validator(
+    func: Callable, strategy: Strategy = None, hints: Dict[str, Any] = None
+):
+    options = {} if strategy is None else {"strategy": strategy}
     signature = inspect.signature(func)
-    parameters = signature.parameters
-    parameters = OrderedDict(parameters.items())
+    if hints is None:
+        hints = _get_type_hints(func)
 
     has_var_args = False
-    for param in parameters.values():
+    has_var_kwargs = False
+    num_positional_only = 0
+    positional_params = []
+    keyword_params = {}
+    required_params = []
+
+    for param in signature.parameters.values():
         if param.kind == param.VAR_POSITIONAL:
             has_var_args = True
-            break
-
-    if has_var_args:
-        parameters.pop(param.name)
+            continue
 
-    has_var_kwargs = False
-    for param in parameters.values():
         if param.kind == param.VAR_KEYWORD:
             has_var_kwargs = True
-            break
+            continue
 
-    if has_var_kwargs:
-        parameters.pop(param.name)
+        annotation = hints.get(param.name, param.annotation)
+        check = None
+        if annotation not in (inspect._empty, Any):
+            check = _compile_deferred(annotation, **options)
 
-    positional_only_params = [
-        param for param in parameters.values() if param.kind == param.POSITIONAL_ONLY
-    ]
+        default = param.default
+        message = (
+            f"Wrong type for {param.name}. Expect type {_get_type_name(annotation)}"
+        )
+        entry = (check, default, message)
 
-    positional_or_keyword_params = [
-        param
-        for param in parameters.values()
-        if param.kind == param.POSITIONAL_OR_KEYWORD
-    ]
+        if param.kind == param.POSITIONAL_ONLY:
+            num_positional_only += 1
+            positional_params.append(entry)
+            continue
 
-    def validator(*args, **kwargs) -> Union[bool, str]:
-        l_parameters = parameters.copy()
+        if param.kind == param.POSITIONAL_OR_KEYWORD:
+            index = len(positional_params)
+            positional_params.append(entry)
+        else:
+            index = None
 
-        if len(positional_only_params) > len(args):
-            return False, "Missing positional only params"
+        keyword_params[param.name] = (index,) + entry
+        if default is param.empty:
+            required_params.append((index, param.name))
 
-        for arg, param in zip(args, positional_only_params):
-            l_parameters.pop(param.name)
+    num_positional = len(positional_params)
 
-            if param.annotation in (inspect._empty, Any):
-                continue
+    def validator(*args, **kwargs) -> Union[bool, str]:
+        num_args = len(args)
+        if num_args < num_positional_only:
+            return False, "Missing positional only params"
 
-            if not validate(param.annotation, arg):
-                return (
-                    False,
-                    f"Wrong type for {param.name}. Expect type {param.annotation.__name__}",
-                )
+        if num_args > num_positional and not has_var_args:
+            return False, "Too many arguments"
 
-        args = args[len(positional_only_params) :]
+        for arg, (check, default, message) in zip(args, positional_params):
+            if check is None or arg is default:
+                continue
 
-        if len(args) > len(positional_or_keyword_params):
-            if not has_var_args:
-                return False, "Too many arguments"
+            if not check(arg):
+                return False, message
 
-        for arg, param in zip(args, positional_or_keyword_params):
-            l_parameters.pop(param.name)
-            if param.annotation in (inspect._empty, Any):
+        for key, val in kwargs.items():
+            entry = keyword_params.get(key)
+            if entry is None or (entry[0] is not None and entry[0] < num_args):
+                if not has_var_kwargs:
+                    return False, f"Unknown keyword argument: {key}"
                 continue
 
-            if param.default != param.empty and arg == param.default:
+            _, check, default, message = entry
+            if check is None or val is default:
                 continue
 
-            if not validate(param.annotation, arg):
-                return (
-                    False,
-                    f"Wrong type for {param.name}. Expect type {param.annotation.__name__}",
-                )
+            if not check(val):
+                return False, message
 
-        for key in kwargs:
-            if key not in l_parameters:
-                if not has_var_kwargs:
-                    return False, f"Unknown keyword argument: {key}"
+        for index, name in required_params:
+            if (index is None or index >= num_args) and name not in kwargs:
+                return False, f"Missing value for {name}"
 
-        for key, val in kwargs.items():
-            if key in l_parameters:
-                param = l_parameters.pop(key)
-                if param.annotation in (inspect._empty, Any):
-                    continue
+        return True, ""
+
+    return validator
 
-                if param.default != param.empty and val == param.default:
-                    continue
 
-                if not validate(param.annotation, val):
-                    return (
-                        False,
-                        f"Wrong type for {param.name}. Expect type {param.annotation.__name__}",
-                    )
+def _compile_deferred(G: Any, **kwargs) -> Callable[[Any], bool]:
+    try:
+        return compile_validator(G, **kwargs)
+    except Exception:
+        return lambda obj: compile_validator(G, **kwargs)(obj)
 
-        for param in l_parameters.values():
-            if param.default == inspect._empty:
-                return False, f"Missing value for {param.name}"
 
-        return True, ""
+def _defer(build: Callable[[], Callable]) -> Callable:
+    compiled = None
 
-    return validator
+    def deferred(*args, **kwargs):
+        nonlocal compiled
+        if compiled is None:
+            compiled = build()
+
+        return compiled(*args, **kwargs)
+
+    return deferred
+
+
+def _get_type_hints(func: Callable) -> Dict[str, Any]:
+    try:
+        return get_type_hints(func)
+    except NameError:
+        raise
+    except Exception:
+        return {}
+
+
+def _get_type_name(annotation: Any) -> str:
+    return getattr(annotation, "__name__", None) or str(annotation)
 
 
 def validate_parameters(func: Callable, *args, **kwargs) -> Union[bool, str]:
@@ -320,25 +815,339 @@ def validate_parameters(func: Callable, *args, **kwargs) -> Union[bool, str]:
     return validator(*args, **kwargs)
 
 
+_type_checking_switches = {
+    "": os.environ.get("MOUSSE_TYPE_CHECKING", "1").lower()
+    not in ("0", "false", "no", "off")
+}
+
+
+def set_type_checking(enabled: bool, *modules: str):
+    for module in modules or ("",):
+        _type_checking_switches[module] = enabled
+
+
+def is_type_checking(module: str = None) -> bool:
+    if module:
+        parts = module.split(".")
+        for i in range(len(parts), 0, -1):
+            key = ".".join(parts[:i])
+            if key in _type_checking_switches:
+                return _type_checking_switches[key]
+
+    return _type_checking_switches.get("", True)
+
+
+class Sampler:
+    def __init__(
+        self,
+        sample: int = None,
+        budget: float = None,
+        period: float = 1.0,
+        timer: Callable[[], float] = time.perf_counter,
+    ):
+        self.sample = sample
+        self.budget = budget
+        self.period = period
+        self.timer = timer
+
+        self.calls = 0
+        self.spent = 0.0
+        self.window = timer()
+
+    def __call__(self) -> bool:
+        self.calls += 1
+        if self.sample and (self.calls - 1) % self.sample:
+            return False
+
+        if self.budget is not None:
+            now = self.timer()
+            if now - self.window >= self.period:
+                self.window = now
+                self.spent = 0.0
+
+            if self.spent >= self.budget:
+                return False
+
+        return True
+
+    def record(self, elapsed: float):
+        self.spent += elapsed
+
+
+class CheckedIterator:
+    def __init__(
+        self,
+        iterator: Iterator,
+        check: Callable[[Any], bool],
+        expected: Any,
+        sampler: Sampler = None,
+    ):
+        self.iterator = iterator
+        self.check = check
+        self.expected = expected
+        self.sampler = sampler
+
+    def __iter__(self) -> "CheckedIterator":
+        return self
+
+    def __next__(self) -> Any:
+        return self.verify(next(self.iterator))
+
+    def send(self, val: Any) -> Any:
+        return self.verify(self.iterator.send(val))
+
+    def throw(self, *args) -> Any:
+        return self.verify(self.iterator.throw(*args))
+
+    def close(self):
+        close = getattr(self.iterator, "close", None)
+        if close is not None:
+            close()
+
+    def verify(self, item: Any) -> Any:
+        sampler = self.sampler
+        if sampler is None:
+            valid = self.check(item)
+        elif sampler():
+            start = sampler.timer()
+            valid = self.check(item)
+            sampler.record(sampler.timer() - start)
+        else:
+            return item
+
+        assert (
+            valid
+        ), f"Incorrect yield type: {type(item)}. Correct yield type: {self.expected}"
+        return item
+
+
+def _relay(check: CheckedIterator) -> Generator:
+    return (yield from check)
+
+
+STREAMS = {
+    collections.abc.Iterator: False,
+    collections.abc.Iterable: False,
+    collections.abc.Generator: False,
+    collections.abc.AsyncIterator: True,
+    collections.abc.AsyncIterable: True,
+    collections.abc.AsyncGenerator: True,
+}
+
+
+def _get_stream_types(G: Any) -> Tuple[Any, Any]:
+    origin = get_origin(G)
+    if origin not in STREAMS:
+        return None, None
+
+    args = get_args(G)
+    item_type = args[0] if args else Any
+    result_type = args[2] if origin is collections.abc.Generator and args else Any
+    return item_type, result_type
+
+
+class OutputChecks(NamedTuple):
+    output_type: Any
+    item_type: Any
+    result_type: Any
+    check_return: Optional[Callable[[Any], bool]]
+    check_item: Optional[Callable[[Any], bool]]
+    check_result: Optional[Callable[[Any], bool]]
+
+
+def _compile_output_checks(
+    func: Callable, return_annotation: bool, options: Dict[str, Any]
+) -> OutputChecks:
+    output_type = _get_type_hints(func).get(
+        "return", inspect.signature(func).return_annotation
+    )
+    if not return_annotation or output_type in (inspect._empty, Any):
+        output_type = None
+
+    item_type, result_type = _get_stream_types(output_type)
+    is_stream = inspect.isgeneratorfunction(func) or inspect.isasyncgenfunction(func)
+
+    check_return = None
+    if output_type is not None and not is_stream:
+        check_return = _compile_deferred(output_type, **options)
+
+    check_item = None
+    if item_type not in (None, Any):
+        check_item = _compile_deferred(item_type, **options)
+
+    check_result = None
+    if result_type not in (None, Any):
+        check_result = _compile_deferred(result_type, **options)
+
+    return OutputChecks(
+        output_type, item_type, result_type, check_return, check_item, check_result
+    )
+
+
 def type_checking(
-    func: Callable = None, param_annotation: bool = True, return_annotation: bool = True
+    func: Callable = None,
+    param_annotation: bool = True,
+    return_annotation: bool = True,
+    sample: int = None,
+    budget: float = None,
+    enabled: bool = None,
+    strategy: Strategy = None,
+    item_sample: int = None,
+    item_budget: float = None,
 ):
     def decorator(func: Callable):
-        signature = inspect.signature(func)
+        if enabled is False or (
+            enabled is None and not is_type_checking(getattr(func, "__module__", None))
+        ):
+            return func
+
+        validator = get_func_validator(func, strategy) if param_annotation else None
+        options = {} if strategy is None else {"strategy": strategy}
+
+        try:
+            outputs = _compile_output_checks(func, return_annotation, options)
+        except NameError:
+            outputs = None
 
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            if param_annotation:
-                valid, err = validate_parameters(func, *args, **kwargs)
+        def get_outputs() -> OutputChecks:
+            nonlocal outputs
+            if outputs is None:
+                outputs = _compile_output_checks(func, return_annotation, options)
+
+            return outputs
+
+        sampler = None
+        if sample is not None or budget is not None:
+            sampler = Sampler(sample=sample, budget=budget)
+
+        def check_call(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> bool:
+            if sampler is None:
+                if validator is not None:
+                    valid, err = validator(*args, **kwargs)
+                    assert valid, err
+                return True
+
+            if not sampler():
+                return False
+
+            if validator is not None:
+                start = sampler.timer()
+                valid, err = validator(*args, **kwargs)
+                sampler.record(sampler.timer() - start)
                 assert valid, err
 
-            output = func(*args, **kwargs)
-            if return_annotation and signature.return_annotation is not inspect._empty:
-                assert validate(
-                    signature.return_annotation, output
-                ), f"Incorrect return type: {type(output)}. Correct return type: {signature.return_annotation}"
+            return True
+
+        def check_output(checks: OutputChecks, output: Any):
+            if sampler is None:
+                valid = checks.check_return(output)
+            else:
+                start = sampler.timer()
+                valid = checks.check_return(output)
+                sampler.record(sampler.timer() - start)
+
+            assert (
+                valid
+            ), f"Incorrect return type: {type(output)}. Correct return type: {checks.output_type}"
 
-            return output
+        def check_items(checks: OutputChecks, iterator: Iterator) -> CheckedIterator:
+            item_sampler = None
+            if item_sample is not None or item_budget is not None:
+                item_sampler = Sampler(sample=item_sample, budget=item_budget)
+
+            return CheckedIterator(
+                iterator, checks.check_item, checks.item_type, item_sampler
+            )
+
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                checking = check_call(args, kwargs)
+                output = await func(*args, **kwargs)
+                checks = get_outputs()
+                if checking and checks.check_return is not None:
+                    check_output(checks, output)
+
+                return output
+
+        elif inspect.isasyncgenfunction(func):
+
+            async def stream(agen: AsyncIterator, check: CheckedIterator):
+                try:
+                    item = await agen.__anext__()
+                    while True:
+                        check.verify(item)
+                        try:
+                            sent = yield item
+                        except GeneratorExit:
+                            await agen.aclose()
+                            raise
+                        except BaseException as e:
+                            item = await agen.athrow(e)
+                            continue
+
+                        if sent is None:
+                            item = await agen.__anext__()
+                        else:
+                            item = await agen.asend(sent)
+                except StopAsyncIteration:
+                    return
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                checking = check_call(args, kwargs)
+                output = func(*args, **kwargs)
+                checks = get_outputs()
+                if not checking or checks.check_item is None:
+                    return output
+
+                return stream(output, check_items(checks, None))
+
+        elif inspect.isgeneratorfunction(func):
+
+            def stream(checks: OutputChecks, check: CheckedIterator):
+                result = yield from check
+                if checks.check_result is not None:
+                    assert checks.check_result(
+                        result
+                    ), f"Incorrect return type: {type(result)}. Correct return type: {checks.result_type}"
+
+                return result
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                checking = check_call(args, kwargs)
+                output = func(*args, **kwargs)
+                checks = get_outputs()
+                if not checking or (
+                    checks.check_item is None and checks.check_result is None
+                ):
+                    return output
+
+                if checks.check_item is None:
+                    return stream(checks, CheckedIterator(output, _accept, Any))
+
+                return stream(checks, check_items(checks, output))
+
+        else:
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                checking = check_call(args, kwargs)
+                output = func(*args, **kwargs)
+                checks = get_outputs()
+                if not checking or checks.check_return is None:
+                    return output
+
+                check_output(checks, output)
+                if checks.check_item is not None and inspect.isgenerator(output):
+                    return _relay(check_items(checks, output))
+
+                return output
+
+        if sampler is not None:
+            setattr(wrapper, "sampler", sampler)
 
         return wrapper
 